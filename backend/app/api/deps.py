@@ -53,6 +53,14 @@ def _maybe_object_id(value) -> Any:
         return value
 
 
+def _object_id_or_none(value) -> Optional[ObjectId]:
+    """Parse a token claim into an ObjectId, or None if absent/invalid."""
+    try:
+        return ObjectId(str(value)) if value else None
+    except Exception:
+        return None
+
+
 async def _enforce_user_limit(user_id: str) -> None:
     """
     Per-user rate limit with suspicious activity detection.
@@ -222,7 +230,11 @@ async def get_current_user(token: str = Depends(get_access_token)) -> Dict:
     # Per-user rate limiter + suspicious detection
     await _enforce_user_limit(user_id)
 
-    return {k: payload[k] for k in required}
+    current = {k: payload[k] for k in required}
+    # Parsed once per request so services can filter/compare without re-parsing hex
+    current["cart_oid"] = _object_id_or_none(payload["cart_id"])
+    current["wishlist_oid"] = _object_id_or_none(payload["wishlist_id"])
+    return current
 
 
 # ---------------------------------------------------------------------------
@@ -12,9 +12,7 @@ Provides endpoints for:
 
 from __future__ import annotations
 from typing import Optional
-from fastapi import APIRouter, Depends, Request, Response, Cookie, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_session
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, Cookie, status
 from fastapi.security import OAuth2PasswordRequestForm
 from app.core.config import settings
 from app.api.deps import get_current_user, get_access_token, get_optional_access_token, ip_rate_limiter
@@ -41,17 +39,18 @@ router = APIRouter()
 
 
 @router.post("/register", response_model=UserOut, status_code=status.HTTP_201_CREATED, dependencies=[Depends(ip_rate_limiter)])
-async def register(payload: RegisterIn, session: AsyncSession = Depends(get_session)):
+async def register(payload: RegisterIn, background: BackgroundTasks):
     """
     Register a new user account.
 
     Args:
         payload (RegisterIn): User registration input data.
+        background (BackgroundTasks): Runs the register-log insert after the response.
 
     Returns:
         UserOut: Created user object.
     """
-    return await register_service(payload,session)
+    return await register_service(payload, background=background)
 
 
 @router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK, dependencies=[Depends(ip_rate_limiter)])
@@ -59,7 +58,7 @@ async def login(
     response: Response,
     request: Request,
     body: LoginIn,
-    session: AsyncSession = Depends(get_session)
+    background: BackgroundTasks,
 ):
     """
     Authenticate user credentials and issue access + refresh tokens.
@@ -73,11 +72,12 @@ async def login(
         request (Request): Incoming HTTP request.
         body (LoginIn | None): Login body from frontend.
         form_data (OAuth2PasswordRequestForm): Login from Swagger (username/password).
+        background (BackgroundTasks): Runs the login-log insert after the response.
 
     Returns:
         LoginResponse: Access token, user info and refresh cookie.
     """
-    return await login_service(response, request, body,session)
+    return await login_service(response, request, body, background=background)
 
 
 @router.post(
@@ -89,8 +89,8 @@ async def login(
 async def login_token(
     response: Response,
     request: Request,
+    background: BackgroundTasks,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    session: AsyncSession = Depends(get_session),
 ):
     """
     OAuth2-compatible login endpoint for Swagger & external clients.
@@ -98,7 +98,7 @@ async def login_token(
     """
     # Map form → your internal LoginIn schema
     body = LoginIn(email=form_data.username, password=form_data.password)
-    return await login_service(response, request, body, session)
+    return await login_service(response, request, body, background=background)
 
 @router.post("/refresh", response_model=TokenRotatedOut, status_code=status.HTTP_200_OK, dependencies=[Depends(ip_rate_limiter)])
 async def token_refresh(
@@ -131,10 +131,9 @@ async def token_refresh(
 async def logout(
     response: Response,
     request: Request,
+    background: BackgroundTasks,
     rt: Optional[str] = Cookie(default=None, alias=settings.REFRESH_COOKIE_NAME),
     token: Optional[str] = Depends(get_optional_access_token),
-    session: AsyncSession = Depends(get_session)
-    
 ):
     """
     Logout user by revoking access + refresh tokens and clearing cookie.
@@ -146,11 +145,12 @@ async def logout(
         request (Request)
         token (str | None): Access token sent in Authorization header (can be expired).
         rt (str | None): Refresh token from cookie.
+        background (BackgroundTasks): Runs the logout-log insert after the response.
 
     Returns:
         MessageOut: Confirmation message.
     """
-    return await logout_service(response, request, rt, token,session)
+    return await logout_service(response, request, rt, token, background=background)
 
 
 @router.post(
@@ -177,17 +177,18 @@ async def change_password(
 
 
 @router.post("/password/reset-request", response_model=MessageOut, status_code=status.HTTP_200_OK, dependencies=[Depends(ip_rate_limiter)])
-async def password_reset_request(body: ForgotPasswordRequestIn):
+async def password_reset_request(body: ForgotPasswordRequestIn, background: BackgroundTasks):
     """
     Initiate password reset flow by sending OTP/email link.
 
     Args:
         body (ForgotPasswordRequestIn): Email or username.
+        background (BackgroundTasks): Delivers the OTP email after the response.
 
     Returns:
         MessageOut: Status message.
     """
-    return await forgot_password_request_service(body)
+    return await forgot_password_request_service(body, background=background)
 
 
 @router.post("/password/reset-verify", response_model=MessageOut, status_code=status.HTTP_200_OK, dependencies=[Depends(ip_rate_limiter)])
@@ -59,6 +59,7 @@ async def list_backups(
     frequency: Optional[str] = Query(None),
     date_from: Optional[datetime] = Query(None),
     date_to: Optional[datetime] = Query(None),
+    after: Optional[str] = Query(None, description="Keyset cursor: id of the last item on the previous page"),
 ):
     return await list_backups_service(
         skip=skip,
@@ -68,6 +69,7 @@ async def list_backups(
         frequency=frequency,
         date_from=date_from,
         date_to=date_to,
+        after=after,
     )
 
 @router.get(
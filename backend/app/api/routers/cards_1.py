@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File, Form
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status, UploadFile, File, Form
 from fastapi.responses import JSONResponse
 
 from app.api.deps import require_permission, ip_rate_limiter
@@ -40,8 +40,9 @@ async def list_items(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
     sort_by_idx: bool = Query(True, description="Sort by idx asc; fallback createdAt desc"),
+    after: Optional[str] = Query(None, description="Keyset cursor: id of the last item on the previous page"),
 ):
-    return await list_items_service(skip=skip, limit=limit, sort_by_idx=sort_by_idx)
+    return await list_items_service(skip=skip, limit=limit, sort_by_idx=sort_by_idx, after=after)
 
 
 @router.get("/{item_id}", response_model=Cards1Out, dependencies=[Depends(ip_rate_limiter)])
@@ -70,5 +71,5 @@ async def update_item(
     "/{item_id}",
     dependencies=[Depends(require_permission("cards_1", "Delete"))]
 )
-async def delete_item(item_id: PyObjectId):
-    return await delete_item_service(item_id)
\ No newline at end of file
+async def delete_item(item_id: PyObjectId, background: BackgroundTasks):
+    return await delete_item_service(item_id, background)
\ No newline at end of file
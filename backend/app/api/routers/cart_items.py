@@ -50,9 +50,10 @@ async def list_items(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
     product_id: Optional[PyObjectId] = Query(None, description="Filter by product_id"),
+    after: Optional[str] = Query(None, description="Keyset cursor: id of the last item on the previous page"),
     current_user: Dict = Depends(get_current_user),
 ):
-    return await list_items_service(skip=skip, limit=limit, product_id=product_id, current_user=current_user)
+    return await list_items_service(skip=skip, limit=limit, product_id=product_id, current_user=current_user, after=after)
 
 
 # ----------------------------
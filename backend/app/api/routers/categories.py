@@ -7,18 +7,29 @@ Mounted at /categories
 from __future__ import annotations
 from typing import List, Optional, Dict, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
 
 from app.api.deps import require_permission
 from app.schemas.object_id import PyObjectId
-from app.schemas.categories import CategoriesCreate, CategoriesUpdate, CategoriesOut
+from app.schemas.categories import (
+    CategoriesCreate,
+    CategoriesUpdate,
+    CategoriesOut,
+    CategoriesBatchIds,
+    CategoriesBatchOut,
+    CategoriesBatchDeleteOut,
+)
 from app.services.categories import (
     create_item_service,
     list_items_service,
     get_item_service,
     update_item_service,
     delete_item_service,
+    bulk_get_items_service,
+    etag_matches,
+    item_etag,
+    list_items_etag,
+    bulk_delete_items_service,
 )
 
 router = APIRouter()
@@ -58,12 +69,15 @@ async def create_item(payload: CategoriesCreate):
     response_model=List[CategoriesOut],
     responses={
         200: {"description": "List of categories"},
+        304: {"description": "Not modified (If-None-Match matched)"},
         400: {"description": "Validation error"},
         403: {"description": "Forbidden"},
         500: {"description": "Server error"},
     },
 )
 async def list_items(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
     category: Optional[str] = Query(None, description="Exact match filter"),
@@ -79,22 +93,77 @@ async def list_items(
         q (str, optional): Regex fuzzy search.
 
     Returns:
-        List[CategoriesOut]: Paginated list of categories.
+        List[CategoriesOut]: Paginated list of categories, or 304 when the
+        client's ETag is still current.
     """
+    etag = await list_items_etag()
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    if etag:
+        response.headers["ETag"] = etag
     return await list_items_service(skip, limit, category, q)
 
 
+@router.post(
+    "/batch",
+    response_model=CategoriesBatchOut,
+    responses={
+        200: {"description": "Found categories plus per-id errors"},
+        400: {"description": "Validation error"},
+        500: {"description": "Server error"},
+    },
+)
+async def bulk_get_items(payload: CategoriesBatchIds):
+    """
+    Fetch several categories by ID in one request.
+
+    Args:
+        payload (CategoriesBatchIds): Up to 100 category IDs.
+
+    Returns:
+        CategoriesBatchOut: Found categories, with a per-id error for each miss.
+    """
+    return await bulk_get_items_service(payload.ids)
+
+
+@router.post(
+    "/batch/delete",
+    response_model=CategoriesBatchDeleteOut,
+    response_model_exclude_none=True,
+    dependencies=[Depends(require_permission("categories", "Delete"))],
+    responses={
+        200: {"description": "Deleted categories plus per-id errors"},
+        400: {"description": "Validation error"},
+        403: {"description": "Forbidden"},
+        500: {"description": "Server error"},
+    },
+)
+async def bulk_delete_items(payload: CategoriesBatchIds):
+    """
+    Delete several categories and their related products in one transaction.
+    Image cleanup in GridFS is best-effort, as for single deletes.
+
+    Args:
+        payload (CategoriesBatchIds): Up to 100 category IDs.
+
+    Returns:
+        CategoriesBatchDeleteOut: Deleted IDs, per-id errors, stats and optional warnings.
+    """
+    return await bulk_delete_items_service(payload.ids)
+
+
 @router.get(
     "/{item_id}",
     response_model=CategoriesOut,
     responses={
         200: {"description": "Category"},
+        304: {"description": "Not modified (If-None-Match matched)"},
         403: {"description": "Forbidden"},
         404: {"description": "Not found"},
         500: {"description": "Server error"},
     },
 )
-async def get_item(item_id: PyObjectId):
+async def get_item(item_id: PyObjectId, request: Request, response: Response):
     """
     Get a single category by ID.
 
@@ -107,7 +176,12 @@ async def get_item(item_id: PyObjectId):
     Raises:
         HTTPException: 404 if not found.
     """
-    return await get_item_service(item_id)
+    item = await get_item_service(item_id)
+    etag = item_etag(item)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return item
 
 
 @router.put(
@@ -141,21 +215,35 @@ async def update_item(item_id: PyObjectId, payload: CategoriesUpdate):
     "/{item_id}",
     dependencies=[Depends(require_permission("categories", "Delete"))],
     responses={
-        200: {"description": "Deleted"},
+        200: {"description": "Deleted (JSON, or text/event-stream progress when requested)"},
         403: {"description": "Forbidden"},
         404: {"description": "Not found"},
         500: {"description": "Server error"},
     },
 )
-async def delete_item(item_id: PyObjectId):
+async def delete_item(
+    item_id: PyObjectId,
+    request: Request,
+    background: BackgroundTasks,
+    wait_cleanup: bool = Query(False, description="Finish GridFS cleanup before replying and report warnings"),
+):
     """
     Delete a category and related products.
-    After deleting DB docs, performs a best-effort cleanup of stored images in GridFS.
+    After deleting DB docs, GridFS images are cleaned up best-effort after the
+    response is sent (or before it with `wait_cleanup=true`).
+    Clients sending `Accept: text/event-stream` get the stats as soon as the
+    cascade commits, followed by GridFS cleanup progress events.
 
     Args:
         item_id (PyObjectId): Category ID.
+        wait_cleanup (bool): Run the cleanup inline and include its warnings.
 
     Returns:
-        JSONResponse: deletion result with optional warnings.
+        ORJSONResponse: deletion result with optional warnings (or an SSE stream).
     """
-    return await delete_item_service(item_id)
\ No newline at end of file
+    stream = "text/event-stream" in request.headers.get("accept", "")
+    return await delete_item_service(
+        item_id,
+        stream=stream,
+        background=None if wait_cleanup else background,
+    )
\ No newline at end of file
@@ -22,21 +22,17 @@ router = APIRouter()
 
 
 @router.post("/", response_model=ContactUsRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(ip_rate_limiter)])
-async def create_contact(
-    payload: ContactUsCreate,
-    session: AsyncSession = Depends(get_session)
-):
+async def create_contact(payload: ContactUsCreate):
     """
     Create a new contact-us entry.
 
     Args:
         payload (ContactUsCreate): User-submitted name, email, subject, message.
-        session (AsyncSession): Database session.
 
     Returns:
         ContactUsRead: The created contact record.
     """
-    return await service.create_contact(session, payload)
+    return await service.create_contact(payload)
 
 
 @router.get(
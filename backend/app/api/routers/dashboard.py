@@ -250,18 +250,22 @@ async def get_top_products(limit: int = Query(10, ge=1, le=100)):
     response_model=LowStockOut,
     dependencies=[Depends(require_permission("dashboard", "Read"))],
 )
-async def get_low_stock(threshold: int = Query(10, ge=0, le=10_000)):
+async def get_low_stock(
+    threshold: int = Query(10, ge=0, le=10_000),
+    limit: int = Query(50, ge=1, le=500),
+):
     """
     List items that are at or below a given stock threshold.
 
     Args:
         threshold (int): Minimum stock level to trigger alert.
+        limit (int): Maximum number of items to return (default: 50).
 
     Returns:
         LowStockOut: Items with remaining_qty <= threshold
     """
     try:
-        items = await svc.low_stock(threshold)
+        items = await svc.low_stock(threshold, limit)
         return LowStockOut(threshold=threshold, items=items)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load low-stock items: {e}")
@@ -5,10 +5,18 @@ class Settings(BaseSettings):
     API_V1_PREFIX: str 
     MONGO_URI: str
     MONGO_DB : str
+    MONGO_MAX_POOL_SIZE: int = 100    # pymongo default; cap per process
+    MONGO_MIN_POOL_SIZE: int = 10     # keep warm sockets so bursts skip the TCP/TLS/auth handshake
     REDIS_HOST : str
     PERM_CACHE_TTL_SECONDS: int
+    PINCODE_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 30   # PIN -> location barely ever changes
+    PINCODE_NEGATIVE_CACHE_TTL_SECONDS: int = 5 * 60     # remember unknown PINs briefly
+    CATEGORY_CACHE_TTL_SECONDS: int = 5 * 60             # category reads; writes invalidate
     GRIDFS_BUCKET: str
     POSTGRESQL_URI: str
+    POSTGRES_POOL_SIZE: int = 20
+    POSTGRES_MAX_OVERFLOW: int = 20
+    POSTGRES_POOL_RECYCLE_SECONDS: int = 300   # below typical managed-PG idle cutoffs
     BACKEND_BASE_URL: str
     UPLOAD_MAX_BYTES: int
     UPLOAD_ALLOWED_TYPES: str
@@ -47,6 +55,8 @@ class Settings(BaseSettings):
     FORGOT_PWD_OTP_RATE_LIMIT_PREFIX : str
     
     CLEANUP_INTERVAL_MINUTES: int = 30  # Run cleanup every N minutes
+    DASHBOARD_REFRESH_MINUTES: int = 5  # Rebuild materialized dashboard aggregates every N minutes
+    DASHBOARD_CACHE_TTL_SECONDS: int = 60  # Cached dashboard reads; order/return/exchange writes invalidate
 
     USER_MAX_REQUESTS : int           
     USER_WINDOW_SECONDS : int            
@@ -60,6 +70,8 @@ class Settings(BaseSettings):
     
     RAZORPAY_KEY_ID: str
     RAZORPAY_KEY_SECRET: str
+
+    GST_VERIFY_CHECKSUM: bool = False  # opt-in: also reject GSTINs whose 15th char fails the mod-36 check
     
     
     class Config:
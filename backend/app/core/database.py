@@ -4,7 +4,11 @@ from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-client = AsyncIOMotorClient(settings.MONGO_URI)
+client = AsyncIOMotorClient(
+    settings.MONGO_URI,
+    maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+    minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+)
 db = client[settings.MONGO_DB]
 
 
@@ -20,7 +24,11 @@ async def close_mongo_connection():
 engine = create_async_engine(
     settings.POSTGRESQL_URI,
     echo=False,
-    future=True
+    future=True,
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+    pool_recycle=settings.POSTGRES_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=True,  # replace sockets the server dropped instead of failing the request
 )
 
 AsyncSessionLocal = sessionmaker(
@@ -0,0 +1,31 @@
+from typing import Optional
+import httpx
+
+POSTAL_API_BASE_URL = "https://api.postalpincode.in"
+
+_postal_client: Optional[httpx.AsyncClient] = None
+
+
+def get_postal_client() -> httpx.AsyncClient:
+    """
+    Create or reuse the shared HTTP client for the Postal PIN code API.
+
+    A single pooled client keeps TCP/TLS connections alive between lookups,
+    so repeat calls skip the handshake.
+    """
+    global _postal_client
+    if _postal_client is None or _postal_client.is_closed:
+        _postal_client = httpx.AsyncClient(
+            base_url=POSTAL_API_BASE_URL,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(5.0),
+        )
+    return _postal_client
+
+
+async def close_http_clients():
+    """Gracefully close shared outbound HTTP clients."""
+    global _postal_client
+    if _postal_client is not None:
+        await _postal_client.aclose()
+        _postal_client = None
@@ -126,6 +126,30 @@ def _otp_attempts_key(email: str) -> str:
 def _otp_rate_limit_key(email: str) -> str:
     return f"{settings.FORGOT_PWD_OTP_RATE_LIMIT_PREFIX}{email.strip().lower()}"
 
+def _pincode_key(pincode: int) -> str:
+    """Redis key for cached postal PIN code lookups."""
+    return f"pincode:{pincode}"
+
+def _category_key(category_id: Any) -> str:
+    """Redis key for a cached category document."""
+    return f"v1:cat:{category_id}"
+
+def _category_list_gen_key() -> str:
+    """Redis counter bumped on every category write; list keys embed it."""
+    return "v1:cat:list:generation"
+
+def _category_list_key(generation: Any, skip: int, limit: int, category: Optional[str], q: Optional[str]) -> str:
+    """Redis key for one cached page of the category listing."""
+    return f"v1:cat:list:{generation}:{skip}:{limit}:{category or ''}:{q or ''}"
+
+def _dashboard_gen_key() -> str:
+    """Redis counter bumped by order/return/exchange writes; dashboard keys embed it."""
+    return "dashboard:gen"
+
+def _dashboard_key(generation: Any, fn: str, *args: Any) -> str:
+    """Redis key for one cached dashboard result (generation + function + call args)."""
+    return f"dashboard:{generation}:{fn}:" + ":".join(str(a) for a in args)
+
 def _user_rate_key(user_id: str) -> str:
     """Redis key for per-user rate limiting."""
     return f"rl:user:{user_id}"
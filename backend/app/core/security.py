@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta, timezone
 from jose import jwt, JWTError
 from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
 import uuid
 from typing import Any, Dict, Optional
@@ -37,6 +38,21 @@ def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    """
+    Async variant of verify_password for request handlers.
+
+    bcrypt is CPU-bound (~100ms) and releases the GIL, so running it in the
+    threadpool keeps the event loop free for other requests.
+    """
+    return await run_in_threadpool(verify_password, plain, hashed)
+
+
+async def hash_password_async(password: str) -> str:
+    """Async variant of hash_password; runs bcrypt in the threadpool."""
+    return await run_in_threadpool(hash_password, password)
+
+
 def _utcnow() -> datetime:
     """
     Internal utility: Provides current timestamp in UTC timezone.
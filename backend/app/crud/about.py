@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+from pymongo import ReturnDocument
 
 from app.core.database import db
 from app.utils.mongo import stamp_create, stamp_update
@@ -17,9 +19,8 @@ def _to_out(doc: dict) -> AboutOut:
 async def create(payload: AboutCreate) -> AboutOut:
     # Keep native types (ObjectId, datetime, etc.)
     doc = stamp_create(payload.model_dump(mode="python"))
-    res = await db[COLL].insert_one(doc)
-    saved = await db[COLL].find_one({"_id": res.inserted_id})
-    return _to_out(saved)
+    await db[COLL].insert_one(doc)  # sets doc["_id"]
+    return _to_out(doc)
 
 
 async def list_all(skip: int = 0, limit: int = 50) -> List[AboutOut]:
@@ -44,11 +45,38 @@ async def update_one(_id: PyObjectId, payload: AboutUpdate) -> Optional[AboutOut
     data = {k: v for k, v in payload.model_dump(mode="python",exclude_none=True).items() if v is not None}
     if not data:
         return None
-    await db[COLL].update_one({"_id": _id}, {"$set": stamp_update(data)})
-    doc = await db[COLL].find_one({"_id": _id})
+    doc = await db[COLL].find_one_and_update(
+        {"_id": _id},
+        {"$set": stamp_update(data)},
+        return_document=ReturnDocument.AFTER,
+    )
     return _to_out(doc) if doc else None
 
 
+async def update_with_previous(_id: PyObjectId, payload: AboutUpdate) -> Optional[Tuple[AboutOut, AboutOut]]:
+    """
+    Apply the patch and return (previous, updated) from a single round trip,
+    so callers can clean up whatever the patch replaced (e.g. the old image).
+    """
+    data = {k: v for k, v in payload.model_dump(mode="python", exclude_none=True).items() if v is not None}
+    if not data:
+        return None
+    data = stamp_update(data)
+    before = await db[COLL].find_one_and_update(
+        {"_id": _id},
+        {"$set": data},
+        return_document=ReturnDocument.BEFORE,
+    )
+    if not before:
+        return None
+    return _to_out(before), _to_out({**before, **data})
+
+
 async def delete_one(_id: PyObjectId) -> Optional[bool]:
     r = await db[COLL].delete_one({"_id": _id})
-    return r.deleted_count == 1
\ No newline at end of file
+    return r.deleted_count == 1
+
+
+async def delete_and_return(_id: PyObjectId) -> Optional[AboutOut]:
+    doc = await db[COLL].find_one_and_delete({"_id": _id})
+    return _to_out(doc) if doc else None
\ No newline at end of file
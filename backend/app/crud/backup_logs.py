@@ -10,7 +10,7 @@ from typing import Dict, Any, List, Optional
 from bson import ObjectId
 from app.core.database import db
 from app.core.config import settings
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, after_filter
 from app.schemas.backup_logs import (
     BackupLogsCreate,
     BackupScope,
@@ -55,13 +55,26 @@ async def create_log(payload: BackupLogsCreate) -> Dict[str, Any]:
     res = await db[COLL].insert_one(doc)
     return await db[COLL].find_one({"_id": res.inserted_id})
 
-async def list_all(skip: int = 0, limit: int = 50, query: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+_LIST_SORT = [("createdAt", -1), ("_id", -1)]
+
+
+async def list_all(
+    skip: int = 0,
+    limit: int = 50,
+    query: Dict[str, Any] | None = None,
+    after: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """List newest first; `after` (last seen _id) switches from skip to keyset paging."""
+    q: Dict[str, Any] = query or {}
+    if after:
+        q = {"$and": [q, await after_filter(db[COLL], after, _LIST_SORT, q)]}
+        skip = 0
     cur = (
         db[COLL]
-        .find(query or {})
+        .find(q)
+        .sort(_LIST_SORT)
         .skip(max(0, skip))
         .limit(max(1, limit))
-        .sort("createdAt", -1)
     )
     return await cur.to_list(length=limit)
 
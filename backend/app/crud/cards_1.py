@@ -1,9 +1,11 @@
 # app/crud/cards_1.py
 from __future__ import annotations
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+from pymongo import ReturnDocument
 
 from app.core.database import db
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, after_filter, from_mongo
 from app.schemas.object_id import PyObjectId
 from app.schemas.cards_1 import Cards1Create, Cards1Update, Cards1Out
 
@@ -11,20 +13,30 @@ COLL = "cards_1"
 
 
 def _to_out(doc: dict) -> Cards1Out:
-    return Cards1Out.model_validate(doc)
+    return from_mongo(Cards1Out, doc)
 
 
 async def create(payload: Cards1Create) -> Cards1Out:
     # Keep native types (ObjectId, datetime, etc.)
     doc = stamp_create(payload.model_dump(mode="python"))
-    res = await db[COLL].insert_one(doc)
-    saved = await db[COLL].find_one({"_id": res.inserted_id})
-    return _to_out(saved)
+    await db[COLL].insert_one(doc)  # sets doc["_id"]
+    return _to_out(doc)
+
+
+_IDX_SORT = [("idx", 1), ("createdAt", -1), ("_id", -1)]
+_RECENT_SORT = [("createdAt", -1), ("_id", -1)]
 
 
-async def list_all(skip: int = 0, limit: int = 50, sort_by_idx: bool = True) -> List[Cards1Out]:
-    base = db[COLL].find({}).skip(max(skip, 0)).limit(max(limit, 0))
-    cur = base.sort([("idx", 1), ("createdAt", -1)]) if sort_by_idx else base.sort("createdAt", -1)
+async def list_all(
+    skip: int = 0, limit: int = 50, sort_by_idx: bool = True, after: Optional[str] = None
+) -> List[Cards1Out]:
+    sort = _IDX_SORT if sort_by_idx else _RECENT_SORT
+    q = {}
+    if after:
+        # keyset paging: start past the last seen card instead of skipping
+        q = await after_filter(db[COLL], after, sort)
+        skip = 0
+    cur = db[COLL].find(q).skip(max(skip, 0)).limit(max(limit, 0)).sort(sort)
     docs = await cur.to_list(length=limit)
     return [_to_out(d) for d in docs]
 
@@ -39,11 +51,38 @@ async def update_one(_id: PyObjectId, payload: Cards1Update) -> Optional[Cards1O
     data = {k: v for k, v in payload.model_dump(mode="python",exclude_none=True).items() if v is not None}
     if not data:
         return None
-    await db[COLL].update_one({"_id": _id}, {"$set": stamp_update(data)})
-    doc = await db[COLL].find_one({"_id": _id})
+    doc = await db[COLL].find_one_and_update(
+        {"_id": _id},
+        {"$set": stamp_update(data)},
+        return_document=ReturnDocument.AFTER,
+    )
     return _to_out(doc) if doc else None
 
 
+async def update_with_previous(_id: PyObjectId, payload: Cards1Update) -> Optional[Tuple[Cards1Out, Cards1Out]]:
+    """
+    Apply the patch and return (previous, updated) from a single round trip,
+    so callers can clean up whatever the patch replaced (e.g. the old image).
+    """
+    data = {k: v for k, v in payload.model_dump(mode="python", exclude_none=True).items() if v is not None}
+    if not data:
+        return None
+    data = stamp_update(data)
+    before = await db[COLL].find_one_and_update(
+        {"_id": _id},
+        {"$set": data},
+        return_document=ReturnDocument.BEFORE,
+    )
+    if not before:
+        return None
+    return _to_out(before), _to_out({**before, **data})
+
+
 async def delete_one(_id: PyObjectId) -> Optional[bool]:
     r = await db[COLL].delete_one({"_id": _id})
-    return r.deleted_count == 1
\ No newline at end of file
+    return r.deleted_count == 1
+
+
+async def delete_and_return(_id: PyObjectId) -> Optional[Cards1Out]:
+    doc = await db[COLL].find_one_and_delete({"_id": _id})
+    return _to_out(doc) if doc else None
\ No newline at end of file
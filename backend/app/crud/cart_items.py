@@ -7,9 +7,9 @@ from bson import ObjectId
 from pymongo import ReturnDocument
 
 from app.core.database import db
-from app.utils.mongo import stamp_update
+from app.utils.mongo import stamp_update, after_filter
 from app.schemas.object_id import PyObjectId
-from app.schemas.cart_items import CartItemsCreate, CartItemsUpdate, CartItemsOut
+from app.schemas.cart_items import CartItemsCreate, CartItemsUpdate, CartItemsOut, parse_many
 
 COLL = "cart_items"
 
@@ -85,31 +85,57 @@ async def create(payload: CartItemsCreate) -> CartItemsOut:
     return _to_out(doc)
 
 
-async def list_all(skip: int = 0, limit: int = 50, query: Dict[str, Any] | None = None) -> List[CartItemsOut]:
+_LIST_SORT = [("createdAt", -1), ("_id", -1)]
+
+
+async def list_all(
+    skip: int = 0,
+    limit: int = 50,
+    query: Dict[str, Any] | None = None,
+    after: Optional[str] = None,
+) -> List[CartItemsOut]:
     q: Dict[str, Any] = {}
     if query:
         q = {
             k: (_as_oid(v, k) if k in {"cart_id", "product_id", "_id"} else v)
             for k, v in query.items()
         }
+    if after:
+        # keyset paging: start past the last seen line instead of skipping
+        q = {"$and": [q, await after_filter(db[COLL], after, _LIST_SORT, q)]}
+        skip = 0
 
     cur = (
         db[COLL]
         .find(q)
         .skip(max(skip, 0))
         .limit(max(limit, 0))
-        .sort("createdAt", -1)
+        .sort(_LIST_SORT)
     )
     docs = await cur.to_list(length=limit)
-    return [_to_out(d) for d in docs]
+    return parse_many(docs)
+
+
+def _by_id(_id: PyObjectId, cart_id: Optional[ObjectId]) -> Dict[str, Any]:
+    # Scoping by cart_id folds the ownership check into the query itself
+    f: Dict[str, Any] = {"_id": _id}
+    if cart_id is not None:
+        f["cart_id"] = cart_id
+    return f
 
 
-async def get_one(_id: PyObjectId) -> Optional[CartItemsOut]:
-    doc = await db[COLL].find_one({"_id": _id})
+async def get_one(_id: PyObjectId, cart_id: Optional[ObjectId] = None) -> Optional[CartItemsOut]:
+    doc = await db[COLL].find_one(_by_id(_id, cart_id))
     return _to_out(doc) if doc else None
 
 
-async def update_one(_id: PyObjectId, payload: CartItemsUpdate) -> Optional[CartItemsOut]:
+async def exists(_id: PyObjectId) -> bool:
+    return await db[COLL].count_documents({"_id": _id}, limit=1) > 0
+
+
+async def update_one(
+    _id: PyObjectId, payload: CartItemsUpdate, cart_id: Optional[ObjectId] = None
+) -> Optional[CartItemsOut]:
     """
     Plain field update; avoid touching quantity here if you rely on merge semantics elsewhere.
     """
@@ -117,11 +143,14 @@ async def update_one(_id: PyObjectId, payload: CartItemsUpdate) -> Optional[Cart
     if not data:
         return None
 
-    await db[COLL].update_one({"_id": _id}, {"$set": stamp_update(data)})
-    doc = await db[COLL].find_one({"_id": _id})
+    doc = await db[COLL].find_one_and_update(
+        _by_id(_id, cart_id),
+        {"$set": stamp_update(data)},
+        return_document=ReturnDocument.AFTER,
+    )
     return _to_out(doc) if doc else None
 
 
-async def delete_one(_id: PyObjectId) -> Optional[bool]:
-    r = await db[COLL].delete_one({"_id": _id})
+async def delete_one(_id: PyObjectId, cart_id: Optional[ObjectId] = None) -> Optional[bool]:
+    r = await db[COLL].delete_one(_by_id(_id, cart_id))
     return r.deleted_count == 1
\ No newline at end of file
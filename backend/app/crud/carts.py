@@ -27,9 +27,8 @@ def _maybe_oid(v):
 async def create(payload: CartsCreate) -> CartsOut:
     # Preserve native types (ObjectId, datetime, etc.)
     doc = stamp_create(payload.model_dump(mode="python"))
-    res = await db[COLL].insert_one(doc)
-    saved = await db[COLL].find_one({"_id": res.inserted_id})
-    return _to_out(saved)
+    await db[COLL].insert_one(doc)  # sets doc["_id"]; every other field is already known
+    return _to_out(doc)
 
 
 async def list_all(skip: int = 0, limit: int = 50, query: Dict[str, Any] | None = None) -> List[CartsOut]:
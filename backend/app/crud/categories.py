@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import re
 
 from app.core.database import db
@@ -60,7 +60,8 @@ async def get_one(_id: PyObjectId) -> Optional[CategoriesOut]:
 
 
 async def update_one(_id: PyObjectId, payload: CategoriesUpdate) -> Optional[CategoriesOut]:
-    data = {k: v for k, v in payload.model_dump(mode="python",exclude_none=True).items() if v is not None}
+    # only what the client sent; unset optional fields never get serialized
+    data = payload.model_dump(mode="python", exclude_unset=True, exclude_none=True)
     if not data:
         return None
 
@@ -74,6 +75,71 @@ async def delete_one(_id: PyObjectId) -> Optional[bool]:
     return r.deleted_count == 1
 
 
+async def _cascade_products(category_ids: List[PyObjectId], session) -> Tuple[List[str], Dict[str, Any]]:
+    """
+    Delete every product under `category_ids` plus the documents that reference
+    those products, inside the caller's transaction.
+    Returns (image_urls, stats) for the GridFS cleanup and the response.
+    """
+    image_urls: List[str] = []
+    related_deleted_counts: Dict[str, int] = {}
+    products_deleted = 0
+    product_images_deleted = 0
+
+    # Find all products for these categories (category_id is ObjectId)
+    product_cursor = db["products"].find(
+        {"category_id": {"$in": category_ids}},
+        {"thumbnail_url": 1},
+        session=session,
+    )
+    products = await product_cursor.to_list(length=None)
+
+    if products:
+        product_ids = [p["_id"] for p in products]  # ObjectIds
+
+        # Collect product thumbnails
+        image_urls.extend(p["thumbnail_url"] for p in products if p.get("thumbnail_url"))
+
+        # Collect product_images URLs (product_id is ObjectId)
+        rel_cursor = db["product_images"].find(
+            {"product_id": {"$in": product_ids}},
+            {"image_url": 1},
+            session=session,
+        )
+        rel_docs = await rel_cursor.to_list(length=None)
+        image_urls.extend([d.get("image_url") for d in rel_docs if d.get("image_url")])
+
+        # Delete product_images for these products
+        r_pi = await db["product_images"].delete_many(
+            {"product_id": {"$in": product_ids}},
+            session=session,
+        )
+        product_images_deleted = getattr(r_pi, "deleted_count", 0) or 0
+
+        # Delete other related documents referencing these products
+        for coll, field in RELATED_COLLECTIONS_BY_PRODUCT_ID.items():
+            if coll == "product_images":
+                continue
+            r_rel = await db[coll].delete_many(
+                {field: {"$in": product_ids}},
+                session=session,
+            )
+            related_deleted_counts[coll] = getattr(r_rel, "deleted_count", 0) or 0
+
+        # Delete products
+        r_prod = await db["products"].delete_many(
+            {"_id": {"$in": product_ids}},
+            session=session,
+        )
+        products_deleted = getattr(r_prod, "deleted_count", 0) or 0
+
+    return image_urls, {
+        "products_deleted": products_deleted,
+        "product_images_deleted": product_images_deleted,
+        "related_deleted": related_deleted_counts,
+    }
+
+
 async def delete_one_cascade(_id: PyObjectId) -> Optional[Dict[str, Any]]:
     """
     Transactionally delete a category and all its products and product-related documents.
@@ -94,77 +160,61 @@ async def delete_one_cascade(_id: PyObjectId) -> Optional[Dict[str, Any]]:
       - Assumes products.category_id is ObjectId.
       - Assumes related collections store product_id as ObjectId.
     """
-    image_urls: list[str] = []
-    related_deleted_counts: Dict[str, int] = {}
-    products_deleted = 0
-    product_images_deleted = 0
-
     try:
         async with await db.client.start_session() as session:  # type: ignore[attr-defined]
             async with session.start_transaction():
-                # Ensure category exists
-                cat_doc = await db[COLL].find_one({"_id": _id}, session=session)
-                if not cat_doc:
-                    return {"status": "not_found", "image_urls": [], "stats": {}}
-
-                # Find all products for this category (category_id is ObjectId)
-                product_cursor = db["products"].find({"category_id": _id}, session=session)
-                products = await product_cursor.to_list(length=None)
-
-                if products:
-                    product_ids = [p["_id"] for p in products]  # ObjectIds
-
-                    # Collect product thumbnails
-                    for p in products:
-                        thumb = p.get("thumbnail_url")
-                        if thumb:
-                            image_urls.append(thumb)
-
-                    # Collect product_images URLs (product_id is ObjectId)
-                    rel_cursor = db["product_images"].find(
-                        {"product_id": {"$in": product_ids}},
-                        session=session,
-                    )
-                    rel_docs = await rel_cursor.to_list(length=None)
-                    image_urls.extend([d.get("image_url") for d in rel_docs if d.get("image_url")])
-
-                    # Delete product_images for these products
-                    r_pi = await db["product_images"].delete_many(
-                        {"product_id": {"$in": product_ids}},
-                        session=session,
-                    )
-                    product_images_deleted = getattr(r_pi, "deleted_count", 0) or 0
-
-                    # Delete other related documents referencing these products
-                    for coll, field in RELATED_COLLECTIONS_BY_PRODUCT_ID.items():
-                        if coll == "product_images":
-                            continue
-                        r_rel = await db[coll].delete_many(
-                            {field: {"$in": product_ids}},
-                            session=session,
-                        )
-                        related_deleted_counts[coll] = getattr(r_rel, "deleted_count", 0) or 0
-
-                    # Delete products
-                    r_prod = await db["products"].delete_many(
-                        {"_id": {"$in": product_ids}},
-                        session=session,
-                    )
-                    products_deleted = getattr(r_prod, "deleted_count", 0) or 0
-
-                # Finally delete the category itself
+                # Delete the category first; deleted_count doubles as the existence
+                # check, and the transaction keeps the cascade all-or-nothing.
                 r_cat = await db[COLL].delete_one({"_id": _id}, session=session)
                 if r_cat.deleted_count != 1:
-                    raise RuntimeError("Primary category delete failed")
+                    return {"status": "not_found", "image_urls": [], "stats": {}}
+
+                image_urls, stats = await _cascade_products([_id], session)
 
         return {
             "status": "deleted",
             "image_urls": [u for u in image_urls if u],
-            "stats": {
-                "products_deleted": products_deleted,
-                "product_images_deleted": product_images_deleted,
-                "related_deleted": related_deleted_counts,
-            },
+            "stats": stats,
+        }
+    except Exception:
+        return {"status": "error", "image_urls": [], "stats": {}}
+
+
+async def delete_many_cascade(ids: List[PyObjectId]) -> Dict[str, Any]:
+    """
+    Transactionally delete several categories and everything under them with
+    one $in-filtered command per collection instead of one cascade per id.
+
+    Returns:
+      {
+        "status": "deleted" | "error",
+        "deleted_ids": [ObjectId, ...],
+        "not_found_ids": [ObjectId, ...],
+        "image_urls": [str, ...],
+        "stats": {...}               # same shape as delete_one_cascade
+      }
+    """
+    try:
+        async with await db.client.start_session() as session:  # type: ignore[attr-defined]
+            async with session.start_transaction():
+                found = await db[COLL].find({"_id": {"$in": ids}}, {"_id": 1}, session=session).to_list(length=None)
+                found_ids = [d["_id"] for d in found]
+                image_urls: List[str] = []
+                stats: Dict[str, Any] = {}
+
+                if found_ids:
+                    image_urls, stats = await _cascade_products(found_ids, session)
+                    r_cat = await db[COLL].delete_many({"_id": {"$in": found_ids}}, session=session)
+                    if r_cat.deleted_count != len(found_ids):
+                        raise RuntimeError("Primary category delete failed")
+
+        found_set = set(found_ids)
+        return {
+            "status": "deleted",
+            "deleted_ids": found_ids,
+            "not_found_ids": [i for i in ids if i not in found_set],
+            "image_urls": [u for u in image_urls if u],
+            "stats": stats,
         }
     except Exception:
-        return {"status": "error", "image_urls": [], "stats": {}}
\ No newline at end of file
+        return {"status": "error", "deleted_ids": [], "not_found_ids": [], "image_urls": [], "stats": {}}
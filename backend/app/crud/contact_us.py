@@ -1,39 +1,60 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List, Optional
+from sqlalchemy import select, insert, update, delete, bindparam
+from sqlalchemy.engine import Row
+from typing import Any, Dict, List, Optional
 from app.models.contact_us import ContactUs
-from app.schemas.contact_us import ContactUsCreate, ContactUsUpdate
 import uuid
 
-async def create_contact(session: AsyncSession, payload: ContactUsCreate) -> ContactUs:
-    obj = ContactUs(**payload.dict())
-    session.add(obj)
+# Built once at import: SQLAlchemy's compiled cache keys off the statement
+# structure, so the hot reads skip re-construction and stay cache hits.
+_COLUMNS = tuple(ContactUs.__table__.c)
+_GET_STMT = select(*_COLUMNS).where(ContactUs.id == bindparam("contact_id"))
+_LIST_STMT = (
+    select(*_COLUMNS)
+    .order_by(ContactUs.created_at.desc())
+    .limit(bindparam("limit"))
+    .offset(bindparam("offset"))
+)
+
+async def create_contacts_bulk(session: AsyncSession, rows: List[Dict[str, Any]]) -> List[Row]:
+    """
+    Insert many contact rows with one multi-VALUES INSERT ... RETURNING.
+    Ids are assigned here so the returned rows can be matched back to `rows`
+    in order (RETURNING order is not guaranteed).
+    """
+    rows = [{**r, "id": uuid.uuid4()} for r in rows]
+    result = await session.execute(
+        insert(ContactUs).values(rows).returning(*_COLUMNS)
+    )
+    by_id = {r.id: r for r in result.all()}
     await session.commit()
-    await session.refresh(obj)
-    return obj
+    return [by_id[r["id"]] for r in rows]
 
-async def get_contact(session: AsyncSession, contact_id: uuid.UUID) -> Optional[ContactUs]:
-    return await session.get(ContactUs, contact_id)
+async def get_contact(session: AsyncSession, contact_id: uuid.UUID) -> Optional[Row]:
+    q = await session.execute(_GET_STMT, {"contact_id": contact_id})
+    return q.first()
 
-async def list_contacts(session: AsyncSession, limit: int = 100, offset: int = 0) -> List[ContactUs]:
-    q = await session.execute(select(ContactUs).order_by(ContactUs.created_at.desc()).limit(limit).offset(offset))
-    return q.scalars().all()
+async def list_contacts(session: AsyncSession, limit: int = 100, offset: int = 0) -> List[Row]:
+    # Plain column rows: ContactUs has no relationships to load, and read-only
+    # listings don't need ORM instances in the session's identity map.
+    q = await session.execute(_LIST_STMT, {"limit": limit, "offset": offset})
+    return q.all()
 
-async def update_contact(session: AsyncSession, contact_id: uuid.UUID, payload: ContactUsUpdate) -> Optional[ContactUs]:
-    db_obj = await session.get(ContactUs, contact_id)
-    if not db_obj:
-        return None
-    for field, value in payload.dict(exclude_unset=True).items():
-        setattr(db_obj, field, value)
-    session.add(db_obj)
+async def update_contact(session: AsyncSession, contact_id: uuid.UUID, data: Dict[str, Any]) -> Optional[Row]:
+    # UPDATE ... RETURNING: one statement instead of load, flush and refresh
+    if not data:
+        return await get_contact(session, contact_id)
+    q = await session.execute(
+        update(ContactUs)
+        .where(ContactUs.id == contact_id)
+        .values(**data)
+        .returning(*_COLUMNS)
+    )
+    row = q.first()
     await session.commit()
-    await session.refresh(db_obj)
-    return db_obj
+    return row
 
 async def delete_contact(session: AsyncSession, contact_id: uuid.UUID) -> bool:
-    db_obj = await session.get(ContactUs, contact_id)
-    if not db_obj:
-        return False
-    await session.delete(db_obj)
+    q = await session.execute(delete(ContactUs).where(ContactUs.id == contact_id))
     await session.commit()
-    return True
\ No newline at end of file
+    return q.rowcount == 1
\ No newline at end of file
@@ -3,7 +3,7 @@ from typing import List, Optional, Dict, Any
 from bson import ObjectId
 
 from app.core.database import db
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, from_mongo
 from app.schemas.object_id import PyObjectId
 from app.schemas.return_status import (
     ReturnStatusCreate,
@@ -16,7 +16,7 @@ RETURNS_COLL = "returns"   # collection where this status may be referenced
 
 
 def _to_out(doc: dict) -> ReturnStatusOut:
-    return ReturnStatusOut.model_validate(doc)
+    return from_mongo(ReturnStatusOut, doc)
 
 
 async def create(payload: ReturnStatusCreate) -> ReturnStatusOut:
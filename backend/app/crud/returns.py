@@ -4,14 +4,14 @@ from typing import List, Optional, Dict, Any
 from bson import ObjectId
 
 from app.core.database import db
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, from_mongo
 from app.schemas.object_id import PyObjectId
 from app.schemas.returns import ReturnsCreate, ReturnsUpdate, ReturnsOut
 
 COLL = "returns"
 
 def _to_out(doc: dict) -> ReturnsOut:
-    return ReturnsOut.model_validate(doc)
+    return from_mongo(ReturnsOut, doc)
 
 def _to_oid(v: Any) -> ObjectId:
     """
@@ -119,7 +119,7 @@ async def update_one(_id: PyObjectId, payload: ReturnsUpdate) -> Optional[Return
     except ValueError:
         return None
 
-    data = payload.model_dump(mode="python", exclude_none=True)
+    data = payload.model_dump(mode="python", exclude_unset=True, exclude_none=True)
     if not data:
         return None
 
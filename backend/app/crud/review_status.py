@@ -3,7 +3,7 @@ from typing import List, Optional, Dict, Any
 from bson import ObjectId
 
 from app.core.database import db
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, from_mongo
 from app.schemas.object_id import PyObjectId
 from app.schemas.review_status import (
     ReviewStatusCreate,
@@ -16,7 +16,7 @@ REVIEWS_COLL = "user_reviews"  # collection where this status may be referenced
 
 
 def _to_out(doc: dict) -> ReviewStatusOut:
-    return ReviewStatusOut.model_validate(doc)
+    return from_mongo(ReviewStatusOut, doc)
 
 
 async def create(payload: ReviewStatusCreate) -> ReviewStatusOut:
@@ -1,12 +1,14 @@
+import asyncio
 from datetime import datetime , timezone
 from typing import Optional
 from app.core.database import db
 from app.utils.mongo import stamp_create
+from app.crud.token_revocations import add_revocation
 
-async def create_session(doc: dict) -> dict:
+async def create_session(doc: dict, session=None) -> dict:
     d = stamp_create(doc)
-    res = await db["sessions"].insert_one(d)
-    return await db["sessions"].find_one({"_id": res.inserted_id})
+    await db["sessions"].insert_one(d, session=session)  # sets d["_id"]
+    return d
 
 async def get_by_refresh_hash(refresh_hash: str) -> Optional[dict]:
     return await db["sessions"].find_one({"refresh_hash": refresh_hash, "revokedAt": None})
@@ -14,5 +16,12 @@ async def get_by_refresh_hash(refresh_hash: str) -> Optional[dict]:
 async def revoke_session_by_jti(jti: str, reason: str):
     await db["sessions"].update_one({"jti": jti}, {"$set": {"revokedAt": datetime.now(timezone.utc), "revocationReason": reason}})
 
+async def revoke_and_record(jti: str, expiresAt: datetime, reason: str):
+    """Revoke the session and add its jti to the revocation list concurrently (independent collections)."""
+    await asyncio.gather(
+        revoke_session_by_jti(jti, reason=reason),
+        add_revocation(jti, expiresAt=expiresAt, reason=reason),
+    )
+
 async def revoke_all_user_sessions(user_id: str):
     await db["sessions"].update_many({"user_id": user_id, "revokedAt": None}, {"$set": {"revokedAt": datetime.now(timezone.utc)}})
@@ -3,7 +3,7 @@ from typing import List, Optional, Dict, Any
 from bson import ObjectId
 
 from app.core.database import db
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, from_mongo
 from app.schemas.object_id import PyObjectId
 from app.schemas.store_details import (
     StoreDetailsCreate,
@@ -15,7 +15,7 @@ COLL = "store_details"
 
 
 def _to_out(doc: dict) -> StoreDetailsOut:
-    return StoreDetailsOut.model_validate(doc)
+    return from_mongo(StoreDetailsOut, doc)
 
 
 async def create(payload: StoreDetailsCreate) -> StoreDetailsOut:
@@ -3,7 +3,7 @@ from typing import List, Optional
 from bson import ObjectId
 
 from app.core.database import db
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, from_mongo
 from app.schemas.object_id import PyObjectId
 from app.schemas.terms_and_conditions import (
     TermsAndConditionsCreate,
@@ -15,7 +15,7 @@ COLL = "terms_and_conditions"
 
 
 def _to_out(doc: dict) -> TermsAndConditionsOut:
-    return TermsAndConditionsOut.model_validate(doc)
+    return from_mongo(TermsAndConditionsOut, doc)
 
 
 async def create(payload: TermsAndConditionsCreate) -> TermsAndConditionsOut:
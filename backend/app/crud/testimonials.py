@@ -3,7 +3,7 @@ from typing import List, Optional
 from bson import ObjectId
 
 from app.core.database import db
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, from_mongo
 from app.schemas.object_id import PyObjectId
 from app.schemas.testimonials import TestimonialsCreate, TestimonialsUpdate, TestimonialsOut
 
@@ -11,7 +11,7 @@ COLL = "testimonials"
 
 
 def _to_out(doc: dict) -> TestimonialsOut:
-    return TestimonialsOut.model_validate(doc)
+    return from_mongo(TestimonialsOut, doc)
 
 
 async def create(payload: TestimonialsCreate) -> TestimonialsOut:
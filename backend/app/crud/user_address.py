@@ -3,7 +3,7 @@ from typing import List, Optional, Dict, Any
 from bson import ObjectId
 
 from app.core.database import db
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, from_mongo
 from app.schemas.object_id import PyObjectId
 from app.schemas.user_address import (
     UserAddressCreate,
@@ -15,7 +15,7 @@ COLL = "user_address"
 
 
 def _to_out(doc: dict) -> UserAddressOut:
-    return UserAddressOut.model_validate(doc)
+    return from_mongo(UserAddressOut, doc)
 
 
 async def create(payload: UserAddressCreate) -> UserAddressOut:
@@ -3,7 +3,7 @@ from typing import List, Optional, Dict, Any  # ensure Any is imported
 from bson import ObjectId
 
 from app.core.database import db
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, from_mongo
 from app.schemas.object_id import PyObjectId
 from app.schemas.user_ratings import (
     UserRatingsCreate,
@@ -15,7 +15,7 @@ COLL = "user_ratings"
 PRODUCTS = "products"
 
 def _to_out(doc: dict) -> UserRatingsOut:
-    return UserRatingsOut.model_validate(doc)
+    return from_mongo(UserRatingsOut, doc)
 
 def _to_oid(value: Any) -> Optional[ObjectId]:
     """
@@ -124,7 +124,7 @@ async def update_with_recalc(_id: PyObjectId, payload: UserRatingsUpdate) -> Opt
     if not product_oid:
         return None
 
-    data = payload.model_dump(mode="python", exclude_none=True)
+    data = payload.model_dump(mode="python", exclude_unset=True, exclude_none=True)
     if not data:
         return None
 
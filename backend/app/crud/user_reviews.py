@@ -3,14 +3,14 @@ from typing import List, Optional, Dict, Any, Any  # ensure Any is available
 from bson import ObjectId
 
 from app.core.database import db
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, from_mongo
 from app.schemas.object_id import PyObjectId
 from app.schemas.user_reviews import UserReviewsCreate, UserReviewsUpdate, UserReviewsOut
 
 COLL = "user_reviews"
 
 def _to_out(doc: dict) -> UserReviewsOut:
-    return UserReviewsOut.model_validate(doc)
+    return from_mongo(UserReviewsOut, doc)
 
 def _to_oid(value: Any) -> Optional[ObjectId]:
     try:
@@ -3,7 +3,7 @@ from typing import List, Optional, Dict, Any
 from bson import ObjectId
 
 from app.core.database import db
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, from_mongo
 from app.schemas.object_id import PyObjectId
 from app.schemas.user_roles import UserRolesCreate, UserRolesUpdate, UserRolesOut
 
@@ -11,7 +11,7 @@ COLL = "user_roles"
 
 
 def _to_out(doc: dict) -> UserRolesOut:
-    return UserRolesOut.model_validate(doc)
+    return from_mongo(UserRolesOut, doc)
 
 
 async def create(payload: UserRolesCreate) -> UserRolesOut:
@@ -4,7 +4,7 @@ from bson import ObjectId
 from pymongo.errors import DuplicateKeyError
 from app.core.database import db
 from app.utils.mongo import stamp_create, stamp_update
-from app.core.security import hash_password
+from app.core.security import hash_password_async
 from app.schemas.object_id import PyObjectId
 from app.schemas.users import UserCreate, UserUpdate, UserOut
 from app.crud import carts as carts_crud
@@ -21,7 +21,7 @@ async def create(payload: UserCreate) -> UserOut:
     # hash password if provided
     pwd = data.get("password")
     if pwd:
-        data["password"] = hash_password(pwd)
+        data["password"] = await hash_password_async(pwd)
 
     try:
         res = await db[COLL].insert_one(data)
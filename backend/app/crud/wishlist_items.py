@@ -2,7 +2,7 @@ from __future__ import annotations
 from typing import List, Optional, Dict, Any
 
 from app.core.database import db
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, from_mongo
 from app.schemas.object_id import PyObjectId
 from app.schemas.wishlist_items import (
     WishlistItemsCreate,
@@ -14,7 +14,7 @@ COLL = "wishlist_items"
 
 
 def _to_out(doc: dict) -> WishlistItemsOut:
-    return WishlistItemsOut.model_validate(doc)
+    return from_mongo(WishlistItemsOut, doc)
 
 
 async def create(payload: WishlistItemsCreate) -> WishlistItemsOut:
@@ -53,7 +53,7 @@ async def update_one(_id: PyObjectId, payload: WishlistItemsUpdate) -> Optional[
     """
     Partial update. Any FK fields in payload are already real ObjectIds via PyObjectId.
     """
-    data = payload.model_dump(mode="python", exclude_none=True)
+    data = payload.model_dump(mode="python", exclude_unset=True, exclude_none=True)
     if not data:
         return None
 
@@ -3,20 +3,19 @@ from typing import List, Optional, Dict, Any
 from bson import ObjectId
 
 from app.core.database import db
-from app.utils.mongo import stamp_create, stamp_update
+from app.utils.mongo import stamp_create, stamp_update, from_mongo
 from app.schemas.object_id import PyObjectId
 from app.schemas.wishlists import WishlistsCreate, WishlistsUpdate, WishlistsOut
 
 COLL = "wishlists"
 
 def _to_out(doc: dict) -> WishlistsOut:
-    return WishlistsOut.model_validate(doc)
+    return from_mongo(WishlistsOut, doc)
 
 async def create(payload: WishlistsCreate) -> WishlistsOut:
     doc = stamp_create(payload.model_dump(mode="python"))
-    res = await db[COLL].insert_one(doc)
-    saved = await db[COLL].find_one({"_id": res.inserted_id})
-    return _to_out(saved)
+    await db[COLL].insert_one(doc)  # sets doc["_id"]; every other field is already known
+    return _to_out(doc)
 
 async def list_all(
     skip: int = 0,
@@ -47,7 +46,7 @@ async def update_one(_id: PyObjectId, payload: WishlistsUpdate) -> Optional[Wish
     except Exception:
         return None
 
-    data = {k: v for k, v in payload.model_dump(mode="python",exclude_none=True).items() if v is not None}
+    data = payload.model_dump(mode="python", exclude_unset=True, exclude_none=True)
     if not data:
         return None  # caller decides 400 vs 404
 
@@ -0,0 +1,45 @@
+# app/schemas/_partial.py  (Pydantic v2)
+from typing import Annotated, Any, Iterable, Optional
+
+from pydantic import BaseModel, Field, create_model
+
+
+def make_partial(base: type[BaseModel], name: str, *, exclude: Iterable[str] = ()) -> type[BaseModel]:
+    """
+    Build a PATCH-style model from `base` at import time.
+
+    Every field becomes Optional[...] = None while keeping its constraints
+    (min/max length, ge/le, ...) and description. The generated class derives
+    from `base`, so field validators and model_config are shared by reference
+    instead of being copy-pasted into a hand-written *Update class.
+
+    Fields named in `exclude` are still accepted but never appear in
+    model_dump(), so they cannot reach a Mongo `$set`.
+    """
+    excluded = set(exclude)
+    fields: dict[str, Any] = {}
+    for field_name, info in base.model_fields.items():
+        annotation = info.annotation
+        if info.metadata:
+            annotation = Annotated[(annotation, *info.metadata)]
+        fields[field_name] = (
+            Optional[annotation],
+            Field(default=None, description=info.description, exclude=field_name in excluded or None),
+        )
+
+    return create_model(name, __base__=base, __module__=base.__module__, **fields)
+
+
+def has_updates(payload: BaseModel) -> bool:
+    """
+    True if a PATCH model carries at least one non-None, dumpable field.
+
+    Walks only the fields the client actually set instead of materialising a
+    full model_dump() just to test for emptiness.
+    """
+    fields = type(payload).model_fields
+    return any(
+        getattr(payload, name) is not None
+        for name in payload.model_fields_set
+        if name in fields and not fields[name].exclude
+    )
@@ -3,7 +3,7 @@ from typing import Optional, Annotated
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from app.schemas.object_id import PyObjectId
 
 # ---- Enums ----
@@ -97,4 +97,10 @@ class BackupLogsOut(BackupLogsBase):
         "from_attributes": False,
         "json_encoders": {PyObjectId: str},
         "extra": "ignore",
-    }
\ No newline at end of file
+    }
+
+_BACKUP_LOGS_LIST = TypeAdapter(list[BackupLogsOut])
+
+def parse_many(docs: list[dict]) -> list[BackupLogsOut]:
+    # validate the whole batch in one pydantic-core call instead of one per document
+    return _BACKUP_LOGS_LIST.validate_python(docs)
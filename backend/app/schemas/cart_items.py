@@ -2,7 +2,7 @@
 from typing import Optional, Annotated
 from datetime import datetime
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from app.schemas.object_id import PyObjectId
 
 Qty = Annotated[int, Field(ge=1, le=1_000_000, description="Quantity must be ≥ 1")]
@@ -59,4 +59,9 @@ class CartItemsOut(CartItemsBase):
         "from_attributes": False,
         "json_encoders": {PyObjectId: str},
         "extra": "ignore",
-    }
\ No newline at end of file
+    }
+_CART_ITEMS_LIST = TypeAdapter(list[CartItemsOut])
+
+def parse_many(docs: list[dict]) -> list[CartItemsOut]:
+    # validate the whole batch in one pydantic-core call instead of one per document
+    return _CART_ITEMS_LIST.validate_python(docs)
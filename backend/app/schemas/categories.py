@@ -1,4 +1,4 @@
-from typing import Optional, Annotated
+from typing import Any, Dict, List, Optional, Annotated
 from datetime import datetime
 
 from pydantic import BaseModel, Field, field_validator
@@ -51,4 +51,28 @@ class CategoriesOut(CategoriesBase):
         "from_attributes": False,
         "json_encoders": {PyObjectId: str},
         "extra": "ignore",
-    }
\ No newline at end of file
+    }
+
+
+class CategoriesBatchIds(BaseModel):
+    ids: List[PyObjectId] = Field(min_length=1, max_length=100, description="Category ids (duplicates ignored)")
+
+    model_config = {"extra": "ignore"}
+
+
+class CategoriesBatchError(BaseModel):
+    id: str
+    status: int
+    error: str
+
+
+class CategoriesBatchOut(BaseModel):
+    items: List[CategoriesOut] = []
+    errors: List[CategoriesBatchError] = []
+
+
+class CategoriesBatchDeleteOut(BaseModel):
+    deleted: List[str] = []
+    errors: List[CategoriesBatchError] = []
+    stats: Dict[str, Any] = {}
+    file_cleanup_warnings: Optional[List[str]] = None
@@ -4,16 +4,16 @@ from datetime import datetime
 import uuid
 
 class ContactUsBase(BaseModel):
-    email: EmailStr
-    name: str = Field(..., min_length=1)
+    email: EmailStr = Field(..., max_length=255)
+    name: str = Field(..., min_length=1, max_length=255)
     message: str = Field(..., min_length=1)
 
 class ContactUsCreate(ContactUsBase):
     pass
 
 class ContactUsUpdate(BaseModel):
-    email: Optional[EmailStr]
-    name: Optional[str]
+    email: Optional[EmailStr] = Field(..., max_length=255)
+    name: Optional[str] = Field(..., max_length=255)
     message: Optional[str]
 
 class ContactUsRead(ContactUsBase):
@@ -2,24 +2,15 @@
 from typing import Optional, Annotated
 from datetime import datetime
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints
 from app.schemas.object_id import PyObjectId
 
-StatusText = Annotated[str, Field(min_length=1, max_length=120, description="Status label")]
+StatusText = Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True, min_length=1, max_length=120), Field(description="Status label")]
 
 
 class ExchangeStatusBase(BaseModel):
     status: StatusText
 
-    @field_validator("status", mode="before")
-    @classmethod
-    def _normalize_status(cls, v):
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("status must not be empty.")
-        return v
-
     model_config = {"extra": "ignore"}
 
 
@@ -30,15 +21,6 @@ class ExchangeStatusCreate(ExchangeStatusBase):
 class ExchangeStatusUpdate(BaseModel):
     status: Optional[StatusText] = None
 
-    @field_validator("status", mode="before")
-    @classmethod
-    def _normalize_status(cls, v):
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("status must not be empty when provided.")
-        return v
-
     model_config = {"extra": "ignore"}
 
 
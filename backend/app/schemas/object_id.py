@@ -5,19 +5,27 @@ from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
 class PyObjectId(ObjectId):
+    # ObjectId already keeps its 12 raw bytes in a slot; don't add a per-instance __dict__
+    __slots__ = ()
+
     @classmethod
     def __get_pydantic_core_schema__(cls, source_type, handler: GetCoreSchemaHandler):
         def validate(v: Any) -> ObjectId:
             if isinstance(v, ObjectId):
                 return v
+            if isinstance(v, bytes) and len(v) == 12:
+                return ObjectId(v)                          # raw 12-byte id, no hex parsing
             if isinstance(v, str) and ObjectId.is_valid(v):
                 return ObjectId(v)
             raise ValueError("Invalid ObjectId")
 
+        validator = core_schema.no_info_plain_validator_function(validate)
         return core_schema.json_or_python_schema(
-            json_schema=core_schema.str_schema(),           # accept strings in JSON
-            python_schema=core_schema.no_info_plain_validator_function(validate),
+            json_schema=core_schema.chain_schema(           # accept strings in JSON, hold ObjectId
+                [core_schema.str_schema(), validator]
+            ),
+            python_schema=validator,
             serialization=core_schema.plain_serializer_function_ser_schema(
                 lambda v: str(v), when_used="json"          # respond as string
             ),
-        )
\ No newline at end of file
+        )
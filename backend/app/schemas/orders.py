@@ -2,7 +2,7 @@
 from typing import Optional, Annotated, Literal
 from datetime import datetime, date
 
-from pydantic import BaseModel, Field, FutureDate, field_validator
+from pydantic import BaseModel, Field, FutureDate, TypeAdapter, field_validator
 from app.schemas.object_id import PyObjectId
 
 Money = Annotated[float, Field(ge=0, description="Order total; non-negative")]
@@ -44,3 +44,9 @@ class OrdersOut(OrdersBase):
         "json_encoders": {PyObjectId: str},
         "extra": "ignore",
     }
+
+_ORDERS_LIST = TypeAdapter(list[OrdersOut])
+
+def parse_many(docs: list[dict]) -> list[OrdersOut]:
+    # validate the whole batch in one pydantic-core call instead of one per document
+    return _ORDERS_LIST.validate_python(docs)
@@ -2,11 +2,12 @@
 from typing import Optional, Annotated
 from datetime import datetime
 
-from pydantic import BaseModel, Field, AnyUrl, TypeAdapter, field_validator
+from pydantic import BaseModel, Field, StringConstraints, AnyUrl, TypeAdapter, field_validator, ConfigDict
 from app.schemas.object_id import PyObjectId
 
 Money = Annotated[float, Field(ge=0, description="Non-negative amount")]
 ImageUrlStr = Annotated[str, Field(max_length=2048, description="Image URL as plain string")]
+ReasonText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 
 _URL = TypeAdapter(AnyUrl)  # validates http/https, localhost, ports
 
@@ -17,21 +18,11 @@ class ReturnsBase(BaseModel):
     product_id: PyObjectId
     return_status_id: PyObjectId
     user_id: PyObjectId
-    reason: Optional[str] = None
+    reason: Optional[ReasonText] = None
     image_url: Optional[ImageUrlStr] = None
     quantity: int
     amount: Optional[Money] = None
 
-    @field_validator("reason", mode="before")
-    @classmethod
-    def _normalize_reason(cls, v):
-        if isinstance(v, str):
-            v = v.strip()
-            if v == "":
-                # Treat empty string as invalid; send None to skip update
-                raise ValueError("reason must not be empty when provided.")
-        return v
-
     @field_validator("image_url", mode="before")
     @classmethod
     def _validate_image_url(cls, v):
@@ -39,7 +30,7 @@ class ReturnsBase(BaseModel):
             return v
         return str(_URL.validate_python(v))
 
-    model_config = {"extra": "ignore"}
+    model_config = ConfigDict(extra="ignore")
 
 
 class ReturnsCreate(ReturnsBase):
@@ -48,7 +39,7 @@ class ReturnsCreate(ReturnsBase):
 
 class ReturnsUpdate(BaseModel):
     return_status_id: Optional[PyObjectId] = None
-    model_config = {"extra": "ignore"}
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
 
 
 class ReturnsOut(ReturnsBase):
@@ -57,9 +48,9 @@ class ReturnsOut(ReturnsBase):
     updatedAt: datetime
     return_status: Optional[str] = None  # Populated from return_status collection
 
-    model_config = {
-        "populate_by_name": True,
-        "from_attributes": False,
-        "json_encoders": {PyObjectId: str},
-        "extra": "ignore",
-    }
\ No newline at end of file
+    model_config = ConfigDict(
+        populate_by_name=True,
+        from_attributes=False,
+        json_encoders={PyObjectId: str},
+        extra="ignore",
+    )
\ No newline at end of file
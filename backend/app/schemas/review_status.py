@@ -1,45 +1,25 @@
 # app/schemas/review_status.py
-from typing import Optional, Annotated
+from typing import Annotated
 from datetime import datetime
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints, ConfigDict
 from app.schemas.object_id import PyObjectId
+from app.schemas._partial import make_partial
 
-StatusText = Annotated[str, Field(min_length=1, max_length=120, description="Review status label")]
+StatusText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=120), Field(description="Review status label")]
 
 
 class ReviewStatusBase(BaseModel):
     status: StatusText
 
-    @field_validator("status", mode="before")
-    @classmethod
-    def _normalize_status(cls, v):
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("status must not be empty.")
-        return v
-
-    model_config = {"extra": "ignore"}
+    model_config = ConfigDict(extra="ignore")
 
 
 class ReviewStatusCreate(ReviewStatusBase):
     pass
 
 
-class ReviewStatusUpdate(BaseModel):
-    status: Optional[StatusText] = None
-
-    @field_validator("status", mode="before")
-    @classmethod
-    def _normalize_status(cls, v):
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("status must not be empty when provided.")
-        return v
-
-    model_config = {"extra": "ignore"}
+ReviewStatusUpdate = make_partial(ReviewStatusBase, "ReviewStatusUpdate")
 
 
 class ReviewStatusOut(ReviewStatusBase):
@@ -47,9 +27,9 @@ class ReviewStatusOut(ReviewStatusBase):
     createdAt: datetime
     updatedAt: datetime
 
-    model_config = {
-        "populate_by_name": True,
-        "from_attributes": False,
-        "json_encoders": {PyObjectId: str},
-        "extra": "ignore",
-    }
\ No newline at end of file
+    model_config = ConfigDict(
+        populate_by_name=True,
+        from_attributes=False,
+        json_encoders={PyObjectId: str},
+        extra="ignore",
+    )
\ No newline at end of file
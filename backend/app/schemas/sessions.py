@@ -1,5 +1,5 @@
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 
 class SessionCreate(BaseModel):
@@ -22,3 +22,4 @@ class SessionOut(BaseModel):
 
 class SessionUpdate(BaseModel):
     revokedAt: Optional[datetime] = None
+    model_config = ConfigDict(validate_assignment=False)
@@ -1,29 +1,40 @@
 # app/schemas/store_details.py
-from typing import Optional, Annotated
+from typing import Annotated
 from datetime import datetime
 import re
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints, field_validator, ConfigDict
+from app.core.config import settings
 from app.schemas.object_id import PyObjectId
+from app.schemas._partial import make_partial
 
 # -------- Constrained types --------
-NameStr     = Annotated[str, Field(min_length=1, max_length=200)]
+NameStr     = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=200)]
 PANStr      = Annotated[str, Field(min_length=10, max_length=10, description="PAN: AAAAA9999A")]
 GSTStr      = Annotated[str, Field(min_length=15, max_length=15, description="GSTIN: 22AAAAA9999A1Z5")]
-AddrStr     = Annotated[str, Field(min_length=1, max_length=400)]
-CountryStr  = Annotated[str, Field(min_length=1, max_length=120)]
-StateStr    = Annotated[str, Field(min_length=1, max_length=120)]
-CityStr     = Annotated[str, Field(min_length=1, max_length=120)]
+AddrStr     = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=400)]
+CountryStr  = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=120)]
+StateStr    = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=120)]
+CityStr     = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=120)]
 PinCode     = Annotated[int, Field(ge=100000, le=999999, description="Indian 6-digit PIN")]
 
 _PAN_RE = re.compile(r"^[A-Z]{5}\d{4}[A-Z]$")
 # GSTIN: 2 digits (state) + PAN (10) + entity code (1) + 'Z' + checksum (1)
 _GST_RE = re.compile(r"^\d{2}[A-Z]{5}\d{4}[A-Z][0-9A-Z]Z[0-9A-Z]$")
+# GSTIN checksum (position 15): base-36 values, weights alternate 1,2 over the first 14 chars
+_GST_VAL = bytes.maketrans(b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ", bytes(range(36)))
+_GST_WEIGHTS = (1, 2) * 7
 
 def _clean_upper_alnum(s: str) -> str:
     # remove spaces/dashes/underscores, uppercase
     return re.sub(r"[\s\-_]", "", s).upper()
 
+def _gst_checksum_ok(s: str) -> bool:
+    # s must already match _GST_RE (15 ASCII chars from the base-36 alphabet)
+    vals = s.encode("ascii").translate(_GST_VAL)
+    total = sum(sum(divmod(v * w, 36)) for v, w in zip(vals[:14], _GST_WEIGHTS))
+    return (36 - total % 36) % 36 == vals[14]
+
 class StoreDetailsBase(BaseModel):
     name: NameStr
     pan_no: PANStr
@@ -35,15 +46,6 @@ class StoreDetailsBase(BaseModel):
     city: CityStr
 
     # ---- Normalizers / validators ----
-    @field_validator("name", "address", "country", "state", "city", mode="before")
-    @classmethod
-    def _trim_nonempty(cls, v):
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("Field must not be empty.")
-        return v
-
     @field_validator("pan_no", mode="before")
     @classmethod
     def _validate_pan(cls, v: str):
@@ -62,55 +64,18 @@ class StoreDetailsBase(BaseModel):
         s = _clean_upper_alnum(v)
         if not _GST_RE.fullmatch(s):
             raise ValueError("Invalid GSTIN format. Expected 22AAAAA9999A1Z5 pattern.")
+        if settings.GST_VERIFY_CHECKSUM and not _gst_checksum_ok(s):
+            raise ValueError("Invalid GSTIN checksum.")
         return s
 
-    model_config = {"extra": "ignore"}
+    model_config = ConfigDict(extra="ignore")
 
 
 class StoreDetailsCreate(StoreDetailsBase):
     pass
 
 
-class StoreDetailsUpdate(BaseModel):
-    name: Optional[NameStr] = None
-    pan_no: Optional[PANStr] = None
-    gst_no: Optional[GSTStr] = None
-    address: Optional[AddrStr] = None
-    postal_code: Optional[PinCode] = None
-    country: Optional[CountryStr] = None
-    state: Optional[StateStr] = None
-    city: Optional[CityStr] = None
-
-    @field_validator("name", "address", "country", "state", "city", mode="before")
-    @classmethod
-    def _trim_nonempty(cls, v):
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("Field must not be empty when provided.")
-        return v
-
-    @field_validator("pan_no", mode="before")
-    @classmethod
-    def _validate_pan(cls, v: Optional[str]):
-        if v is None:
-            return v
-        s = _clean_upper_alnum(v)
-        if not _PAN_RE.fullmatch(s):
-            raise ValueError("Invalid PAN format. Expected AAAAA9999A.")
-        return s
-
-    @field_validator("gst_no", mode="before")
-    @classmethod
-    def _validate_gst(cls, v: Optional[str]):
-        if v is None:
-            return v
-        s = _clean_upper_alnum(v)
-        if not _GST_RE.fullmatch(s):
-            raise ValueError("Invalid GSTIN format. Expected 22AAAAA9999A1Z5 pattern.")
-        return s
-
-    model_config = {"extra": "ignore"}
+StoreDetailsUpdate = make_partial(StoreDetailsBase, "StoreDetailsUpdate")
 
 
 class StoreDetailsOut(StoreDetailsBase):
@@ -118,9 +83,9 @@ class StoreDetailsOut(StoreDetailsBase):
     createdAt: datetime
     updatedAt: datetime
 
-    model_config = {
-        "populate_by_name": True,
-        "from_attributes": False,
-        "json_encoders": {PyObjectId: str},
-        "extra": "ignore",
-    }
\ No newline at end of file
+    model_config = ConfigDict(
+        populate_by_name=True,
+        from_attributes=False,
+        json_encoders={PyObjectId: str},
+        extra="ignore",
+    )
\ No newline at end of file
@@ -1,13 +1,14 @@
 # app/schemas/testimonials.py
-from typing import Optional, Annotated
+from typing import Annotated
 from datetime import datetime
 
-from pydantic import BaseModel, Field, AnyUrl, TypeAdapter, field_validator
+from pydantic import BaseModel, Field, StringConstraints, AnyUrl, TypeAdapter, field_validator, ConfigDict
 from app.schemas.object_id import PyObjectId
+from app.schemas._partial import make_partial
 
 Idx = Annotated[int, Field(ge=0, le=1_000_000, description="Display order; non-negative.")]
 ImageStr = Annotated[str, Field(max_length=2048, description="Image URL as plain string.")]
-Description = Annotated[str, Field(min_length=1, max_length=2000, description="Non-empty, up to 2000 chars.")]
+Description = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=2000), Field(description="Non-empty, up to 2000 chars.")]
 
 _URL = TypeAdapter(AnyUrl)  # accepts http/https, localhost, ports
 
@@ -17,49 +18,21 @@ class TestimonialsBase(BaseModel):
     image_url: ImageStr
     description: Description
 
-    @field_validator("description", mode="before")
-    @classmethod
-    def _normalize_desc(cls, v):
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("description must not be empty.")
-        return v
-
     @field_validator("image_url", mode="before")
     @classmethod
     def _validate_image_url(cls, v):
+        if v is None:
+            return v
         return str(_URL.validate_python(v))  # validate then store as str (Mongo-safe)
 
-    model_config = {"extra": "ignore"}
+    model_config = ConfigDict(extra="ignore")
 
 
 class TestimonialsCreate(TestimonialsBase):
     pass
 
 
-class TestimonialsUpdate(BaseModel):
-    idx: Optional[Idx] = None
-    image_url: Optional[ImageStr] = None
-    description: Optional[Description] = None
-
-    @field_validator("description", mode="before")
-    @classmethod
-    def _normalize_desc(cls, v):
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("description must not be empty when provided.")
-        return v
-
-    @field_validator("image_url", mode="before")
-    @classmethod
-    def _validate_image_url(cls, v):
-        if v is None:
-            return v
-        return str(_URL.validate_python(v))
-
-    model_config = {"extra": "ignore"}
+TestimonialsUpdate = make_partial(TestimonialsBase, "TestimonialsUpdate")
 
 
 class TestimonialsOut(TestimonialsBase):
@@ -67,9 +40,9 @@ class TestimonialsOut(TestimonialsBase):
     createdAt: datetime
     updatedAt: datetime
 
-    model_config = {
-        "populate_by_name": True,
-        "from_attributes": False,
-        "json_encoders": {PyObjectId: str},
-        "extra": "ignore",
-    }
\ No newline at end of file
+    model_config = ConfigDict(
+        populate_by_name=True,
+        from_attributes=False,
+        json_encoders={PyObjectId: str},
+        extra="ignore",
+    )
\ No newline at end of file
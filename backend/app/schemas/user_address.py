@@ -4,14 +4,14 @@ from typing import Optional, Annotated
 from datetime import datetime
 import re
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints, field_validator, ConfigDict
 from app.schemas.object_id import PyObjectId
 
 # ---- Constrained types ----
 MobileStr = Annotated[str, Field(min_length=10, max_length=10, description="10-digit mobile number")]
 PinCode   = Annotated[int, Field(ge=100000, le=999999, description="Indian 6-digit PIN")]
-Text120   = Annotated[str, Field(min_length=1, max_length=120)]
-AddrStr   = Annotated[str, Field(min_length=1, max_length=400)]
+Text120   = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=120)]
+AddrStr   = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=400)]
 
 _MOBILE_RE = re.compile(r"^[6-9]\d{9}$")
 
@@ -24,15 +24,6 @@ class UserAddressBase(BaseModel):
     city: Text120
     address: AddrStr
 
-    @field_validator("country", "state", "city", "address", mode="before")
-    @classmethod
-    def _trim_text(cls, v):
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("Field must not be empty.")
-        return v
-
     @field_validator("mobile_no", mode="before")
     @classmethod
     def _validate_mobile(cls, v: str):
@@ -43,7 +34,7 @@ class UserAddressBase(BaseModel):
             return s
         return v
 
-    model_config = {"extra": "ignore"}
+    model_config = ConfigDict(extra="ignore")
 
 class UserAddressEntry(BaseModel):
     mobile_no: MobileStr
@@ -65,15 +56,6 @@ class UserAddressUpdate(BaseModel):
     city: Optional[Text120] = None
     address: Optional[AddrStr] = None
 
-    @field_validator("country", "state", "city", "address", mode="before")
-    @classmethod
-    def _trim_text(cls, v):
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("Field must not be empty when provided.")
-        return v
-
     @field_validator("mobile_no", mode="before")
     @classmethod
     def _validate_mobile(cls, v: Optional[str]):
@@ -84,7 +66,7 @@ class UserAddressUpdate(BaseModel):
             raise ValueError("mobile_no must be a valid 10-digit Indian mobile (starts 6–9).")
         return s
 
-    model_config = {"extra": "ignore"}
+    model_config = ConfigDict(extra="ignore")
 
 
 class UserAddressOut(UserAddressBase):
@@ -92,9 +74,9 @@ class UserAddressOut(UserAddressBase):
     createdAt: datetime
     updatedAt: datetime
 
-    model_config = {
-        "populate_by_name": True,          # _id <-> id aliasing
-        "from_attributes": False,          # validate raw Mongo dicts
-        "json_encoders": {PyObjectId: str},
-        "extra": "ignore",
-    }
\ No newline at end of file
+    model_config = ConfigDict(
+        populate_by_name=True,          # _id <-> id aliasing
+        from_attributes=False,          # validate raw Mongo dicts
+        json_encoders={PyObjectId: str},
+        extra="ignore",
+    )
\ No newline at end of file
@@ -3,8 +3,9 @@ from __future__ import annotations
 from typing import Optional, Annotated
 from datetime import datetime
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, ConfigDict
 from app.schemas.object_id import PyObjectId
+from app.schemas._partial import make_partial
 
 Rating = Annotated[float, Field(ge=0, le=5, description="Star rating from 0 to 5")]
 
@@ -13,7 +14,7 @@ class UserRatingsBase(BaseModel):
     user_id: PyObjectId
     rating: Optional[Rating] = None  # keep optional as in your original
 
-    model_config = {"extra": "ignore"}
+    model_config = ConfigDict(extra="ignore")
 
 
 class UserRatingsCreate(UserRatingsBase):
@@ -22,12 +23,8 @@ class UserRatingsCreate(UserRatingsBase):
     # rating: Rating
 
 
-class UserRatingsUpdate(BaseModel):
-    product_id: Optional[PyObjectId] = None
-    user_id: Optional[PyObjectId] = None
-    rating: Optional[Rating] = None
-
-    model_config = {"extra": "ignore"}
+# product_id/user_id identify the rating and are dropped from the $set document
+UserRatingsUpdate = make_partial(UserRatingsBase, "UserRatingsUpdate", exclude=("product_id", "user_id"))
 
 
 class UserRatingsOut(UserRatingsBase):
@@ -35,9 +32,9 @@ class UserRatingsOut(UserRatingsBase):
     createdAt: datetime
     updatedAt: datetime
 
-    model_config = {
-        "populate_by_name": True,          # _id <-> id aliasing
-        "from_attributes": False,          # validate raw Mongo dicts
-        "json_encoders": {PyObjectId: str},
-        "extra": "ignore",
-    }
\ No newline at end of file
+    model_config = ConfigDict(
+        populate_by_name=True,          # _id <-> id aliasing
+        from_attributes=False,          # validate raw Mongo dicts
+        json_encoders={PyObjectId: str},
+        extra="ignore",
+    )
\ No newline at end of file
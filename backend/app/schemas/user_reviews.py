@@ -2,11 +2,12 @@
 from typing import Optional, Annotated
 from datetime import datetime
 
-from pydantic import BaseModel, Field, AnyUrl, TypeAdapter, field_validator
+from pydantic import BaseModel, Field, StringConstraints, AnyUrl, TypeAdapter, field_validator, ConfigDict
 from app.schemas.object_id import PyObjectId
+from app.schemas._partial import make_partial
 
 # Reusable constrained types
-ReviewText = Annotated[str, Field(min_length=1, max_length=4000, description="Review text")]
+ReviewText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=4000), Field(description="Review text")]
 ImageUrlStr = Annotated[str, Field(max_length=2048, description="Image URL as plain string")]
 
 _URL = TypeAdapter(AnyUrl)  # validates http/https, localhost, custom ports, etc.
@@ -26,47 +27,14 @@ class UserReviewsBase(BaseModel):
             return v
         return str(_URL.validate_python(v))
 
-    @field_validator("review", mode="before")
-    @classmethod
-    def _normalize_review(cls, v):
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                # Empty string after trimming should be rejected; use None to skip updating
-                raise ValueError("review must not be empty when provided.")
-        return v
-
-    model_config = {"extra": "ignore"}
+    model_config = ConfigDict(extra="ignore")
 
 
 class UserReviewsCreate(UserReviewsBase):
     pass
 
 
-class UserReviewsUpdate(BaseModel):
-    product_id: Optional[PyObjectId] = None
-    user_id: Optional[PyObjectId] = None
-    review_status_id: Optional[PyObjectId] = None
-    image_url: Optional[ImageUrlStr] = None
-    review: Optional[ReviewText] = None
-
-    @field_validator("image_url", mode="before")
-    @classmethod
-    def _validate_image_url(cls, v):
-        if v is None:
-            return v
-        return str(_URL.validate_python(v))
-
-    @field_validator("review", mode="before")
-    @classmethod
-    def _normalize_review(cls, v):
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("review must not be empty when provided.")
-        return v
-
-    model_config = {"extra": "ignore"}
+UserReviewsUpdate = make_partial(UserReviewsBase, "UserReviewsUpdate")
 
 
 class UserReviewsOut(UserReviewsBase):
@@ -74,9 +42,9 @@ class UserReviewsOut(UserReviewsBase):
     createdAt: datetime
     updatedAt: datetime
 
-    model_config = {
-        "populate_by_name": True,
-        "from_attributes": False,
-        "json_encoders": {PyObjectId: str},
-        "extra": "ignore",
-    }
\ No newline at end of file
+    model_config = ConfigDict(
+        populate_by_name=True,
+        from_attributes=False,
+        json_encoders={PyObjectId: str},
+        extra="ignore",
+    )
\ No newline at end of file
@@ -1,28 +1,24 @@
 # app/schemas/wishlist_items.py
 from __future__ import annotations
 from datetime import datetime
-from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from app.schemas.object_id import PyObjectId
+from app.schemas._partial import make_partial
 
 
 class WishlistItemsBase(BaseModel):
     wishlist_id: PyObjectId   # FK -> wishlists._id
     product_id: PyObjectId    # FK -> products._id
 
-    model_config = {"extra": "ignore"}
+    model_config = ConfigDict(extra="ignore")
 
 
 class WishlistItemsCreate(WishlistItemsBase):
     pass
 
 
-class WishlistItemsUpdate(BaseModel):
-    wishlist_id: Optional[PyObjectId] = None
-    product_id: Optional[PyObjectId] = None
-
-    model_config = {"extra": "ignore"}
+WishlistItemsUpdate = make_partial(WishlistItemsBase, "WishlistItemsUpdate")
 
 
 class WishlistItemsOut(WishlistItemsBase):
@@ -30,9 +26,9 @@ class WishlistItemsOut(WishlistItemsBase):
     createdAt: datetime
     updatedAt: datetime
 
-    model_config = {
-        "populate_by_name": True,
-        "from_attributes": False,
-        "json_encoders": {PyObjectId: str},
-        "extra": "ignore",
-    }
\ No newline at end of file
+    model_config = ConfigDict(
+        populate_by_name=True,
+        from_attributes=False,
+        json_encoders={PyObjectId: str},
+        extra="ignore",
+    )
\ No newline at end of file
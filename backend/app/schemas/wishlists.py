@@ -1,26 +1,23 @@
 # app/schemas/wishlists.py
 from __future__ import annotations
 from datetime import datetime
-from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from app.schemas.object_id import PyObjectId
+from app.schemas._partial import make_partial
 
 
 class WishlistsBase(BaseModel):
     user_id: PyObjectId   # FK -> users._id
 
-    model_config = {"extra": "ignore"}
+    model_config = ConfigDict(extra="ignore")
 
 
 class WishlistsCreate(WishlistsBase):
     pass
 
 
-class WishlistsUpdate(BaseModel):
-    user_id: Optional[PyObjectId] = None
-
-    model_config = {"extra": "ignore"}
+WishlistsUpdate = make_partial(WishlistsBase, "WishlistsUpdate")
 
 
 class WishlistsOut(WishlistsBase):
@@ -28,9 +25,9 @@ class WishlistsOut(WishlistsBase):
     createdAt: datetime
     updatedAt: datetime
 
-    model_config = {
-        "populate_by_name": True,          # _id <-> id aliasing
-        "from_attributes": False,          # validate raw Mongo dicts
-        "json_encoders": {PyObjectId: str},
-        "extra": "ignore",
-    }
\ No newline at end of file
+    model_config = ConfigDict(
+        populate_by_name=True,          # _id <-> id aliasing
+        from_attributes=False,          # validate raw Mongo dicts
+        json_encoders={PyObjectId: str},
+        extra="ignore",
+    )
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Short-TTL response cache for dashboard reads.
+
+Admins refreshing the dashboard within seconds of each other should share one
+set of aggregations. Results are stored in Redis under
+`dashboard:{gen}:{fn}:{args}`; if Redis is unreachable an in-process TTL dict
+is used instead. Order/return/exchange writes call `invalidate_dashboard_cache`,
+which bumps `gen` so every cached result is retired at once (old keys just
+expire) and pending counts don't lag behind a fresh write for a full TTL.
+"""
+
+from __future__ import annotations
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import orjson
+
+from app.core.config import settings
+from app.core.redis import get_redis, _dashboard_gen_key, _dashboard_key
+
+_LOCAL: Dict[str, Tuple[float, Any]] = {}
+
+
+async def _generation(redis) -> Optional[str]:
+    """
+    Current dashboard generation. A missing counter (fresh or flushed Redis)
+    is seeded from the clock so generations never repeat.
+    """
+    gen = await redis.get(_dashboard_gen_key())
+    if gen is None:
+        await redis.set(_dashboard_gen_key(), time.time_ns(), nx=True)
+        gen = await redis.get(_dashboard_gen_key())
+    return gen
+
+
+def dashboard_cached(ttl: int = settings.DASHBOARD_CACHE_TTL_SECONDS):
+    """Cache an async dashboard function's JSON-able result for `ttl` seconds."""
+
+    def decorator(fn: Callable[..., Awaitable[Any]]):
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                redis = await get_redis()
+                key = _dashboard_key(await _generation(redis), fn.__name__, *args, *kwargs.values())
+                raw = await redis.get(key)
+            except Exception:
+                redis = None
+                key = _dashboard_key("local", fn.__name__, *args, *kwargs.values())
+            else:
+                if raw is not None:
+                    return orjson.loads(raw)
+
+            if redis is None:
+                hit = _LOCAL.get(key)
+                if hit and hit[0] > time.monotonic():
+                    return hit[1]
+
+            value = await fn(*args, **kwargs)
+
+            if redis is not None:
+                try:
+                    await redis.setex(key, ttl, orjson.dumps(value))
+                    return value
+                except Exception:
+                    pass
+                key = _dashboard_key("local", fn.__name__, *args, *kwargs.values())
+            _LOCAL[key] = (time.monotonic() + ttl, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+async def invalidate_dashboard_cache() -> None:
+    """
+    Retire every cached dashboard result by bumping the generation embedded in
+    the keys (one pipelined round trip; no key scan). The in-process fallback
+    is only used while Redis is down and is cleared here for this worker;
+    other workers' entries age out with their TTL.
+    """
+    _LOCAL.clear()
+    try:
+        redis = await get_redis()
+        pipe = redis.pipeline(transaction=False)
+        pipe.set(_dashboard_gen_key(), time.time_ns(), nx=True)  # seed like _generation
+        pipe.incr(_dashboard_gen_key())
+        await pipe.execute()
+    except Exception:
+        pass
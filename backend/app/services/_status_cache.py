@@ -0,0 +1,58 @@
+"""
+Short-lived in-process cache for status lookups (order/return/exchange).
+
+The *_status collections are tiny and practically static, but dashboard
+queries translate status names to ids on every hit. Results are kept per
+(collection, names) for about `ttl` seconds (±10% jitter so entries don't
+all expire together); a per-key lock makes concurrent misses share one query.
+Status write services call `clear` so this worker picks up changes at once.
+"""
+
+from __future__ import annotations
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from bson import ObjectId
+from app.core.database import db
+
+_Entry = Tuple[float, List[ObjectId], Dict[str, str]]
+
+# names=None (every status) is keyed as None, distinct from an empty tuple
+_Key = Tuple[str, Optional[Tuple[str, ...]]]
+
+_CACHE: Dict[_Key, _Entry] = {}
+_LOCKS: Dict[_Key, asyncio.Lock] = {}
+
+
+async def get_status_ids(
+    coll_name: str, names: Optional[Sequence[str]] = None, ttl: float = 60.0
+) -> Tuple[List[ObjectId], Dict[str, str]]:
+    """
+    Return (ids, {str(_id): status}) for statuses in `coll_name` whose name
+    is one of `names` (all statuses when names is None). Stored names are
+    lower-case (see scripts/seed.py), so this is an exact, indexed $in.
+    """
+    key = (coll_name, tuple(names) if names is not None else None)
+    hit = _CACHE.get(key)
+    if hit and hit[0] > time.monotonic():
+        return hit[1], hit[2]
+
+    async with _LOCKS.setdefault(key, asyncio.Lock()):
+        hit = _CACHE.get(key)
+        if hit and hit[0] > time.monotonic():
+            return hit[1], hit[2]
+
+        query = {"status": {"$in": list(names)}} if names is not None else {}
+        docs = await db[coll_name].find(query, {"_id": 1, "status": 1}).to_list(None)
+        ids = [d["_id"] for d in docs]
+        labels = {str(d["_id"]): d.get("status") for d in docs}
+        _CACHE[key] = (time.monotonic() + ttl * random.uniform(0.9, 1.1), ids, labels)
+        return ids, labels
+
+
+def clear(coll_name: str) -> None:
+    """Drop every cached lookup for `coll_name` (call after writes to it)."""
+    for key in [k for k in _CACHE if k[0] == coll_name]:
+        _CACHE.pop(key, None)
@@ -6,11 +6,12 @@ from fastapi.responses import JSONResponse
 
 from app.schemas.object_id import PyObjectId
 from app.schemas.about import AboutCreate, AboutUpdate
+from app.schemas._partial import has_updates
 from app.crud import about as crud
 from app.utils.gridfs import (
     upload_image,
-    replace_image,
     delete_image,
+    delete_image_later,
     _extract_file_id_from_url,
 )
 
@@ -111,33 +112,34 @@ async def update_item_service(
             500 – DB or file failure
     """
     try:
-        current = await crud.get_one(item_id)
-        if not current:
-            raise HTTPException(status_code=404, detail="About not found")
-
         patch_data: dict = {}
         if idx is not None:
             patch_data["idx"] = idx
         if description is not None:
             patch_data["description"] = description
 
-        # Replace or add new image
-        if image is not None:
-            old_id = _extract_file_id_from_url(current.image_url)
-            if old_id:
-                _, new_url = await replace_image(old_id, image)
-            else:
-                _, new_url = await upload_image(image)
-            patch_data["image_url"] = new_url
-
-        patch = AboutUpdate(**patch_data)
-
-        if not any(v is not None for v in patch.model_dump().values()):
-            raise HTTPException(status_code=400, detail="No fields provided for update")
-
-        updated = await crud.update_one(item_id, patch)
-        if not updated:
+        if image is None:
+            patch = AboutUpdate(**patch_data)
+            if not has_updates(patch):
+                raise HTTPException(status_code=400, detail="No fields provided for update")
+
+            updated = await crud.update_one(item_id, patch)
+            if not updated:
+                raise HTTPException(status_code=404, detail="About not found")
+            return updated
+
+        # Upload first, then swap the URL in and learn the old one in the same write
+        new_id, new_url = await upload_image(image)
+        patch_data["image_url"] = new_url
+        result = await crud.update_with_previous(item_id, AboutUpdate(**patch_data))
+        if not result:
+            await delete_image(new_id)
             raise HTTPException(status_code=404, detail="About not found")
+
+        previous, updated = result
+        old_id = _extract_file_id_from_url(previous.image_url)
+        if old_id and old_id != new_id:
+            delete_image_later(old_id)
         return updated
 
     except HTTPException:
@@ -164,17 +166,11 @@ async def delete_item_service(item_id: PyObjectId):
             500 – DB or delete error
     """
     try:
-        current = await crud.get_one(item_id)
-        if not current:
+        deleted = await crud.delete_and_return(item_id)
+        if not deleted:
             raise HTTPException(status_code=404, detail="About not found")
 
-        file_id = _extract_file_id_from_url(current.image_url)
-        if file_id:
-            await delete_image(file_id)
-
-        ok = await crud.delete_one(item_id)
-        if not ok:
-            raise HTTPException(status_code=404, detail="About not found")
+        delete_image_later(_extract_file_id_from_url(deleted.image_url))
 
         return JSONResponse(status_code=200, content={"deleted": True})
 
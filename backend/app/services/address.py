@@ -1,6 +1,28 @@
 from fastapi import HTTPException
 import httpx
-from typing import Dict
+import json
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.core.http import get_postal_client
+from app.core.redis import get_redis, _pincode_key
+
+
+async def _get_cached_location(pincode: int) -> Optional[str]:
+    try:
+        redis = await get_redis()
+        return await redis.get(_pincode_key(pincode))
+    except Exception:
+        return None  # cache is best-effort; fall through to the API
+
+
+async def _cache_location(pincode: int, ttl: int, value: Optional[Dict]) -> None:
+    try:
+        redis = await get_redis()
+        await redis.setex(_pincode_key(pincode), ttl, json.dumps(value))
+    except Exception:
+        pass
+
 
 async def get_location_service(pincode: int) -> Dict:
     """
@@ -22,13 +44,20 @@ async def get_location_service(pincode: int) -> Dict:
             500 – If external postal API fails or cannot be reached.
             404 – If API returns no data for given pincode.
     """
-    if pincode < 100000 or pincode > 999999:
+    if not (100000 <= pincode <= 999999):
         raise HTTPException(status_code=422, detail="Invalid Pincode")
 
-    url = f"https://api.postalpincode.in/pincode/{pincode}"
+    cached = await _get_cached_location(pincode)
+    if cached is not None:
+        location = json.loads(cached)
+        if location is None:
+            raise HTTPException(status_code=404, detail="Invalid PIN code or data not found")
+        return location
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
+    try:
+        response = await get_postal_client().get(f"/pincode/{pincode}")
+    except httpx.HTTPError:
+        raise HTTPException(status_code=500, detail="Failed to fetch data from postal API")
 
     if response.status_code != 200:
         raise HTTPException(status_code=500, detail="Failed to fetch data from postal API")
@@ -37,6 +66,7 @@ async def get_location_service(pincode: int) -> Dict:
 
     # API returns a list with one element
     if not data or data[0]["Status"] != "Success":
+        await _cache_location(pincode, settings.PINCODE_NEGATIVE_CACHE_TTL_SECONDS, None)
         raise HTTPException(status_code=404, detail="Invalid PIN code or data not found")
 
     post_office = data[0]["PostOffice"][0]
@@ -44,9 +74,11 @@ async def get_location_service(pincode: int) -> Dict:
     state = post_office.get("State")
     country = post_office.get("Country")
 
-    return {
+    location = {
         "pincode": pincode,
         "city": city,
         "state": state,
         "country": country
-    }
\ No newline at end of file
+    }
+    await _cache_location(pincode, settings.PINCODE_CACHE_TTL_SECONDS, location)
+    return location
\ No newline at end of file
@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime, timezone
-import random
+import asyncio
+import secrets
 
 from bson import ObjectId
-from fastapi import HTTPException, Depends, status, Request, Response
+from fastapi import BackgroundTasks, HTTPException, Depends, status, Request, Response
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
@@ -13,18 +14,19 @@ from app.core.database import db
 from app.core.security import (
     create_access_token,
     create_refresh_token,
-    verify_password,
     hash_password,
+    verify_password_async,
+    hash_password_async,
     decode_access_token,
     decode_refresh_token,
 )
 from app.core.config import settings
 from app.api.deps import get_current_user
-from app.utils.tokens import hash_refresh
+from app.utils.tokens import hash_refresh, hash_otp
 from app.crud.sessions import (
     create_session,
     get_by_refresh_hash,
-    revoke_session_by_jti,
+    revoke_and_record,
 )
 from app.crud.token_revocations import add_revocation, is_revoked
 from app.crud import users as crud
@@ -52,6 +54,15 @@ from app.schemas.logs import LoginLogCreate, LogoutLogCreate, RegisterLogCreate
 # Helpers
 # -------------------------------------------------
 
+async def _write_log(writer, payload, background: Optional[BackgroundTasks], session: Optional[AsyncSession]) -> None:
+    """Defer an audit-log write until after the response when a task queue is given."""
+    if background is not None:
+        # the request-scoped session is closed by then; the writer opens its own
+        background.add_task(writer, payload)
+        return
+    await writer(payload, session=session)
+
+
 def _unix_to_dt(ts: int) -> datetime:
     """Convert UNIX timestamp to timezone-aware UTC datetime."""
     return datetime.fromtimestamp(ts, tz=timezone.utc)
@@ -80,15 +91,56 @@ def _clear_refresh_cookie(response: Response) -> None:
     )
 
 
-# ---------- Compensation helpers ----------
+# Projections: only pull the fields each auth path actually reads
+_LOGIN_USER_FIELDS = {
+    "_id": 1, "password": 1, "first_name": 1, "last_name": 1, "email": 1,
+    "role_id": 1, "user_status_id": 1,
+}
+_LOG_USER_FIELDS = {"_id": 1, "first_name": 1, "last_name": 1, "email": 1}
+_ID_ONLY = {"_id": 1}
+
+# Verified against on the "user not found" path so it costs the same bcrypt work as a real check
+_DUMMY_HASH = hash_password("not-a-real-password")
+
+# OTP check + attempt accounting in one atomic Redis round-trip.
+# KEYS: otp, attempts   ARGV: HMAC of submitted otp, attempts TTL, max attempts
+# A matching OTP is consumed immediately so it cannot be replayed concurrently.
+_OTP_VERIFY_LUA = """
+local stored = redis.call('GET', KEYS[1])
+if not stored then
+    return 'missing'
+end
+if stored == ARGV[1] then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return 'ok'
+end
+local n = redis.call('INCR', KEYS[2])
+if n == 1 then
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+end
+if n >= tonumber(ARGV[3]) then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return 'locked'
+end
+return 'bad'
+"""
+
+# Default role/status ids never change at runtime; resolve each once per process
+_default_ref_ids: Dict[str, ObjectId] = {}
+
+
+async def _get_default_ref_id(collection: str, field: str, value: str) -> Optional[ObjectId]:
+    """Return the _id of a seeded lookup document (e.g. role 'user'), cached in-process."""
+    key = f"{collection}:{value}"
+    oid = _default_ref_ids.get(key)
+    if oid is None:
+        doc = await db[collection].find_one({field: value}, _ID_ONLY)
+        if doc:
+            oid = _default_ref_ids[key] = doc["_id"]
+    return oid
 
-async def _restore_last_login(user_id: ObjectId, old_value: Optional[datetime]):
-    """Restore last_login to the previous value (or unset if None)."""
-    if old_value is None:
-        await db["users"].update_one({"_id": user_id}, {"$unset": {"last_login": ""}})
-    else:
-        await db["users"].update_one({"_id": user_id}, {"$set": {"last_login": old_value}})
 
+# ---------- Compensation helpers ----------
 
 async def _delete_user_safely(user_id: ObjectId):
     """Delete a newly created user (register compensation)."""
@@ -114,114 +166,122 @@ async def login_service(
     request: Request,
     body: LoginIn,
     session: AsyncSession | None = None,
+    background: BackgroundTasks | None = None,
 ) -> LoginResponse:
     """
-    Authenticate a user; if any step after bumping last_login fails,
-    restore the original last_login (logical transaction).
+    Authenticate a user. The last_login bump and the refresh-session insert
+    commit together in one Mongo transaction, so a failure leaves neither.
     """
     try:
         email = body.email
-        user = await db["users"].find_one({"email": email})
+        user = await db["users"].find_one({"email": email}, _LOGIN_USER_FIELDS)
         if not user:
+            await verify_password_async(body.password, _DUMMY_HASH)
             raise HTTPException(status.HTTP_404_NOT_FOUND, "User not found")
-        elif not verify_password(body.password, user.get("password", "")):
+        elif not await verify_password_async(body.password, user.get("password", "")):
             raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid credentials")
 
-        user_status = await db["user_status"].find_one({"status": "blocked"})
-        if str(user["user_status_id"]) == str(user_status["_id"]):
-            raise HTTPException(status.HTTP_403_FORBIDDEN, "User account is suspended")
-
-        # Capture previous last_login for compensation
-        prev_last_login: Optional[datetime] = user.get("last_login")
-
-        # Update last login timestamp
-        await db["users"].update_one(
-            {"_id": user["_id"]},
-            {"$set": {"last_login": datetime.now(timezone.utc)}},
+        # Independent lookups once the user is known: overlap the round-trips
+        user_oid = ObjectId(user["_id"])
+        user_status, wishlist, cart, role = await asyncio.gather(
+            db["user_status"].find_one({"status": "blocked"}, _ID_ONLY),
+            db["wishlists"].find_one({"user_id": user_oid}, _ID_ONLY),
+            db["carts"].find_one({"user_id": user_oid}, _ID_ONLY),
+            db["user_roles"].find_one({"_id": ObjectId(user["role_id"])}, {"role": 1}),
         )
+        if user_status and str(user["user_status_id"]) == str(user_status["_id"]):
+            raise HTTPException(status.HTTP_403_FORBIDDEN, "User account is suspended")
 
-        try:
-            # Find or create wishlist for the user
-            wishlist = await db["wishlists"].find_one({"user_id": ObjectId(user["_id"])})
-            if not wishlist:
-                # Auto-create wishlist for existing users who registered before this fix
-                new_wishlist = await wishlists_crud.create(WishlistsCreate(user_id=str(user["_id"])))
-                wishlist = await db["wishlists"].find_one({"_id": ObjectId(str(new_wishlist.id))})
-            
-            # Find or create cart for the user
-            cart = await db["carts"].find_one({"user_id": ObjectId(user["_id"])})
-            if not cart:
-                # Auto-create cart for existing users who registered before this fix
-                new_cart = await carts_crud.create(CartsCreate(user_id=str(user["_id"])))
-                cart = await db["carts"].find_one({"_id": ObjectId(str(new_cart.id))})
-            
-            role = await db["user_roles"].find_one({"_id": ObjectId(user["role_id"])})
-            
-            payload = {
-                "user_id": str(user["_id"]),
-                "user_role_id": str(user["role_id"]),
-                "user_role": role.get("role") if role else None,
-                "wishlist_id": str(wishlist["_id"]) if wishlist else None,
-                "cart_id": str(cart["_id"]) if cart else None,
-                "type": "access_payload",
-            }
-
-            at = create_access_token(payload)
-            rt = create_refresh_token(
-                {
-                    "user_id": payload["user_id"],
-                    "user_role_id": payload["user_role_id"],
-                    "user_role": payload.get("user_role"),
-                    "wishlist_id": payload["wishlist_id"],
-                    "cart_id": payload["cart_id"],
-                }
-            )
+        # Create wishlist if missing
+        if not wishlist:
+            # Auto-create wishlist for existing users who registered before this fix
+            new_wishlist = await wishlists_crud.create(WishlistsCreate(user_id=str(user["_id"])))
+            wishlist = {"_id": new_wishlist.id}
+
+        # Create cart if missing
+        if not cart:
+            # Auto-create cart for existing users who registered before this fix
+            new_cart = await carts_crud.create(CartsCreate(user_id=str(user["_id"])))
+            cart = {"_id": new_cart.id}
+
+        payload = {
+            "user_id": str(user["_id"]),
+            "user_role_id": str(user["role_id"]),
+            "user_role": role.get("role") if role else None,
+            "wishlist_id": str(wishlist["_id"]) if wishlist else None,
+            "cart_id": str(cart["_id"]) if cart else None,
+            # identity claims let logout write its log without a users lookup
+            "first_name": user.get("first_name", ""),
+            "last_name": user.get("last_name", ""),
+            "email": user.get("email", ""),
+            "type": "access_payload",
+        }
 
-            # Create session record (DB for refresh tokens)
-            sess = {
+        at = create_access_token(payload)
+        rt = create_refresh_token(
+            {
                 "user_id": payload["user_id"],
-                "jti": rt["jti"],
-                "refresh_hash": hash_refresh(rt["token"]),
-                "exp": _unix_to_dt(rt["exp"]),
-                "ip": request.client.host if request.client else None,
-                "user_agent": request.headers.get("user-agent"),
+                "user_role_id": payload["user_role_id"],
+                "user_role": payload.get("user_role"),
+                "wishlist_id": payload["wishlist_id"],
+                "cart_id": payload["cart_id"],
+                "first_name": payload["first_name"],
+                "last_name": payload["last_name"],
+                "email": payload["email"],
             }
-            await create_session(sess)
-
-            _set_refresh_cookie(response, rt["token"], rt["exp"])
+        )
 
-            # Write login log
-            await write_login_log(
-                LoginLogCreate(
-                    user_id=str(user["_id"]),
-                    first_name=user.get("first_name", ""),
-                    last_name=user.get("last_name", ""),
-                    email=user.get("email", ""),
-                ),
-                session=session,
-            )
+        # Create session record (DB for refresh tokens)
+        sess = {
+            "user_id": payload["user_id"],
+            "jti": rt["jti"],
+            "refresh_hash": hash_refresh(rt["token"]),
+            "exp": _unix_to_dt(rt["exp"]),
+            "ip": request.client.host if request.client else None,
+            "user_agent": request.headers.get("user-agent"),
+        }
 
-            return LoginResponse(
-                access_token=at["token"],
-                access_jti=at["jti"],
-                access_exp=at["exp"],
-                payload={
-                    "_id": str(user["_id"]),
-                    "first_name": user.get("first_name", ""),
-                    "last_name": user.get("last_name", ""),
-                    "email": user.get("email", ""),
-                    "role_id": str(user["role_id"]),
-                    "user_status_id": str(user["user_status_id"]),
-                    "user_role": payload.get("user_role"),
-                    "wishlist_id": payload["wishlist_id"],
-                    "cart_id": payload["cart_id"],
-                },
-            )
+        # Bump last_login and store the session atomically
+        async with await db.client.start_session() as mongo_session:
+            async with mongo_session.start_transaction():
+                await db["users"].update_one(
+                    {"_id": user["_id"]},
+                    {"$set": {"last_login": datetime.now(timezone.utc)}},
+                    session=mongo_session,
+                )
+                await create_session(sess, session=mongo_session)
+
+        _set_refresh_cookie(response, rt["token"], rt["exp"])
+
+        # Write login log
+        await _write_log(
+            write_login_log,
+            LoginLogCreate(
+                user_id=str(user["_id"]),
+                first_name=user.get("first_name", ""),
+                last_name=user.get("last_name", ""),
+                email=user.get("email", ""),
+            ),
+            background,
+            session,
+        )
 
-        except Exception as inner_err:
-            # COMPENSATE: restore last_login if anything failed after update
-            await _restore_last_login(user["_id"], prev_last_login)
-            raise inner_err
+        return LoginResponse(
+            access_token=at["token"],
+            access_jti=at["jti"],
+            access_exp=at["exp"],
+            payload={
+                "_id": str(user["_id"]),
+                "first_name": user.get("first_name", ""),
+                "last_name": user.get("last_name", ""),
+                "email": user.get("email", ""),
+                "role_id": str(user["role_id"]),
+                "user_status_id": str(user["user_status_id"]),
+                "user_role": payload.get("user_role"),
+                "wishlist_id": payload["wishlist_id"],
+                "cart_id": payload["cart_id"],
+            },
+        )
 
     except HTTPException:
         raise
@@ -232,28 +292,35 @@ async def login_service(
 async def register_service(
     payload: RegisterIn,
     session: AsyncSession | None = None,
+    background: BackgroundTasks | None = None,
 ) -> UserOut:
     """
-    Register a new user; if the register-log insertion fails,
-    delete the newly created user (logical transaction).
+    Register a new user; if creating the cart/wishlist (or an inline
+    register-log insertion) fails, delete the newly created user
+    (logical transaction). A deferred register log cannot roll back.
     """
     email = payload.email
     try:
-        if await db["users"].find_one({"email": email}):
+        email_taken, phone_taken, role_id, status_id = await asyncio.gather(
+            db["users"].find_one({"email": email}, _ID_ONLY),
+            db["users"].find_one(
+                {"phone_no": payload.phone_no, "country_code": payload.country_code}, _ID_ONLY
+            ),
+            _get_default_ref_id("user_roles", "role", "user"),
+            _get_default_ref_id("user_status", "status", "active"),
+        )
+
+        if email_taken:
             raise HTTPException(status.HTTP_400_BAD_REQUEST, "Email already registered")
 
-        if await db["users"].find_one(
-            {"phone_no": payload.phone_no, "country_code": payload.country_code}
-        ):
+        if phone_taken:
             raise HTTPException(status.HTTP_400_BAD_REQUEST, "Phone number already registered")
 
         # Defaults
-        role = await db["user_roles"].find_one({"role": "user"})
-        if not role:
+        if not role_id:
             raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Default user role not found")
 
-        status_doc = await db["user_status"].find_one({"status": "active"})
-        if not status_doc:
+        if not status_id:
             raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Default user status not found")
 
         # Build DB record using Pydantic UserCreate
@@ -264,8 +331,8 @@ async def register_service(
             password=payload.password,
             country_code=payload.country_code,
             phone_no=payload.phone_no,
-            role_id=str(role["_id"]),
-            user_status_id=status_doc["_id"],
+            role_id=role_id,
+            user_status_id=status_id,
             last_login=None,
         )
 
@@ -286,14 +353,16 @@ async def register_service(
             wishlist_created = True
 
             # Insert register log (Postgres)
-            await write_register_log(
+            await _write_log(
+                write_register_log,
                 RegisterLogCreate(
                     user_id=str(new_user.id),
                     first_name=new_user.first_name,
                     last_name=new_user.last_name,
                     email=new_user.email,
                 ),
-                session=session,
+                background,
+                session,
             )
         except Exception as log_err:
             # COMPENSATE: delete cart, wishlist, and user
@@ -330,8 +399,7 @@ async def refresh_token_service(response: Response, request: Request, rt: Option
             raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Session not found or revoked")
 
         # Revoke previous refresh
-        await revoke_session_by_jti(sess_db["jti"], reason="refresh-used")
-        await add_revocation(
+        await revoke_and_record(
             sess_db["jti"],
             expiresAt=_unix_to_dt(payload["exp"]),
             reason="refresh-used",
@@ -344,6 +412,9 @@ async def refresh_token_service(response: Response, request: Request, rt: Option
             "wishlist_id": payload["wishlist_id"],
             "cart_id": payload["cart_id"],
         }
+        for claim in ("first_name", "last_name", "email"):
+            if claim in payload:
+                new_payload[claim] = payload[claim]
 
         at = create_access_token(new_payload)
         new_rt = create_refresh_token(new_payload)
@@ -378,46 +449,63 @@ async def logout_service(
     rt: Optional[str],
     access_token: Optional[str],
     session: AsyncSession | None = None,
+    background: BackgroundTasks | None = None,
 ) -> MessageOut:
     """Logout; non-atomic per your requirement (no compensation)."""
     try:
-        # Revoke access token
-        user_id: Optional[str] = None
-        if access_token:
-            ap = decode_access_token(access_token)
-            if ap and ap.get("type") == "access":
-                user_id = ap.get("user_id")
+        ap = decode_access_token(access_token) if access_token else None
+        if not ap or ap.get("type") != "access":
+            ap = None
+        rp = decode_refresh_token(rt) if rt else None
+        if not rp or rp.get("type") != "refresh":
+            rp = None
+
+        # Revoke access token and look up the refresh session concurrently
+        async def _revoke_access() -> None:
+            if ap:
                 await add_revocation(
                     ap.get("jti", ""),
                     expiresAt=_unix_to_dt(ap["exp"]),
                     reason="logout-access",
                 )
 
+        async def _find_refresh_session() -> Optional[dict]:
+            return await get_by_refresh_hash(hash_refresh(rt)) if rp else None
+
+        _, sess_db = await asyncio.gather(_revoke_access(), _find_refresh_session())
+
         # Revoke refresh token
-        if rt:
-            rp = decode_refresh_token(rt)
-            if rp and rp.get("type") == "refresh":
-                sess_db = await get_by_refresh_hash(hash_refresh(rt))
-                if sess_db:
-                    await revoke_session_by_jti(sess_db["jti"], reason="logout-refresh")
-                    await add_revocation(
-                        sess_db["jti"],
-                        expiresAt=_unix_to_dt(rp["exp"]),
-                        reason="logout-refresh",
-                    )
+        if sess_db:
+            await revoke_and_record(
+                sess_db["jti"],
+                expiresAt=_unix_to_dt(rp["exp"]),
+                reason="logout-refresh",
+            )
 
         # Write logout log if we can resolve the user
+        user_id: Optional[str] = ap.get("user_id") if ap else None
         if user_id:
-            udoc = await db["users"].find_one({"_id": ObjectId(user_id)})
+            if "email" in ap:
+                udoc = {
+                    "_id": user_id,
+                    "first_name": ap.get("first_name", ""),
+                    "last_name": ap.get("last_name", ""),
+                    "email": ap["email"],
+                }
+            else:
+                # tokens issued before identity claims were added
+                udoc = await db["users"].find_one({"_id": ObjectId(user_id)}, _LOG_USER_FIELDS)
             if udoc:
-                await write_logout_log(
+                await _write_log(
+                    write_logout_log,
                     LogoutLogCreate(
                         user_id=str(udoc["_id"]),
                         first_name=udoc.get("first_name", ""),
                         last_name=udoc.get("last_name", ""),
                         email=udoc.get("email", ""),
                     ),
-                    session=session,
+                    background,
+                    session,
                 )
 
         _clear_refresh_cookie(response)
@@ -431,13 +519,13 @@ async def logout_service(
 async def change_password_service(current=Depends(get_current_user), body: ChangePasswordIn = ...) -> MessageOut:
     """Change password."""
     try:
-        user = await db["users"].find_one({"_id": ObjectId(current["user_id"])})
-        if not user or not verify_password(body.old_password, user.get("password", "")):
+        user = await db["users"].find_one({"_id": ObjectId(current["user_id"])}, {"password": 1})
+        if not user or not await verify_password_async(body.old_password, user.get("password", "")):
             raise HTTPException(status.HTTP_400_BAD_REQUEST, "Current password is incorrect")
 
         await db["users"].update_one(
             {"_id": user["_id"]},
-            {"$set": {"password": hash_password(body.new_password)}},
+            {"$set": {"password": await hash_password_async(body.new_password)}},
         )
         return MessageOut(message="Password updated")
     except HTTPException:
@@ -446,13 +534,19 @@ async def change_password_service(current=Depends(get_current_user), body: Chang
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal Server Error")
 
 
-async def forgot_password_request_service(body: ForgotPasswordRequestIn) -> MessageOut:
-    """Generate OTP and email it for password reset (OTP in Redis, 5m TTL, rate-limited)."""
+async def forgot_password_request_service(
+    body: ForgotPasswordRequestIn,
+    background: BackgroundTasks | None = None,
+) -> MessageOut:
+    """
+    Generate OTP and email it for password reset (OTP in Redis, 5m TTL, rate-limited).
+    With `background`, the SMTP send runs after the response instead of inline.
+    """
     try:
         email = body.email.strip().lower()
 
         # 1. Make sure user exists
-        user = await db["users"].find_one({"email": email})
+        user = await db["users"].find_one({"email": email}, _ID_ONLY)
         if not user:
             raise HTTPException(
                 status.HTTP_404_NOT_FOUND,
@@ -469,27 +563,32 @@ async def forgot_password_request_service(body: ForgotPasswordRequestIn) -> Mess
                 f"Please wait {remaining_cooldown} seconds before requesting a new OTP"
             )
 
-        otp = random.randint(100000, 999999)
-
-        await redis.setex(
-            _otp_key(email),
-            settings.FORGOT_PWD_OTP_TTL_SECONDS,
-            str(otp),
-        )
+        otp = 100000 + secrets.randbelow(900000)
 
-        attempts_key = _otp_attempts_key(email)
-        await redis.delete(attempts_key)
+        # store OTP, reset attempts and start the cooldown in one round-trip
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.setex(
+                _otp_key(email),
+                settings.FORGOT_PWD_OTP_TTL_SECONDS,
+                hash_otp(email, str(otp)),
+            )
+            pipe.delete(_otp_attempts_key(email))
+            pipe.setex(
+                rl_key,
+                settings.FORGOT_PWD_RESEND_COOLDOWN_SECONDS,
+                "1",
+            )
+            await pipe.execute()
 
-        await redis.setex(
-            rl_key,
-            settings.FORGOT_PWD_RESEND_COOLDOWN_SECONDS,
-            "1",
-        )
-        await _send_mail(
+        mail = dict(
             subject="Password Reset OTP",
             recipients=[email],
-            body=generate_otp_email_html(otp)
+            body=generate_otp_email_html(otp),
         )
+        if background is not None:
+            background.add_task(_send_mail, **mail)
+        else:
+            await _send_mail(**mail)
 
         return MessageOut(message="OTP sent")
 
@@ -511,36 +610,33 @@ async def forgot_password_verify_service(body: ForgotPasswordVerifyIn) -> Messag
 
         redis = await get_redis()
 
-        stored_otp = await redis.get(otp_key)
-        if not stored_otp:
+        verify_otp = redis.register_script(_OTP_VERIFY_LUA)
+        result = await verify_otp(
+            keys=[otp_key, attempts_key],
+            args=[hash_otp(email, str(body.otp)), settings.FORGOT_PWD_OTP_TTL_SECONDS, settings.FORGOT_PWD_MAX_OTP_ATTEMPTS],
+        )
+
+        if result == "missing":
             raise HTTPException(
                 status.HTTP_400_BAD_REQUEST,
                 "Invalid or expired OTP"
             )
 
-        if stored_otp != str(body.otp):
-            attempts = await redis.incr(attempts_key)
-
-            if attempts == 1:
-                await redis.expire(attempts_key, settings.FORGOT_PWD_OTP_TTL_SECONDS)
-
-            if attempts >= settings.FORGOT_PWD_MAX_OTP_ATTEMPTS:
-                await redis.delete(otp_key)
-                await redis.delete(attempts_key)
-                raise HTTPException(
-                    status.HTTP_400_BAD_REQUEST,
-                    "Too many invalid attempts. Please request a new OTP."
-                )
+        if result == "locked":
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST,
+                "Too many invalid attempts. Please request a new OTP."
+            )
 
+        if result != "ok":
             raise HTTPException(
                 status.HTTP_400_BAD_REQUEST,
                 "Invalid OTP"
             )
 
-        user = await db["users"].find_one({"email": email})
+        # OTP and attempts were already consumed by the script
+        user = await db["users"].find_one({"email": email}, _ID_ONLY)
         if not user:
-            await redis.delete(otp_key)
-            await redis.delete(attempts_key)
             raise HTTPException(
                 status.HTTP_404_NOT_FOUND,
                 "User not found"
@@ -548,12 +644,9 @@ async def forgot_password_verify_service(body: ForgotPasswordVerifyIn) -> Messag
 
         await db["users"].update_one(
             {"_id": user["_id"]},
-            {"$set": {"password": hash_password(body.new_password)}},
+            {"$set": {"password": await hash_password_async(body.new_password)}},
         )
 
-        await redis.delete(otp_key)
-        await redis.delete(attempts_key)
-
         return MessageOut(message="Password reset successful")
 
     except HTTPException:
@@ -5,8 +5,9 @@ from datetime import datetime
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
 
-from app.schemas.backup_logs import BackupLogsUpdate, BackupLogsOut
+from app.schemas.backup_logs import BackupLogsUpdate, BackupLogsOut, parse_many
 from app.crud import backup_logs as crud
+from app.utils.mongo import InvalidCursor
 
 
 async def schedule_backup_service(
@@ -74,13 +75,15 @@ async def list_backups_service(
     frequency: Optional[str],
     date_from: Optional[datetime],
     date_to: Optional[datetime],
+    after: Optional[str] = None,
 ) -> List[BackupLogsOut]:
     """
     List backup logs with advanced filtering.
 
     Args:
-        skip (int): Pagination offset.
+        skip (int): Pagination offset (ignored when `after` is given).
         limit (int): Max results.
+        after (str | None): Keyset cursor: id of the last log on the previous page.
         status_ (str | None): Filter by backup status.
         scope (str | None): Filter by scope.
         frequency (str | None): Filter by frequency.
@@ -93,22 +96,17 @@ async def list_backups_service(
         HTTPException: When query or mapping fails.
     """
     try:
-        q: Dict[str, Any] = {}
-        if status_:
-            q["status"] = status_
-        if scope:
-            q["scope"] = scope
-        if frequency:
-            q["frequency"] = frequency
-        if date_from or date_to:
-            q["createdAt"] = {}
-            if date_from:
-                q["createdAt"]["$gte"] = date_from
-            if date_to:
-                q["createdAt"]["$lt"] = date_to
-
-        docs = await crud.list_all(skip=skip, limit=limit, query=q or None)
-        return [BackupLogsOut.model_validate(d) for d in docs]
+        q: Dict[str, Any] = {
+            k: v for k, v in (("status", status_), ("scope", scope), ("frequency", frequency)) if v
+        }
+        created = {op: v for op, v in (("$gte", date_from), ("$lt", date_to)) if v}
+        if created:
+            q["createdAt"] = created
+
+        docs = await crud.list_all(skip=skip, limit=limit, query=q or None, after=after)
+        return parse_many(docs)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list backups: {e}")
 
@@ -6,26 +6,23 @@ from fastapi.responses import JSONResponse
 
 from app.schemas.object_id import PyObjectId
 from app.schemas.brands import BrandsCreate, BrandsUpdate, BrandsOut
+from app.schemas._partial import has_updates
 from app.crud import brands as crud
-from app.utils.gridfs import delete_image, _extract_file_id_from_url
+from app.utils.gridfs import bulk_delete_images, _extract_file_id_from_url
 
 # -------- helpers --------
 
 async def _cleanup_gridfs_urls(urls: list[str]) -> list[str]:
     """
-    Best-effort deletion of GridFS files using their URLs.
+    Best-effort deletion of GridFS files using their URLs, in one bulk delete.
     Returns a list of warnings (non-fatal errors).
     """
-    warnings: list[str] = []
-    for url in urls or []:
-        try:
-            fid = _extract_file_id_from_url(url)
-            if not fid:
-                continue
-            await delete_image(fid)
-        except Exception as ex:
-            warnings.append(f"{url}: {ex}")
-    return warnings
+    fids = [fid for url in urls or [] if (fid := _extract_file_id_from_url(url))]
+    try:
+        await bulk_delete_images(fids)
+    except Exception as ex:
+        return [f"bulk delete of {len(fids)} file(s) failed: {ex}"]
+    return []
 
 # -------- services --------
 
@@ -67,7 +64,7 @@ async def get_item_service(item_id: PyObjectId) -> BrandsOut:
 
 async def update_item_service(item_id: PyObjectId, payload: BrandsUpdate) -> BrandsOut:
     try:
-        if not any(v is not None for v in payload.model_dump().values()):
+        if not has_updates(payload):
             raise HTTPException(status_code=400, detail="No fields provided for update")
 
         updated = await crud.update_one(item_id, payload)
@@ -1,13 +1,15 @@
 from __future__ import annotations
 from typing import List, Optional
 
-from fastapi import HTTPException, UploadFile
+from fastapi import BackgroundTasks, HTTPException, UploadFile
 from fastapi.responses import JSONResponse
 
 from app.schemas.object_id import PyObjectId
 from app.schemas.cards_1 import Cards1Create, Cards1Update, Cards1Out
+from app.schemas._partial import has_updates
 from app.crud import cards_1 as crud
-from app.utils.gridfs import upload_image, replace_image, delete_image, _extract_file_id_from_url
+from app.utils.mongo import InvalidCursor
+from app.utils.gridfs import upload_image, delete_image_later, _extract_file_id_from_url
 
 
 async def create_item_service(idx: int, title: str, image: UploadFile) -> Cards1Out:
@@ -27,9 +29,13 @@ async def create_item_service(idx: int, title: str, image: UploadFile) -> Cards1
         raise HTTPException(status_code=500, detail=f"Failed to create Cards1: {e}")
 
 
-async def list_items_service(skip: int, limit: int, sort_by_idx: bool) -> List[Cards1Out]:
+async def list_items_service(
+    skip: int, limit: int, sort_by_idx: bool, after: Optional[str] = None
+) -> List[Cards1Out]:
     try:
-        return await crud.list_all(skip=skip, limit=limit, sort_by_idx=sort_by_idx)
+        return await crud.list_all(skip=skip, limit=limit, sort_by_idx=sort_by_idx, after=after)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list Cards1: {e}")
 
@@ -55,34 +61,36 @@ async def update_item_service(
     """
     Update fields; if image is provided, replace it in GridFS and update image_url.
     """
+    new_id: Optional[str] = None
     try:
-        current = await crud.get_one(item_id)
-        if not current:
-            raise HTTPException(status_code=404, detail="Cards1 not found")
-
-        patch = Cards1Update()
-
-        if image is not None:
-            old_id = _extract_file_id_from_url(current.image_url)
-            if old_id:
-                _, new_url = await replace_image(old_id, image)
-            else:
-                # fallback: if old file id not parseable, just upload
-                _, new_url = await upload_image(image)
-            patch.image_url = new_url  # type: ignore[attr-defined]
-
+        patch_data: dict = {}
         if idx is not None:
-            patch.idx = idx
+            patch_data["idx"] = idx
         if title is not None:
-            patch.title = title
-
-        if not any(v is not None for v in patch.model_dump().values()):
-            raise HTTPException(status_code=400, detail="No fields provided for update")
+            patch_data["title"] = title
+
+        if image is None:
+            patch = Cards1Update(**patch_data)
+            if not has_updates(patch):
+                raise HTTPException(status_code=400, detail="No fields provided for update")
+
+            updated = await crud.update_one(item_id, patch)
+            if not updated:
+                raise HTTPException(status_code=404, detail="Cards1 not found")
+            return updated
+
+        # Upload first, then swap the URL in and learn the old one in the same write
+        new_id, new_url = await upload_image(image)
+        patch_data["image_url"] = new_url
+        result = await crud.update_with_previous(item_id, Cards1Update(**patch_data))
+        if not result:
+            raise HTTPException(status_code=404, detail="Cards1 not found")
 
-        updated = await crud.update_one(item_id, patch)
-        if not updated:
-            # could be not found or duplicate idx in unique index
-            raise HTTPException(status_code=409, detail="Update failed (possibly duplicate idx).")
+        previous, updated = result
+        old_id = _extract_file_id_from_url(previous.image_url)
+        if old_id and old_id != new_id:
+            delete_image_later(old_id)
+        new_id = None  # committed; nothing to roll back
         return updated
     except HTTPException:
         raise
@@ -91,21 +99,18 @@ async def update_item_service(
         if "E11000" in msg and "idx" in msg:
             raise HTTPException(status_code=409, detail="Duplicate idx.")
         raise HTTPException(status_code=500, detail=f"Failed to update Cards1: {e}")
+    finally:
+        if new_id:
+            delete_image_later(new_id)
 
 
-async def delete_item_service(item_id: PyObjectId):
+async def delete_item_service(item_id: PyObjectId, background: Optional[BackgroundTasks] = None):
     try:
-        current = await crud.get_one(item_id)
-        if not current:
+        deleted = await crud.delete_and_return(item_id)
+        if not deleted:
             raise HTTPException(status_code=404, detail="Cards1 not found")
 
-        file_id = _extract_file_id_from_url(current.image_url)
-        if file_id:
-            await delete_image(file_id)
-
-        ok = await crud.delete_one(item_id)
-        if not ok:
-            raise HTTPException(status_code=404, detail="Cards1 not found")
+        delete_image_later(_extract_file_id_from_url(deleted.image_url), background)
         return JSONResponse(status_code=200, content={"deleted": True})
     except HTTPException:
         raise
@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone
 
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
@@ -9,7 +8,27 @@ from bson import ObjectId
 from app.core.database import db
 from app.schemas.object_id import PyObjectId
 from app.schemas.cart_items import CartItemsCreate, CartItemsUpdate, CartItemsOut
+from app.schemas._partial import has_updates
 from app.crud import cart_items as crud
+from app.utils.mongo import InvalidCursor
+
+
+def _user_cart_oid(current_user: Dict[str, Any]) -> ObjectId:
+    # cart_oid is parsed once by get_current_user
+    cart_oid = current_user.get("cart_oid")
+    if cart_oid is None:
+        raise HTTPException(status_code=400, detail="Missing cart_id in current user")
+    return cart_oid
+
+
+async def _raise_missing_or_forbidden(item_id: PyObjectId) -> None:
+    """
+    Called only after a cart-scoped query matched nothing: tell apart a line
+    that doesn't exist (404) from one in someone else's cart (403).
+    """
+    if await crud.exists(item_id):
+        raise HTTPException(status_code=403, detail="Forbidden")
+    raise HTTPException(status_code=404, detail="Cart item not found")
 
 
 async def create_item_service(
@@ -40,30 +59,26 @@ async def list_items_service(
     limit: int,
     product_id: Optional[PyObjectId],
     current_user: Dict[str, Any],
+    after: Optional[str] = None,
 ) -> List[CartItemsOut]:
     try:
-        q: Dict[str, Any] = {"cart_id": PyObjectId(current_user["cart_id"])}
+        q: Dict[str, Any] = {"cart_id": _user_cart_oid(current_user)}
         if product_id:
             q["product_id"] = product_id  # crud will normalize to ObjectId if valid
-        return await crud.list_all(skip=skip, limit=limit, query=q)
+        return await crud.list_all(skip=skip, limit=limit, query=q, after=after)
     except HTTPException:
         raise
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list cart items: {e}")
 
 
 async def get_item_service(item_id: PyObjectId, current_user: Dict[str, Any]) -> CartItemsOut:
     try:
-        item = await crud.get_one(item_id)
+        item = await crud.get_one(item_id, cart_id=_user_cart_oid(current_user))
         if not item:
-            raise HTTPException(status_code=404, detail="Cart item not found")
-
-        user_cart_id = str(current_user.get("cart_id", ""))
-        if not user_cart_id:
-            raise HTTPException(status_code=400, detail="Missing cart_id in current user")
-
-        if str(item.cart_id) != user_cart_id:
-            raise HTTPException(status_code=403, detail="Forbidden")
+            await _raise_missing_or_forbidden(item_id)
         return item
     except HTTPException:
         raise
@@ -77,22 +92,14 @@ async def update_item_service(
     current_user: Dict[str, Any],
 ) -> CartItemsOut:
     try:
-        item = await crud.get_one(item_id)
-        if not item:
-            raise HTTPException(status_code=404, detail="Cart item not found")
-
-        user_cart_id = str(current_user.get("cart_id", ""))
-        if not user_cart_id:
-            raise HTTPException(status_code=400, detail="Missing cart_id in current user")
-        if str(item.cart_id) != user_cart_id:
-            raise HTTPException(status_code=403, detail="Forbidden")
+        cart_oid = _user_cart_oid(current_user)
 
-        if not any(v is not None for v in payload.model_dump().values()):
+        if not has_updates(payload):
             raise HTTPException(status_code=400, detail="No fields provided for update")
 
-        updated = await crud.update_one(item_id, payload)
+        updated = await crud.update_one(item_id, payload, cart_id=cart_oid)
         if not updated:
-            raise HTTPException(status_code=404, detail="Cart item not found or not updated")
+            await _raise_missing_or_forbidden(item_id)
         return updated
     except HTTPException:
         raise
@@ -105,19 +112,9 @@ async def update_item_service(
 
 async def delete_item_service(item_id: PyObjectId, current_user: Dict[str, Any]):
     try:
-        item = await crud.get_one(item_id)
-        if not item:
-            raise HTTPException(status_code=404, detail="Cart item not found")
-
-        user_cart_id = str(current_user.get("cart_id", ""))
-        if not user_cart_id:
-            raise HTTPException(status_code=400, detail="Missing cart_id in current user")
-        if str(item.cart_id) != user_cart_id:
-            raise HTTPException(status_code=403, detail="Forbidden")
-
-        ok = await crud.delete_one(item_id)
+        ok = await crud.delete_one(item_id, cart_id=_user_cart_oid(current_user))
         if not ok:
-            raise HTTPException(status_code=404, detail="Cart item not found")
+            await _raise_missing_or_forbidden(item_id)
         return JSONResponse(status_code=200, content={"deleted": True})
     except HTTPException:
         raise
@@ -128,6 +125,109 @@ async def delete_item_service(item_id: PyObjectId, current_user: Dict[str, Any])
 # ----------------------------
 # Check Cart Availability
 # ----------------------------
+def _cart_availability_pipeline(cart_oid: ObjectId) -> List[Dict[str, Any]]:
+    """
+    Join cart lines to their products and compute per-line availability and
+    cart totals server-side; yields a single {items, totals} document.
+    """
+    return [
+        {"$match": {"cart_id": cart_oid}},
+        {"$lookup": {
+            "from": "products",
+            "localField": "product_id",
+            "foreignField": "_id",
+            "as": "p",
+            "pipeline": [{"$project": {
+                "name": 1, "quantity": 1, "out_of_stock": 1,
+                "price": 1, "total_price": 1, "thumbnail_url": 1,
+            }}],
+        }},
+        {"$unwind": {"path": "$p", "preserveNullAndEmptyArrays": True}},
+        {"$addFields": {
+            "found": {"$ne": [{"$type": "$p"}, "missing"]},
+            "requested_quantity": {"$toInt": {"$ifNull": ["$quantity", 1]}},
+            "available_quantity": {"$toInt": {"$ifNull": ["$p.quantity", 0]}},
+            "out_of_stock": {"$toBool": {"$ifNull": ["$p.out_of_stock", False]}},
+            "price": {"$toDouble": {"$ifNull": ["$p.total_price", {"$ifNull": ["$p.price", 0]}]}},
+        }},
+        {"$addFields": {
+            "available": {"$and": [
+                "$found",
+                {"$gte": ["$available_quantity", "$requested_quantity"]},
+                {"$not": ["$out_of_stock"]},
+            ]},
+        }},
+        {"$addFields": {
+            # integer cents so the totals don't accumulate float drift
+            "subtotal_cents": {"$cond": [
+                "$available",
+                {"$multiply": [
+                    {"$toLong": {"$round": [{"$multiply": ["$price", 100]}, 0]}},
+                    "$requested_quantity",
+                ]},
+                0,
+            ]},
+        }},
+        {"$facet": {
+            "items": [{"$project": {
+                "product_id": 1, "size": 1, "found": 1,
+                "requested_quantity": 1, "available_quantity": 1, "out_of_stock": 1,
+                "available": 1, "price": 1, "subtotal_cents": 1,
+                "name": "$p.name", "thumbnail_url": "$p.thumbnail_url",
+            }}],
+            "totals": [{"$group": {
+                "_id": None,
+                "all_available": {"$min": "$available"},
+                "total_items": {"$sum": 1},
+                "total_quantity": {"$sum": {"$cond": ["$available", "$requested_quantity", 0]}},
+                "total_amount_cents": {"$sum": "$subtotal_cents"},
+            }}],
+        }},
+    ]
+
+
+def _availability_item(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape one aggregated cart line into the availability response item."""
+    requested_qty = row["requested_quantity"]
+    base = {
+        "cart_item_id": str(row["_id"]),
+        "product_id": str(row["product_id"]),
+        "size": row.get("size", ""),
+        "requested_quantity": requested_qty,
+    }
+    if not row["found"]:
+        return {
+            **base,
+            "product_name": "Product not found",
+            "available_quantity": 0,
+            "available": False,
+            "out_of_stock": True,
+            "price": 0,
+            "subtotal": 0,
+            "thumbnail_url": None,
+            "message": "Product no longer exists",
+        }
+
+    available_qty = row["available_quantity"]
+    message = None
+    if row["out_of_stock"]:
+        message = "Product is out of stock"
+    elif available_qty < requested_qty:
+        message = f"Only {available_qty} available (requested {requested_qty})"
+
+    return {
+        **base,
+        "product_name": row.get("name", "Unknown"),
+        "available_quantity": available_qty,
+        "available": row["available"],
+        "out_of_stock": row["out_of_stock"],
+        "price": row["price"],
+        "subtotal": row["subtotal_cents"] / 100,
+        "thumbnail_url": row.get("thumbnail_url"),
+        "message": message,
+    }
+
+
 async def check_cart_availability_service(current_user: Dict[str, Any]) -> Dict[str, Any]:
     """
     Check the availability of all products in the user's cart.
@@ -141,16 +241,13 @@ async def check_cart_availability_service(current_user: Dict[str, Any]) -> Dict[
         - items: List of item availability details
     """
     try:
-        cart_id = current_user.get("cart_id")
-        if not cart_id:
-            raise HTTPException(status_code=400, detail="Missing cart_id in current user")
-        
-        cart_oid = ObjectId(str(cart_id))
-        
-        # Get all cart items
-        cart_items = await db["cart_items"].find({"cart_id": cart_oid}).to_list(length=None)
-        
-        if not cart_items:
+        cart_oid = _user_cart_oid(current_user)
+
+        # One round-trip: cart lines joined to products, with totals
+        agg = await db["cart_items"].aggregate(_cart_availability_pipeline(cart_oid)).to_list(1)
+        rows = agg[0]["items"] if agg else []
+
+        if not rows:
             return {
                 "all_available": True,
                 "total_items": 0,
@@ -158,82 +255,14 @@ async def check_cart_availability_service(current_user: Dict[str, Any]) -> Dict[
                 "total_amount": 0.0,
                 "items": []
             }
-        
-        # Check each item's availability
-        items_status = []
-        all_available = True
-        total_amount = 0.0
-        total_quantity = 0
-        
-        for item in cart_items:
-            product_id = item["product_id"]
-            requested_qty = int(item.get("quantity", 1))
-            size = item.get("size", "")
-            
-            # Fetch product details
-            product = await db["products"].find_one(
-                {"_id": product_id},
-                {"name": 1, "quantity": 1, "out_of_stock": 1, "price": 1, "total_price": 1, "thumbnail_url": 1}
-            )
-            
-            if not product:
-                items_status.append({
-                    "cart_item_id": str(item["_id"]),
-                    "product_id": str(product_id),
-                    "product_name": "Product not found",
-                    "size": size,
-                    "requested_quantity": requested_qty,
-                    "available_quantity": 0,
-                    "available": False,
-                    "out_of_stock": True,
-                    "price": 0,
-                    "subtotal": 0,
-                    "thumbnail_url": None,
-                    "message": "Product no longer exists"
-                })
-                all_available = False
-                continue
-            
-            available_qty = int(product.get("quantity", 0))
-            is_out_of_stock = bool(product.get("out_of_stock", False))
-            is_available = available_qty >= requested_qty and not is_out_of_stock
-            
-            price = float(product.get("total_price", product.get("price", 0)))
-            subtotal = price * requested_qty
-            
-            if is_available:
-                total_amount += subtotal
-                total_quantity += requested_qty
-            else:
-                all_available = False
-            
-            message = None
-            if is_out_of_stock:
-                message = "Product is out of stock"
-            elif available_qty < requested_qty:
-                message = f"Only {available_qty} available (requested {requested_qty})"
-            
-            items_status.append({
-                "cart_item_id": str(item["_id"]),
-                "product_id": str(product_id),
-                "product_name": product.get("name", "Unknown"),
-                "size": size,
-                "requested_quantity": requested_qty,
-                "available_quantity": available_qty,
-                "available": is_available,
-                "out_of_stock": is_out_of_stock,
-                "price": price,
-                "subtotal": subtotal if is_available else 0,
-                "thumbnail_url": product.get("thumbnail_url"),
-                "message": message
-            })
-        
+
+        totals = agg[0]["totals"][0]
         return {
-            "all_available": all_available,
-            "total_items": len(cart_items),
-            "total_quantity": total_quantity,
-            "total_amount": round(total_amount, 2),
-            "items": items_status
+            "all_available": bool(totals["all_available"]),
+            "total_items": totals["total_items"],
+            "total_quantity": totals["total_quantity"],
+            "total_amount": totals["total_amount_cents"] / 100,
+            "items": [_availability_item(r) for r in rows]
         }
     
     except HTTPException:
@@ -243,65 +272,50 @@ async def check_cart_availability_service(current_user: Dict[str, Any]) -> Dict[
 
 
 # ----------------------------
-# Transactional: Move to Wishlist
+# Move to Wishlist ($merge)
 # ----------------------------
 async def move_to_wishlist_service(item_id: PyObjectId, current_user: Dict[str, Any]) -> CartItemsOut:
     """
-    Moves a cart line into wishlist_items atomically:
-      - Upsert wishlist_items by (wishlist_id, product_id)
-      - Delete the cart line
+    Moves a cart line into wishlist_items without a multi-document transaction:
+      - $merge the line into wishlist_items by (wishlist_id, product_id),
+        server-side and idempotent (only updatedAt changes on a match)
+      - Then delete the cart line (scoped to the caller's cart)
+    The upsert runs first, so a failure in between leaves the product in both
+    lists (retry-safe) rather than losing it.
     Assumptions:
       - current_user contains "wishlist_id"
-      - wishlist_items schema stores wishlist_id & product_id as ObjectId
+      - wishlist_items has the unique (wishlist_id, product_id) index $merge needs
     """
-    # Ensure user owns the cart item
-    cart_doc = await db["cart_items"].find_one({"_id": item_id})
-    if not cart_doc:
-        raise HTTPException(status_code=404, detail="Cart item not found")
-
-    user_cart_id = current_user.get("cart_id", "")
-    if not user_cart_id:
-        raise HTTPException(status_code=400, detail="Missing cart_id in current user")
-    if str(cart_doc["cart_id"]) != str(user_cart_id):
-        raise HTTPException(status_code=403, detail="Forbidden")
-
-    # Prepare ObjectIds for wishlist upsert
-    product_oid = (
-        cart_doc["product_id"]
-        if isinstance(cart_doc.get("product_id"), ObjectId)
-        else ObjectId(str(cart_doc["product_id"]))
-    )
-    wishlist_id_val = current_user.get("wishlist_id")
-    try:
-        wishlist_oid = wishlist_id_val if isinstance(wishlist_id_val, ObjectId) else ObjectId(str(wishlist_id_val))
-    except Exception:
+    cart_oid = _user_cart_oid(current_user)
+    wishlist_oid = current_user.get("wishlist_oid")
+    if wishlist_oid is None:
         raise HTTPException(status_code=400, detail="Invalid wishlist_id in current user")
 
     try:
-        async with await db.client.start_session() as session:
-            async with session.start_transaction():
-                # Upsert wishlist item (ObjectId FKs)
-                f = {"wishlist_id": wishlist_oid, "product_id": product_oid}
-                await db["wishlist_items"].update_one(
-                    f,
-                    {
-                        "$setOnInsert": {
-                            "wishlist_id": wishlist_oid,
-                            "product_id": product_oid,
-                            "createdAt": datetime.now(timezone.utc),
-                        },
-                        "$currentDate": {"updatedAt": True},
-                    },
-                    upsert=True,
-                    session=session,
-                )
-
-                # Delete the cart line
-                del_res = await db["cart_items"].delete_one({"_id": item_id}, session=session)
-                if del_res.deleted_count != 1:
-                    raise HTTPException(status_code=400, detail="Unable to move to wishlist")
-
-        # committed — return the deleted cart snapshot
+        # Upsert wishlist item straight from the cart line; matches nothing if not ours
+        await db["cart_items"].aggregate([
+            {"$match": {"_id": item_id, "cart_id": cart_oid}},
+            {"$project": {
+                "_id": 0,
+                "wishlist_id": {"$literal": wishlist_oid},
+                "product_id": 1,
+                "createdAt": "$$NOW",
+                "updatedAt": "$$NOW",
+            }},
+            {"$merge": {
+                "into": "wishlist_items",
+                "on": ["wishlist_id", "product_id"],
+                "whenMatched": [{"$set": {"updatedAt": "$$new.updatedAt"}}],
+                "whenNotMatched": "insert",
+            }},
+        ]).to_list(length=None)
+
+        # Delete the cart line; the cart_id filter doubles as the ownership check
+        cart_doc = await db["cart_items"].find_one_and_delete({"_id": item_id, "cart_id": cart_oid})
+        if not cart_doc:
+            await _raise_missing_or_forbidden(item_id)
+
+        # return the deleted cart snapshot
         return CartItemsOut.model_validate(cart_doc)
 
     except HTTPException:
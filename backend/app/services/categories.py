@@ -4,37 +4,187 @@ Contains all business logic, database interaction, and cleanup operations.
 """
 
 from __future__ import annotations
-from typing import List, Optional, Dict, Any
+import asyncio
+import logging
+import random
+import time
+from typing import AsyncIterator, List, Optional, Dict, Any, Set, Tuple
 
-from fastapi import HTTPException
-from fastapi.responses import JSONResponse
+import orjson
+
+from fastapi import BackgroundTasks, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from pymongo.errors import DuplicateKeyError, PyMongoError
+
+from app.core.config import settings
+from app.core.redis import get_redis, _category_key, _category_list_gen_key, _category_list_key
 
 from app.schemas.object_id import PyObjectId
-from app.schemas.categories import CategoriesCreate, CategoriesUpdate, CategoriesOut
+from app.schemas.categories import (
+    CategoriesCreate,
+    CategoriesUpdate,
+    CategoriesOut,
+    CategoriesBatchOut,
+    CategoriesBatchError,
+    CategoriesBatchDeleteOut,
+)
+from app.schemas._partial import has_updates
 from app.crud import categories as crud
-from app.utils.gridfs import delete_image, _extract_file_id_from_url
+from app.utils.gridfs import bulk_delete_images, delete_image, _extract_file_id_from_url
+
+_LOG = logging.getLogger("app.services.categories")
+
+# Cap concurrent GridFS deletes so one cleanup can't drain the Mongo pool
+_CLEANUP_CONCURRENCY = 16
+
+_CATEGORY_LIST = TypeAdapter(List[CategoriesOut])
+
+
+async def _cache_get(key: str) -> Optional[str]:
+    try:
+        redis = await get_redis()
+        return await redis.get(key)
+    except Exception:
+        return None  # cache is best-effort; fall through to Mongo
+
+
+async def _cache_get_with_ttl(key: str) -> Tuple[Optional[str], int]:
+    """GET plus remaining TTL in one round-trip (-2/-1 when missing/persistent)."""
+    try:
+        redis = await get_redis()
+        pipe = redis.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.ttl(key)
+        value, ttl = await pipe.execute()
+        return value, ttl
+    except Exception:
+        return None, -2
+
+
+async def _cache_set(key: str, value: str) -> None:
+    try:
+        redis = await get_redis()
+        await redis.setex(key, settings.CATEGORY_CACHE_TTL_SECONDS, value)
+    except Exception:
+        pass
+
+
+# Early refresh: in the last 20% of a list page's TTL one request (holding a
+# short NX lock) reloads it in the background; everyone else keeps the cached copy.
+_REFRESH_WINDOW = 0.2
+_REFRESH_LOCK_SECONDS = 5
+_pending_refreshes: Set[asyncio.Task] = set()
+
+
+def _should_refresh_early(ttl_left: int) -> bool:
+    window = settings.CATEGORY_CACHE_TTL_SECONDS * _REFRESH_WINDOW
+    if ttl_left < 0 or ttl_left >= window:
+        return False
+    # more likely the closer we are to expiry (XFetch-style)
+    return random.random() >= ttl_left / window
+
+
+async def _refresh_list(key: str, skip: int, limit: int, category: Optional[str], q: Optional[str]) -> None:
+    try:
+        redis = await get_redis()
+        if not await redis.set(f"{key}:lock", "1", nx=True, ex=_REFRESH_LOCK_SECONDS):
+            return  # someone else is already reloading this page
+        items = await crud.list_all(skip=skip, limit=limit, category=category, q=q)
+        await _cache_set(key, _CATEGORY_LIST.dump_json(items).decode())
+    except Exception:
+        pass
+
+
+def _schedule_list_refresh(key: str, skip: int, limit: int, category: Optional[str], q: Optional[str]) -> None:
+    task = asyncio.create_task(_refresh_list(key, skip, limit, category, q))
+    _pending_refreshes.add(task)  # keep a strong ref until it finishes
+    task.add_done_callback(_pending_refreshes.discard)
+
+
+async def _list_generation() -> Optional[str]:
+    """
+    Current list generation, or None if Redis is unreachable.
+    A missing counter (fresh or flushed Redis) is seeded from the clock so
+    generations, and the ETags built from them, never repeat.
+    """
+    try:
+        redis = await get_redis()
+        gen = await redis.get(_category_list_gen_key())
+        if gen is None:
+            await redis.set(_category_list_gen_key(), time.time_ns(), nx=True)
+            gen = await redis.get(_category_list_gen_key())
+        return gen
+    except Exception:
+        return None
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """True if an If-None-Match header names `etag` (weak comparison) or is '*'."""
+    if not if_none_match or not etag:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or any(t.removeprefix("W/") == etag.removeprefix("W/") for t in tags)
+
+
+def item_etag(item: CategoriesOut) -> str:
+    return f'W/"{item.id}-{int(item.updatedAt.timestamp() * 1000)}"'
+
+
+async def list_items_etag() -> Optional[str]:
+    """Weak ETag for category list pages; flips on every category write."""
+    gen = await _list_generation()
+    return f'W/"cat-list-{gen}"' if gen is not None else None
+
+
+async def _invalidate_cache(*item_ids: PyObjectId) -> None:
+    """
+    Drop the cached categories (if any given) and retire every cached list page
+    by bumping the generation embedded in list keys; no key scan needed.
+    """
+    try:
+        redis = await get_redis()
+        pipe = redis.pipeline(transaction=False)
+        if item_ids:
+            pipe.delete(*(_category_key(i) for i in item_ids))
+        pipe.set(_category_list_gen_key(), time.time_ns(), nx=True)  # seed like _list_generation
+        pipe.incr(_category_list_gen_key())
+        await pipe.execute()
+    except Exception:
+        pass
 
 
 async def _cleanup_gridfs_urls(urls: list[str]) -> list[str]:
     """
     Best-effort GridFS deletions; non-crashing operation.
 
+    Tries one bulk delete first; if that fails, retries file by file so the
+    warnings can name the URLs that could not be removed.
+
     Args:
         urls (list[str]): List of image URLs to remove.
 
     Returns:
         list[str]: Warnings for failed deletions.
     """
-    warnings: list[str] = []
-    for url in urls or []:
-        try:
-            fid = _extract_file_id_from_url(url)
-            if not fid:
-                continue
+    pairs = [(url, fid) for url in urls or [] if (fid := _extract_file_id_from_url(url))]
+    if not pairs:
+        return []
+    try:
+        await bulk_delete_images(fid for _, fid in pairs)
+        return []
+    except Exception:
+        pass
+
+    sem = asyncio.Semaphore(_CLEANUP_CONCURRENCY)
+
+    async def _delete(fid: str) -> None:
+        async with sem:
             await delete_image(fid)
-        except Exception as ex:
-            warnings.append(f"{url}: {ex}")
-    return warnings
+
+    # Deletions are independent; overlap their round-trips
+    results = await asyncio.gather(*(_delete(fid) for _, fid in pairs), return_exceptions=True)
+    return [f"{url}: {res}" for (url, _), res in zip(pairs, results) if isinstance(res, Exception)]
 
 
 async def create_item_service(payload: CategoriesCreate) -> CategoriesOut:
@@ -54,12 +204,11 @@ async def create_item_service(payload: CategoriesCreate) -> CategoriesOut:
         created = await crud.create(payload)
         if not created:
             raise HTTPException(status_code=500, detail="Failed to persist category")
+        await _invalidate_cache()
         return created
-    except HTTPException:
-        raise
-    except Exception as e:
-        if "E11000" in str(e):
-            raise HTTPException(status_code=409, detail="Duplicate category")
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Duplicate category")
+    except (PyMongoError, ValidationError) as e:
         raise HTTPException(status_code=500, detail=f"Failed to create category: {e}")
 
 
@@ -82,8 +231,21 @@ async def list_items_service(
         List[CategoriesOut]
     """
     try:
-        return await crud.list_all(skip=skip, limit=limit, category=category, q=q)
-    except Exception as e:
+        gen = await _list_generation()
+        if gen is None:
+            return await crud.list_all(skip=skip, limit=limit, category=category, q=q)
+
+        key = _category_list_key(gen, skip, limit, category, q)
+        cached, ttl_left = await _cache_get_with_ttl(key)
+        if cached is not None:
+            if _should_refresh_early(ttl_left):
+                _schedule_list_refresh(key, skip, limit, category, q)
+            return _CATEGORY_LIST.validate_json(cached)
+
+        items = await crud.list_all(skip=skip, limit=limit, category=category, q=q)
+        await _cache_set(key, _CATEGORY_LIST.dump_json(items).decode())
+        return items
+    except (PyMongoError, ValidationError) as e:
         raise HTTPException(status_code=500, detail=f"Failed to list categories: {e}")
 
 
@@ -101,13 +263,17 @@ async def get_item_service(item_id: PyObjectId) -> CategoriesOut:
         HTTPException: 404 if not found
     """
     try:
+        key = _category_key(item_id)
+        cached = await _cache_get(key)
+        if cached is not None:
+            return CategoriesOut.model_validate_json(cached)
+
         item = await crud.get_one(item_id)
         if not item:
             raise HTTPException(status_code=404, detail="Category not found")
+        await _cache_set(key, item.model_dump_json())
         return item
-    except HTTPException:
-        raise
-    except Exception as e:
+    except (PyMongoError, ValidationError) as e:
         raise HTTPException(status_code=500, detail=f"Failed to get category: {e}")
 
 
@@ -123,31 +289,69 @@ async def update_item_service(item_id: PyObjectId, payload: CategoriesUpdate) ->
         CategoriesOut
     """
     try:
-        if not any(v is not None for v in payload.model_dump().values()):
+        if not has_updates(payload):
             raise HTTPException(status_code=400, detail="No fields provided for update")
 
         updated = await crud.update_one(item_id, payload)
         if not updated:
             raise HTTPException(status_code=404, detail="Category not found")
+        await _invalidate_cache(item_id)
         return updated
-    except HTTPException:
-        raise
-    except Exception as e:
-        if "E11000" in str(e):
-            raise HTTPException(status_code=409, detail="Duplicate category")
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Duplicate category")
+    except (PyMongoError, ValidationError) as e:
         raise HTTPException(status_code=500, detail=f"Failed to update category: {e}")
 
 
-async def delete_item_service(item_id: PyObjectId):
+# Images per GridFS bulk delete when streaming progress
+_STREAM_CLEANUP_CHUNK = 100
+
+
+def _sse(event: Dict[str, Any]) -> bytes:
+    return b"data: " + orjson.dumps(event) + b"\n\n"
+
+
+async def _cleanup_gridfs_urls_logged(urls: list[str]) -> None:
+    """Background variant of _cleanup_gridfs_urls: warnings go to the log."""
+    for warning in await _cleanup_gridfs_urls(urls):
+        _LOG.warning("Category image cleanup failed: %s", warning)
+
+
+async def _delete_events(result: Dict[str, Any]) -> AsyncIterator[bytes]:
+    """Stream cascade stats first, then GridFS cleanup progress chunk by chunk."""
+    yield _sse({"stage": "categories_deleted", "stats": result.get("stats", {})})
+
+    urls = result.get("image_urls", [])
+    warnings: List[str] = []
+    for start in range(0, len(urls), _STREAM_CLEANUP_CHUNK):
+        warnings.extend(await _cleanup_gridfs_urls(urls[start:start + _STREAM_CLEANUP_CHUNK]))
+        yield _sse({"stage": "gridfs", "done": min(start + _STREAM_CLEANUP_CHUNK, len(urls)), "total": len(urls)})
+
+    done: Dict[str, Any] = {"stage": "complete", "deleted": True}
+    if warnings:
+        done["file_cleanup_warnings"] = warnings
+    yield _sse(done)
+
+
+async def delete_item_service(
+    item_id: PyObjectId,
+    stream: bool = False,
+    background: Optional[BackgroundTasks] = None,
+):
     """
     Delete a category and cascade deletion of dependent products.
     Then perform non-fatal GridFS cleanup of images.
 
     Args:
         item_id (PyObjectId)
+        stream (bool): Reply as server-sent events once the DB cascade commits,
+            reporting GridFS cleanup progress instead of waiting for it.
+        background (BackgroundTasks, optional): Run the GridFS cleanup after the
+            response is sent; failures are logged instead of returned.
 
     Returns:
-        JSONResponse with deletion status, stats, and optional file cleanup warnings.
+        ORJSONResponse with deletion status, stats, and optional file cleanup warnings,
+        or a text/event-stream StreamingResponse when `stream` is set.
     """
     try:
         result = await crud.delete_one_cascade(item_id)
@@ -155,17 +359,82 @@ async def delete_item_service(item_id: PyObjectId):
             raise HTTPException(status_code=404, detail="Category not found")
         if result["status"] != "deleted":
             raise HTTPException(status_code=500, detail="Failed to delete category")
+        await _invalidate_cache(item_id)
+
+        if stream:
+            return StreamingResponse(_delete_events(result), media_type="text/event-stream")
 
-        warnings = await _cleanup_gridfs_urls(result.get("image_urls", []))
         payload: Dict[str, Any] = {
             "deleted": True,
             "stats": result.get("stats", {}),
         }
+        if background is not None:
+            background.add_task(_cleanup_gridfs_urls_logged, result.get("image_urls", []))
+            return ORJSONResponse(status_code=200, content=payload)
+
+        warnings = await _cleanup_gridfs_urls(result.get("image_urls", []))
         if warnings:
             payload["file_cleanup_warnings"] = warnings
 
-        return JSONResponse(status_code=200, content=payload)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to delete category: {e}")
\ No newline at end of file
+        return ORJSONResponse(status_code=200, content=payload)
+    except (PyMongoError, ValidationError) as e:
+        raise HTTPException(status_code=500, detail=f"Failed to delete category: {e}")
+
+
+async def bulk_get_items_service(ids: List[PyObjectId]) -> CategoriesBatchOut:
+    """
+    Fetch several categories in one request. Lookups run concurrently through
+    get_item_service (so they share its cache); misses are reported per id.
+
+    Args:
+        ids (List[PyObjectId])
+
+    Returns:
+        CategoriesBatchOut: found items plus per-id errors.
+    """
+    ids = list(dict.fromkeys(ids))
+    results = await asyncio.gather(*(get_item_service(i) for i in ids), return_exceptions=True)
+
+    out = CategoriesBatchOut()
+    for item_id, res in zip(ids, results):
+        if isinstance(res, HTTPException):
+            out.errors.append(CategoriesBatchError(id=str(item_id), status=res.status_code, error=str(res.detail)))
+        elif isinstance(res, Exception):
+            out.errors.append(CategoriesBatchError(id=str(item_id), status=500, error=str(res)))
+        else:
+            out.items.append(res)
+    return out
+
+
+async def bulk_delete_items_service(ids: List[PyObjectId]) -> CategoriesBatchDeleteOut:
+    """
+    Delete several categories (and their products) in one transaction, then
+    clean up every affected image with a single bulk GridFS delete.
+
+    Args:
+        ids (List[PyObjectId])
+
+    Returns:
+        CategoriesBatchDeleteOut: deleted ids, per-id 404s, cascade stats and
+        optional file cleanup warnings.
+    """
+    try:
+        ids = list(dict.fromkeys(ids))
+        result = await crud.delete_many_cascade(ids)
+        if result["status"] != "deleted":
+            raise HTTPException(status_code=500, detail="Failed to delete categories")
+
+        await _invalidate_cache(*result["deleted_ids"])
+
+        warnings = await _cleanup_gridfs_urls(result["image_urls"])
+        return CategoriesBatchDeleteOut(
+            deleted=[str(i) for i in result["deleted_ids"]],
+            errors=[
+                CategoriesBatchError(id=str(i), status=404, error="Category not found")
+                for i in result["not_found_ids"]
+            ],
+            stats=result["stats"],
+            file_cleanup_warnings=warnings or None,
+        )
+    except (PyMongoError, ValidationError) as e:
+        raise HTTPException(status_code=500, detail=f"Failed to delete categories: {e}")
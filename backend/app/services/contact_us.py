@@ -1,21 +1,112 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import AsyncSessionLocal
 from app.crud import contact_us as crud
 from app.schemas.contact_us import ContactUsCreate, ContactUsUpdate
 import uuid
 
 
-async def create_contact(session: AsyncSession, payload: ContactUsCreate):
+class _ContactInsertBatcher:
+    """
+    Coalesces concurrent contact submissions into one INSERT per short window.
+
+    Each caller enqueues its row and awaits a future; a single worker task
+    collects up to `max_batch_size` rows (or whatever arrived within
+    `max_wait` seconds of the first) and writes them with one statement.
+    Started/stopped from the app lifespan; before start() it inserts directly.
+    """
+
+    def __init__(self, max_batch_size: int = 64, max_wait: float = 0.01):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush whatever is queued, then stop the worker."""
+        if self._worker is None:
+            return
+        self._queue.put_nowait(None)
+        await self._worker
+        self._worker = None
+        self._queue = None
+
+    async def submit(self, row: Dict[str, Any]):
+        if self._worker is None:
+            return (await self._insert([row]))[0]
+        fut = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((row, fut))
+        return await fut
+
+    @staticmethod
+    async def _insert(rows: List[Dict[str, Any]]):
+        async with AsyncSessionLocal() as session:
+            return await crud.create_contacts_bulk(session, rows)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+            batch: List[Tuple[Dict[str, Any], asyncio.Future]] = [first]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        try:
+            saved = await self._insert([row for row, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                if not batch[0][1].done():
+                    batch[0][1].set_exception(e)
+                return
+            # One bad row must not fail unrelated submissions: retry singly
+            for item in batch:
+                await self._flush([item])
+            return
+        for (_, fut), obj in zip(batch, saved):
+            if not fut.done():
+                fut.set_result(obj)
+
+
+contact_batcher = _ContactInsertBatcher()
+
+
+async def create_contact(payload: ContactUsCreate):
     """
     Create a new contact-us entry.
 
+    Concurrent submissions are coalesced by `contact_batcher` into a single
+    multi-row INSERT.
+
     Args:
-        session (AsyncSession): Active database session.
         payload (ContactUsCreate): Incoming validated request data.
 
     Returns:
         ContactUsRead: Newly created contact record.
     """
-    return await crud.create_contact(session, payload)
+    return await contact_batcher.submit(payload.model_dump())
 
 
 async def get_contact(session: AsyncSession, contact_id: uuid.UUID):
@@ -59,7 +150,7 @@ async def update_contact(session: AsyncSession, contact_id: uuid.UUID, payload:
     Returns:
         ContactUsRead | None: Updated record if successful, else None.
     """
-    return await crud.update_contact(session, contact_id, payload)
+    return await crud.update_contact(session, contact_id, payload.model_dump(exclude_unset=True, exclude_none=True))
 
 
 async def delete_contact(session: AsyncSession, contact_id: uuid.UUID):
@@ -11,31 +11,102 @@ Provides aggregated insights for the admin dashboard such as:
 """
 
 from __future__ import annotations
+import asyncio
 import datetime as dt
+import functools
 from datetime import datetime, timezone
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence, Tuple
 
 from bson import ObjectId
 from app.core.database import db
+from app.services._dashboard_cache import dashboard_cached
+from app.services._status_cache import get_status_ids
 
 TZ = "Asia/Kolkata"
 
+# Materialized aggregates, rebuilt by app.tasks.dashboard_views
+DAILY_SALES_VIEW = "dashboard_daily_sales"
+USER_GROWTH_VIEW = "dashboard_user_growth"
+PRODUCT_SALES_VIEW = "dashboard_product_sales"
+CATEGORY_SALES_VIEW = "dashboard_category_sales"
+BRAND_SALES_VIEW = "dashboard_brand_sales"
+
+# Status name groups (stored lower-case, matched exactly)
+_PENDING_ORDER_STATUSES = ("pending", "processing", "confirmed", "shipped")
+_COMPLETED_ORDER_STATUSES = ("delivered", "completed")
+_PENDING_REQUEST_STATUSES = ("pending", "requested", "processing")
+
+# (source collection, view, pipeline); the refresh job appends $out to each
+def materialized_views() -> List[tuple]:
+    return [
+        ("orders", DAILY_SALES_VIEW, _daily_pipeline({"$ifNull": ["$total", 0]}, ("total",))),
+        ("users", USER_GROWTH_VIEW, _daily_pipeline(1)),
+        ("order_items", PRODUCT_SALES_VIEW, _top_products_pipeline()),
+        ("order_items", CATEGORY_SALES_VIEW,
+         _sales_by_pipeline("categories", "category_id", "category", "category_id", "category_name")),
+        ("order_items", BRAND_SALES_VIEW,
+         _sales_by_pipeline("brands", "brand_id", "name", "brand_id", "brand_name")),
+    ]
+
+
+@functools.lru_cache(maxsize=64)
+def _floor(today: dt.date, days_back: int) -> datetime:
+    start = today - dt.timedelta(days=days_back)
+    return datetime(start.year, start.month, start.day, tzinfo=timezone.utc)
+
 
 def _date_floor_utc(days_back: int) -> datetime:
     """
     Compute a UTC datetime representing midnight (00:00:00 UTC) N days ago.
 
+    Memoized per (UTC date, days_back), so repeated dashboard calls on the
+    same day reuse one tz-aware value.
+
     Args:
         days_back (int): Number of days in the past to compute from.
 
     Returns:
-        datetime: Midnight UTC timestamp N days before today.
+        datetime: Midnight UTC timestamp N days before today (tz-aware).
     """
-    now = datetime.now(timezone.utc)
-    start = now - dt.timedelta(days=days_back)
-    return datetime(start.year, start.month, start.day)
+    return _floor(datetime.now(timezone.utc).date(), days_back)
 
 
+async def _orders_summary(pending_ids: Sequence[ObjectId] = (), completed_ids: Sequence[ObjectId] = ()) -> Dict[str, Any]:
+    """
+    Order count, revenue (sum of `orders.total`) and pending/completed counts
+    in one $group pass. Revenue needs a full scan anyway, so the counts ride
+    along on it instead of costing their own commands.
+    """
+    def _in(ids: Sequence[ObjectId]) -> Dict[str, Any]:
+        return {"$sum": {"$cond": [{"$in": ["$status_id", list(ids)]}, 1, 0]}}
+
+    agg = await db["orders"].aggregate([
+        {"$group": {
+            "_id": None,
+            "orders": {"$sum": 1},
+            "revenue": {"$sum": {"$ifNull": ["$total", 0]}},
+            "pending": _in(pending_ids),
+            "completed": _in(completed_ids),
+        }},
+        {"$project": {"_id": 0, "orders": 1, "revenue": {"$toDouble": "$revenue"}, "pending": 1, "completed": 1}},
+    ]).to_list(1)
+    return agg[0] if agg else {"orders": 0, "revenue": 0.0, "pending": 0, "completed": 0}
+
+
+async def _count_in_statuses(status_coll: str, names: Sequence[str], target_coll: str, field: str) -> int:
+    """
+    Count `target_coll` documents whose `field` points at a status in
+    `status_coll` named in `names`. Status ids come from
+    the in-process status cache, so this is a single $in count answered as a
+    COUNT_SCAN by the (<field>, createdAt) indexes from scripts/seed.py.
+    """
+    status_ids, _ = await get_status_ids(status_coll, names)
+    if not status_ids:
+        return 0
+    return await db[target_coll].count_documents({field: {"$in": status_ids}})
+
+
+@dashboard_cached()
 async def get_overview() -> Dict[str, Any]:
     """
     Compute high-level system metrics for the admin dashboard.
@@ -46,48 +117,42 @@ async def get_overview() -> Dict[str, Any]:
       - Total orders
       - Total returns
       - Total exchanges
-      - Total revenue (from successful payments)
+      - Total revenue (sum of order totals, from the same pass as the order count)
 
     Returns:
         Dict[str, Any]: Aggregated counts and revenue value.
     """
-    users = await db["users"].count_documents({})
-    products = await db["products"].count_documents({})
-    orders = await db["orders"].count_documents({})
-    returns = await db["returns"].count_documents({})
-    exchanges = await db["exchanges"].count_documents({})
-
-    # Calculate total revenue from all confirmed orders
-    pipeline = [
-        {"$group": {"_id": None, "sum": {"$sum": {"$ifNull": ["$total", 0]}}}},
-    ]
-    agg = await db["orders"].aggregate(pipeline).to_list(1)
-    revenue = float(agg[0]["sum"]) if agg else 0.0
+    # Unfiltered totals come from collection metadata, not a count scan;
+    # order count and revenue share the single orders pass
+    users, products, returns, exchanges, orders = await asyncio.gather(
+        db["users"].estimated_document_count(),
+        db["products"].estimated_document_count(),
+        db["returns"].estimated_document_count(),
+        db["exchanges"].estimated_document_count(),
+        _orders_summary(),
+    )
 
     return {
         "users": users,
         "products": products,
-        "orders": orders,
+        "orders": orders["orders"],
         "returns": returns,
         "exchanges": exchanges,
-        "revenue": revenue,
+        "revenue": orders["revenue"],
     }
 
 
-async def sales_series(days: int) -> List[Dict[str, Any]]:
+def _daily_pipeline(value: Any, fields: Tuple[str, ...] = ()) -> List[Dict[str, Any]]:
     """
-    Aggregate daily sales revenue over the specified number of days.
-
-    Args:
-        days (int): Number of days to include (e.g., last 30 days).
+    Group a collection by local calendar day (TZ) on createdAt, summing `value`.
 
-    Returns:
-        List[Dict[str, Any]]: A list of daily {date, value} pairs where
-        `value` is total order revenue on that date.
+    The leading sort + projection lets the (createdAt[, fields]) indexes from
+    scripts/seed.py serve the scan as a covered IXSCAN; `fields` must list
+    every document field `value` reads.
     """
-    start_utc = _date_floor_utc(days)
-    pipeline = [
-        {"$match": {"createdAt": {"$gte": start_utc}}},
+    return [
+        {"$sort": {"createdAt": 1}},
+        {"$project": {"_id": 0, "createdAt": 1, **{f: 1 for f in fields}}},
         {"$group": {
             "_id": {
                 "$dateTrunc": {
@@ -96,17 +161,85 @@ async def sales_series(days: int) -> List[Dict[str, Any]]:
                     "timezone": TZ
                 }
             },
-            "value": {"$sum": {"$ifNull": ["$total", 0]}},
+            "value": {"$sum": value},
+        }},
+        {"$set": {"value": {"$toDouble": "$value"}}},
+    ]
+
+
+def _top_products_pipeline() -> List[Dict[str, Any]]:
+    """
+    Per-product sales totals from order_items (unsorted, unlimited).
+    Groups first so products are joined once per product, not once per line.
+    Distinct orders are counted by grouping on (product, order) and then
+    re-grouping, so no per-product order-id set is held in memory.
+    """
+    return [
+        {"$group": {
+            "_id": {"pid": "$product_id", "oid": "$order_id"},
+            "qty": {"$sum": {"$ifNull": ["$quantity", 0]}},
+        }},
+        {"$group": {
+            "_id": "$_id.pid",
+            "total_quantity": {"$sum": "$qty"},
+            "total_orders": {"$sum": 1},
+        }},
+        {"$lookup": {
+            "from": "products",
+            "localField": "_id",
+            "foreignField": "_id",
+            "pipeline": [{"$project": {"name": 1, "total_price": 1}}],
+            "as": "prod"
+        }},
+        {"$unwind": "$prod"},
+        {"$project": {
+            "product_id": {"$toString": "$_id"},
+            "name": "$prod.name",
+            "total_quantity": {"$toLong": "$total_quantity"},
+            "total_orders": {"$toInt": "$total_orders"},
+            "total_revenue": {"$toDouble": {"$multiply": [
+                "$total_quantity", {"$ifNull": ["$prod.total_price", 0]},
+            ]}},
         }},
-        {"$sort": {"_id": 1}},
     ]
-    rows = await db["orders"].aggregate(pipeline).to_list(None)
-    return [{"date": r["_id"].date().isoformat(), "value": float(r["value"])} for r in rows]
 
 
+async def _read_daily_view(view: str, days: int) -> List[Dict[str, Any]]:
+    # Whole local days: the bucket that straddles start_utc is included in full
+    start = _date_floor_utc(days) - dt.timedelta(days=1)
+    return await (
+        db[view]
+        .find(
+            {"_id": {"$gt": start}},
+            {"_id": 0, "date": {"$dateToString": {"format": "%Y-%m-%d", "date": "$_id"}}, "value": 1},
+        )
+        .sort("_id", 1)
+        .to_list(None)
+    )
+
+
+@dashboard_cached()
+async def sales_series(days: int) -> List[Dict[str, Any]]:
+    """
+    Daily sales revenue over the specified number of days.
+
+    Reads the `dashboard_daily_sales` view maintained by
+    app.tasks.dashboard_views instead of scanning orders per request.
+
+    Args:
+        days (int): Number of days to include (e.g., last 30 days).
+
+    Returns:
+        List[Dict[str, Any]]: A list of daily {date, value} pairs where
+        `value` is total order revenue on that date.
+    """
+    return await _read_daily_view(DAILY_SALES_VIEW, days)
+
+
+@dashboard_cached()
 async def user_growth(days: int) -> List[Dict[str, Any]]:
     """
-    Aggregate count of new user registrations per day.
+    Count of new user registrations per day (from `dashboard_user_growth`).
 
     Args:
         days (int): Days in the past to compute.
@@ -114,28 +247,14 @@ async def user_growth(days: int) -> List[Dict[str, Any]]:
     Returns:
         List[Dict]: List of {date, value} where `value` is number of users joined that day.
     """
-    start_utc = _date_floor_utc(days)
-    pipeline = [
-        {"$match": {"createdAt": {"$gte": start_utc}}},
-        {"$group": {
-            "_id": {
-                "$dateTrunc": {
-                    "date": "$createdAt",
-                    "unit": "day",
-                    "timezone": TZ
-                }
-            },
-            "value": {"$sum": 1},
-        }},
-        {"$sort": {"_id": 1}},
-    ]
-    rows = await db["users"].aggregate(pipeline).to_list(None)
-    return [{"date": r["_id"].date().isoformat(), "value": float(r["value"])} for r in rows]
+    return await _read_daily_view(USER_GROWTH_VIEW, days)
 
 
+@dashboard_cached(ttl=300)
 async def top_products(limit: int) -> List[Dict[str, Any]]:
     """
-    Find the top-selling products by quantity and revenue.
+    Find the top-selling products by quantity and revenue
+    (from `dashboard_product_sales`).
 
     Args:
         limit (int): Maximum number of products to return.
@@ -148,61 +267,45 @@ async def top_products(limit: int) -> List[Dict[str, Any]]:
             - total_orders count
             - total_revenue computed
     """
-    pipeline = [
-        {"$lookup": {
-            "from": "products",
-            "localField": "product_id",
-            "foreignField": "_id",
-            "as": "prod"
-        }},
-        {"$unwind": "$prod"},
-        {"$group": {
-            "_id": "$product_id",
-            "name": {"$first": "$prod.name"},
-            "total_quantity": {"$sum": {"$ifNull": ["$quantity", 0]}},
-            "total_orders": {"$addToSet": "$order_id"},
-            "unit_price": {"$first": {"$ifNull": ["$prod.total_price", 0]}},
-        }},
-        {"$project": {
-            "_id": 0,
-            "product_id": {"$toString": "$_id"},
-            "name": 1,
-            "total_quantity": 1,
-            "total_orders": {"$size": "$total_orders"},
-            "total_revenue": {"$multiply": ["$total_quantity", "$unit_price"]},
-        }},
-        {"$sort": {"total_quantity": -1, "total_revenue": -1}},
-        {"$limit": limit},
-    ]
-    rows = await db["order_items"].aggregate(pipeline).to_list(None)
-    for r in rows:
-        r["total_revenue"] = float(r.get("total_revenue", 0.0))
-        r["total_quantity"] = int(r.get("total_quantity", 0))
-        r["total_orders"] = int(r.get("total_orders", 0))
-    return rows
+    return await (
+        db[PRODUCT_SALES_VIEW]
+        .find({}, {"_id": 0})
+        .sort([("total_quantity", -1), ("total_revenue", -1)])
+        .limit(limit)
+        .to_list(None)
+    )
 
 
-async def low_stock(threshold: int) -> List[Dict[str, Any]]:
+async def low_stock(threshold: int, limit: int = 50) -> List[Dict[str, Any]]:
     """
     Return list of products whose quantity is below or equal to a threshold.
 
     Args:
         threshold (int): Minimum stock threshold.
+        limit (int): Maximum number of products to return (lowest stock first).
 
     Returns:
         List[Dict[str, Any]]: product_id, name, and current quantity.
     """
-    cursor = db["products"].find({"quantity": {"$lte": threshold}}, {"_id": 1, "name": 1, "quantity": 1}).sort("quantity", 1)
-    items: List[Dict[str, Any]] = []
-    async for d in cursor:
-        items.append({
-            "product_id": str(d["_id"]),
-            "name": d.get("name", ""),
-            "quantity": int(d.get("quantity", 0)),
-        })
-    return items
+    return await (
+        db["products"]
+        .find(
+            {"quantity": {"$lte": threshold}},
+            {
+                "_id": 0,
+                "product_id": {"$toString": "$_id"},
+                "name": {"$ifNull": ["$name", ""]},
+                "quantity": {"$toInt": "$quantity"},
+            },
+        )
+        .sort("quantity", 1)
+        .limit(limit)
+        .batch_size(limit)
+        .to_list(limit)
+    )
 
 
+@dashboard_cached(ttl=30)
 async def system_health() -> Dict[str, Any]:
     """
     Summarize system backups and restore health.
@@ -254,6 +357,7 @@ async def system_health() -> Dict[str, Any]:
 
 # ---------- Admin Dashboard Functions ----------
 
+@dashboard_cached()
 async def get_admin_overview() -> Dict[str, Any]:
     """
     Get complete admin dashboard overview with:
@@ -266,348 +370,235 @@ async def get_admin_overview() -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Aggregated admin dashboard metrics.
     """
-    # Counts
-    total_categories = await db["categories"].count_documents({})
-    total_brands = await db["brands"].count_documents({})
-    total_products = await db["products"].count_documents({})
-    total_orders = await db["orders"].count_documents({})
-    total_users = await db["users"].count_documents({})
-    out_of_stock = await db["products"].count_documents({"out_of_stock": True})
-
-    # Get pending status IDs for orders
-    pending_order_statuses = []
-    async for s in db["order_status"].find(
-        {"status": {"$regex": "pending|processing|confirmed|shipped", "$options": "i"}},
-        {"_id": 1}
-    ):
-        pending_order_statuses.append(s["_id"])
-    
-    pending_orders_count = 0
-    if pending_order_statuses:
-        pending_orders_count = await db["orders"].count_documents({
-            "status_id": {"$in": pending_order_statuses}
-        })
-
-    # Get completed/delivered order status IDs
-    completed_order_statuses = []
-    async for s in db["order_status"].find(
-        {"status": {"$regex": "delivered|completed", "$options": "i"}},
-        {"_id": 1}
-    ):
-        completed_order_statuses.append(s["_id"])
-    
-    completed_orders_count = 0
-    if completed_order_statuses:
-        completed_orders_count = await db["orders"].count_documents({
-            "status_id": {"$in": completed_order_statuses}
-        })
-
-    # Get pending return status IDs
-    pending_return_statuses = []
-    async for s in db["return_status"].find(
-        {"status": {"$regex": "pending|requested|processing", "$options": "i"}},
-        {"_id": 1}
-    ):
-        pending_return_statuses.append(s["_id"])
-    
-    pending_returns_count = 0
-    if pending_return_statuses:
-        pending_returns_count = await db["returns"].count_documents({
-            "return_status_id": {"$in": pending_return_statuses}
-        })
-
-    # Get pending exchange status IDs
-    pending_exchange_statuses = []
-    async for s in db["exchange_status"].find(
-        {"status": {"$regex": "pending|requested|processing", "$options": "i"}},
-        {"_id": 1}
-    ):
-        pending_exchange_statuses.append(s["_id"])
-    
-    pending_exchanges_count = 0
-    if pending_exchange_statuses:
-        pending_exchanges_count = await db["exchanges"].count_documents({
-            "exchange_status_id": {"$in": pending_exchange_statuses}
-        })
-
-    # Total earnings from all orders
-    pipeline = [
-        {"$group": {"_id": None, "sum": {"$sum": {"$ifNull": ["$total", 0]}}}},
-    ]
-    agg = await db["orders"].aggregate(pipeline).to_list(1)
-    total_earnings = float(agg[0]["sum"]) if agg else 0.0
+    (pending_ids, _), (completed_ids, _) = await asyncio.gather(
+        get_status_ids("order_status", _PENDING_ORDER_STATUSES),
+        get_status_ids("order_status", _COMPLETED_ORDER_STATUSES),
+    )
+
+    # Every figure is independent; all order figures come from one pass over
+    # orders, so the whole overview costs about one slowest query.
+    (
+        total_categories,
+        total_brands,
+        total_products,
+        total_users,
+        out_of_stock,
+        pending_returns_count,
+        pending_exchanges_count,
+        orders,
+    ) = await asyncio.gather(
+        db["categories"].estimated_document_count(),
+        db["brands"].estimated_document_count(),
+        db["products"].estimated_document_count(),
+        db["users"].estimated_document_count(),
+        db["products"].count_documents({"out_of_stock": True}),
+        _count_in_statuses("return_status", _PENDING_REQUEST_STATUSES, "returns", "return_status_id"),
+        _count_in_statuses("exchange_status", _PENDING_REQUEST_STATUSES, "exchanges", "exchange_status_id"),
+        _orders_summary(pending_ids, completed_ids),
+    )
 
     return {
-        "total_earnings": total_earnings,
-        "pending_orders": pending_orders_count,
+        "total_earnings": orders["revenue"],
+        "pending_orders": orders["pending"],
         "pending_returns": pending_returns_count,
         "pending_exchanges": pending_exchanges_count,
         "total_categories": total_categories,
         "total_brands": total_brands,
         "total_products": total_products,
-        "total_orders": total_orders,
+        "total_orders": orders["orders"],
         "total_users": total_users,
-        "completed_orders": completed_orders_count,
+        "completed_orders": orders["completed"],
         "out_of_stock_products": out_of_stock,
     }
 
 
-async def get_sales_by_category() -> Dict[str, Any]:
+def _sales_by_pipeline(ref_coll: str, ref_field: str, name_field: str, id_key: str, name_key: str) -> List[Dict[str, Any]]:
     """
-    Get sales breakdown by category.
+    Sales totals from order_items grouped by a product reference
+    (products.<ref_field> -> <ref_coll>), unsorted.
 
-    Returns:
-        Dict with categories list and total count.
+    Collapses order lines per product before any $lookup, so products and the
+    referenced collection are joined once per product / group.
     """
-    pipeline = [
-        # Join order_items with products to get category_id
+    return [
+        {"$group": {
+            "_id": "$product_id",
+            "quantity": {"$sum": {"$ifNull": ["$quantity", 1]}},
+            "orders": {"$addToSet": "$order_id"},
+        }},
+        # Product -> reference id and unit price
         {"$lookup": {
             "from": "products",
-            "localField": "product_id",
+            "localField": "_id",
             "foreignField": "_id",
+            "pipeline": [{"$project": {ref_field: 1, "total_price": 1}}],
             "as": "product"
         }},
         {"$unwind": {"path": "$product", "preserveNullAndEmptyArrays": False}},
-        # Join with categories to get category name
+        {"$group": {
+            "_id": f"$product.{ref_field}",
+            "total_quantity": {"$sum": "$quantity"},
+            "orders": {"$push": "$orders"},
+            "total_revenue": {"$sum": {"$multiply": [
+                "$quantity",
+                {"$ifNull": ["$product.total_price", 0]},
+            ]}},
+        }},
+        # Reference name (drops groups whose reference no longer exists)
         {"$lookup": {
-            "from": "categories",
-            "localField": "product.category_id",
+            "from": ref_coll,
+            "localField": "_id",
             "foreignField": "_id",
-            "as": "category"
-        }},
-        {"$unwind": {"path": "$category", "preserveNullAndEmptyArrays": False}},
-        # Group by category
-        {"$group": {
-            "_id": "$product.category_id",
-            "category_name": {"$first": "$category.category"},
-            "total_quantity": {"$sum": {"$ifNull": ["$quantity", 1]}},
-            "total_orders": {"$addToSet": "$order_id"},
-            "unit_prices": {"$push": {"$ifNull": ["$product.total_price", 0]}},
-            "quantities": {"$push": {"$ifNull": ["$quantity", 1]}}
+            "pipeline": [{"$project": {name_field: 1}}],
+            "as": "ref"
         }},
-        # Calculate revenue
+        {"$unwind": {"path": "$ref", "preserveNullAndEmptyArrays": False}},
         {"$project": {
-            "_id": 0,
-            "category_id": {"$toString": "$_id"},
-            "category_name": 1,
-            "total_quantity": 1,
-            "total_orders": {"$size": "$total_orders"},
-            "total_revenue": {
-                "$reduce": {
-                    "input": {"$range": [0, {"$size": "$unit_prices"}]},
-                    "initialValue": 0,
-                    "in": {
-                        "$add": [
-                            "$$value",
-                            {"$multiply": [
-                                {"$arrayElemAt": ["$unit_prices", "$$this"]},
-                                {"$arrayElemAt": ["$quantities", "$$this"]}
-                            ]}
-                        ]
-                    }
-                }
-            }
+            id_key: {"$toString": "$_id"},
+            name_key: f"$ref.{name_field}",
+            "total_quantity": {"$toLong": "$total_quantity"},
+            # distinct orders across the group's products
+            "total_orders": {"$toInt": {"$size": {"$reduce": {
+                "input": "$orders",
+                "initialValue": [],
+                "in": {"$setUnion": ["$$value", "$$this"]},
+            }}}},
+            "total_revenue": {"$toDouble": "$total_revenue"},
         }},
-        {"$sort": {"total_revenue": -1}}
     ]
-    
-    categories = await db["order_items"].aggregate(pipeline).to_list(None)
-    
-    # Ensure proper types
-    for cat in categories:
-        cat["total_quantity"] = int(cat.get("total_quantity", 0))
-        cat["total_orders"] = int(cat.get("total_orders", 0))
-        cat["total_revenue"] = float(cat.get("total_revenue", 0.0))
-    
+
+
+async def _read_sales_view(view: str) -> List[Dict[str, Any]]:
+    # Views store typed values (see the pipelines' final $project)
+    return await db[view].find({}, {"_id": 0}).sort("total_revenue", -1).to_list(None)
+
+
+@dashboard_cached(ttl=300)
+async def get_sales_by_category() -> Dict[str, Any]:
+    """
+    Get sales breakdown by category (from `dashboard_category_sales`).
+
+    Returns:
+        Dict with categories list and total count.
+    """
+    categories = await _read_sales_view(CATEGORY_SALES_VIEW)
     return {
         "categories": categories,
         "total_categories": len(categories)
     }
 
 
+@dashboard_cached(ttl=300)
 async def get_sales_by_brand() -> Dict[str, Any]:
     """
-    Get sales breakdown by brand.
+    Get sales breakdown by brand (from `dashboard_brand_sales`).
 
     Returns:
         Dict with brands list and total count.
     """
-    pipeline = [
-        # Join order_items with products to get brand_id
-        {"$lookup": {
-            "from": "products",
-            "localField": "product_id",
-            "foreignField": "_id",
-            "as": "product"
-        }},
-        {"$unwind": {"path": "$product", "preserveNullAndEmptyArrays": False}},
-        # Join with brands to get brand name
-        {"$lookup": {
-            "from": "brands",
-            "localField": "product.brand_id",
-            "foreignField": "_id",
-            "as": "brand"
-        }},
-        {"$unwind": {"path": "$brand", "preserveNullAndEmptyArrays": False}},
-        # Group by brand
-        {"$group": {
-            "_id": "$product.brand_id",
-            "brand_name": {"$first": "$brand.name"},
-            "total_quantity": {"$sum": {"$ifNull": ["$quantity", 1]}},
-            "total_orders": {"$addToSet": "$order_id"},
-            "unit_prices": {"$push": {"$ifNull": ["$product.total_price", 0]}},
-            "quantities": {"$push": {"$ifNull": ["$quantity", 1]}}
-        }},
-        # Calculate revenue
-        {"$project": {
-            "_id": 0,
-            "brand_id": {"$toString": "$_id"},
-            "brand_name": 1,
-            "total_quantity": 1,
-            "total_orders": {"$size": "$total_orders"},
-            "total_revenue": {
-                "$reduce": {
-                    "input": {"$range": [0, {"$size": "$unit_prices"}]},
-                    "initialValue": 0,
-                    "in": {
-                        "$add": [
-                            "$$value",
-                            {"$multiply": [
-                                {"$arrayElemAt": ["$unit_prices", "$$this"]},
-                                {"$arrayElemAt": ["$quantities", "$$this"]}
-                            ]}
-                        ]
-                    }
-                }
-            }
-        }},
-        {"$sort": {"total_revenue": -1}}
-    ]
-    
-    brands = await db["order_items"].aggregate(pipeline).to_list(None)
-    
-    # Ensure proper types
-    for brand in brands:
-        brand["total_quantity"] = int(brand.get("total_quantity", 0))
-        brand["total_orders"] = int(brand.get("total_orders", 0))
-        brand["total_revenue"] = float(brand.get("total_revenue", 0.0))
-    
+    brands = await _read_sales_view(BRAND_SALES_VIEW)
     return {
         "brands": brands,
         "total_brands": len(brands)
     }
 
 
+def _oid_str(field: str) -> Dict[str, Any]:
+    return {"$toString": {"$ifNull": [f"${field}", ""]}}
+
+
+async def _pending_items(
+    coll: str, status_field: str, status_coll: str, status_ids: list, limit: int, shape: Dict[str, Any]
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Newest `limit` documents in one of `status_ids` plus the total match
+    count, fetched in a single `$facet` round trip. Items are shaped
+    server-side with the status name joined in.
+    """
+    if not status_ids:
+        return [], 0
+    res = await db[coll].aggregate([
+        {"$match": {status_field: {"$in": status_ids}}},
+        {"$facet": {
+            "items": [
+                {"$sort": {"createdAt": -1}},
+                {"$limit": limit},
+                {"$lookup": {
+                    "from": status_coll,
+                    "localField": status_field,
+                    "foreignField": "_id",
+                    "pipeline": [{"$project": {"_id": 0, "status": 1}}],
+                    "as": "s",
+                }},
+                {"$project": {"_id": 0, **shape}},
+            ],
+            "total": [{"$count": "n"}],
+        }},
+    ]).to_list(1)
+    facet = res[0] if res else {"items": [], "total": []}
+    total = facet["total"][0]["n"] if facet["total"] else 0
+    return facet["items"], total
+
+
+async def _pending_orders(status_ids: list, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+    rows, total = await _pending_items("orders", "status_id", "order_status", status_ids, limit, {
+        "order_id": {"$toString": "$_id"},
+        "user_id": _oid_str("user_id"),
+        "total": {"$toDouble": {"$ifNull": ["$total", 0]}},
+        "status": {"$first": "$s.status"},
+        "delivery_date": 1,
+        "created_at": "$createdAt",
+    })
+    for r in rows:
+        r["delivery_date"] = r["delivery_date"].isoformat() if r.get("delivery_date") else None
+    return rows, total
+
+
+async def _pending_requests(
+    coll: str, status_field: str, status_coll: str, id_key: str, status_key: str, status_ids: list, limit: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    return await _pending_items(coll, status_field, status_coll, status_ids, limit, {
+        id_key: {"$toString": "$_id"},
+        "order_id": _oid_str("order_id"),
+        "user_id": _oid_str("user_id"),
+        "product_id": _oid_str("product_id"),
+        "reason": 1,
+        status_key: {"$first": "$s.status"},
+        "created_at": "$createdAt",
+    })
+
+
+@dashboard_cached()
 async def get_pending_work_summary(limit: int = 10) -> Dict[str, Any]:
     """
     Get summary of all pending work items (orders, returns, exchanges).
 
+    Each entity is one `$facet` aggregation returning its list and count, and
+    the three entities run concurrently.
+
     Args:
         limit: Maximum number of items to return per category.
 
     Returns:
         Dict with pending orders, returns, exchanges lists and counts.
     """
-    # Get pending order status IDs
-    pending_order_statuses = []
-    async for s in db["order_status"].find(
-        {"status": {"$regex": "pending|processing|confirmed|shipped", "$options": "i"}},
-        {"_id": 1, "status": 1}
-    ):
-        pending_order_statuses.append(s)
-    
-    pending_order_status_ids = [s["_id"] for s in pending_order_statuses]
-    status_map = {str(s["_id"]): s["status"] for s in pending_order_statuses}
-
-    # Get pending orders
-    pending_orders = []
-    pending_orders_count = 0
-    if pending_order_status_ids:
-        pending_orders_count = await db["orders"].count_documents({
-            "status_id": {"$in": pending_order_status_ids}
-        })
-        
-        cursor = db["orders"].find(
-            {"status_id": {"$in": pending_order_status_ids}}
-        ).sort("createdAt", -1).limit(limit)
-        
-        async for doc in cursor:
-            pending_orders.append({
-                "order_id": str(doc["_id"]),
-                "user_id": str(doc.get("user_id", "")),
-                "total": float(doc.get("total", 0.0)),
-                "status": status_map.get(str(doc.get("status_id", "")), None),
-                "delivery_date": doc.get("delivery_date").isoformat() if doc.get("delivery_date") else None,
-                "created_at": doc.get("createdAt")
-            })
-
-    # Get pending return status IDs
-    pending_return_statuses = []
-    async for s in db["return_status"].find(
-        {"status": {"$regex": "pending|requested|processing", "$options": "i"}},
-        {"_id": 1, "status": 1}
-    ):
-        pending_return_statuses.append(s)
-    
-    pending_return_status_ids = [s["_id"] for s in pending_return_statuses]
-    return_status_map = {str(s["_id"]): s["status"] for s in pending_return_statuses}
-
-    # Get pending returns
-    pending_returns = []
-    pending_returns_count = 0
-    if pending_return_status_ids:
-        pending_returns_count = await db["returns"].count_documents({
-            "return_status_id": {"$in": pending_return_status_ids}
-        })
-        
-        cursor = db["returns"].find(
-            {"return_status_id": {"$in": pending_return_status_ids}}
-        ).sort("createdAt", -1).limit(limit)
-        
-        async for doc in cursor:
-            pending_returns.append({
-                "return_id": str(doc["_id"]),
-                "order_id": str(doc.get("order_id", "")),
-                "user_id": str(doc.get("user_id", "")),
-                "product_id": str(doc.get("product_id", "")),
-                "reason": doc.get("reason"),
-                "return_status": return_status_map.get(str(doc.get("return_status_id", "")), None),
-                "created_at": doc.get("createdAt")
-            })
-
-    # Get pending exchange status IDs
-    pending_exchange_statuses = []
-    async for s in db["exchange_status"].find(
-        {"status": {"$regex": "pending|requested|processing", "$options": "i"}},
-        {"_id": 1, "status": 1}
-    ):
-        pending_exchange_statuses.append(s)
-    
-    pending_exchange_status_ids = [s["_id"] for s in pending_exchange_statuses]
-    exchange_status_map = {str(s["_id"]): s["status"] for s in pending_exchange_statuses}
-
-    # Get pending exchanges
-    pending_exchanges = []
-    pending_exchanges_count = 0
-    if pending_exchange_status_ids:
-        pending_exchanges_count = await db["exchanges"].count_documents({
-            "exchange_status_id": {"$in": pending_exchange_status_ids}
-        })
-        
-        cursor = db["exchanges"].find(
-            {"exchange_status_id": {"$in": pending_exchange_status_ids}}
-        ).sort("createdAt", -1).limit(limit)
-        
-        async for doc in cursor:
-            pending_exchanges.append({
-                "exchange_id": str(doc["_id"]),
-                "order_id": str(doc.get("order_id", "")),
-                "user_id": str(doc.get("user_id", "")),
-                "product_id": str(doc.get("product_id", "")),
-                "reason": doc.get("reason"),
-                "exchange_status": exchange_status_map.get(str(doc.get("exchange_status_id", "")), None),
-                "created_at": doc.get("createdAt")
-            })
+    (order_ids, _), (return_ids, _), (exchange_ids, _) = await asyncio.gather(
+        get_status_ids("order_status", _PENDING_ORDER_STATUSES),
+        get_status_ids("return_status", _PENDING_REQUEST_STATUSES),
+        get_status_ids("exchange_status", _PENDING_REQUEST_STATUSES),
+    )
+
+    (
+        (pending_orders, pending_orders_count),
+        (pending_returns, pending_returns_count),
+        (pending_exchanges, pending_exchanges_count),
+    ) = await asyncio.gather(
+        _pending_orders(order_ids, limit),
+        _pending_requests("returns", "return_status_id", "return_status", "return_id", "return_status",
+                          return_ids, limit),
+        _pending_requests("exchanges", "exchange_status_id", "exchange_status", "exchange_id", "exchange_status",
+                          exchange_ids, limit),
+    )
 
     return {
         "pending_orders": pending_orders,
@@ -629,26 +620,33 @@ async def get_recent_orders(limit: int = 10) -> Dict[str, Any]:
     Returns:
         Dict with orders list and total count.
     """
-    total_count = await db["orders"].count_documents({})
-    
-    # Get all order statuses for mapping
-    status_map = {}
-    async for s in db["order_status"].find({}, {"_id": 1, "status": 1}):
-        status_map[str(s["_id"])] = s["status"]
-
-    orders = []
-    cursor = db["orders"].find({}).sort("createdAt", -1).limit(limit)
-    
-    async for doc in cursor:
-        orders.append({
-            "order_id": str(doc["_id"]),
-            "user_id": str(doc.get("user_id", "")),
-            "total": float(doc.get("total", 0.0)),
-            "status": status_map.get(str(doc.get("status_id", "")), None),
-            "payment_method": doc.get("payment_method"),
-            "delivery_date": doc.get("delivery_date").isoformat() if doc.get("delivery_date") else None,
-            "created_at": doc.get("createdAt")
-        })
+    pipeline = [
+        {"$sort": {"createdAt": -1}},
+        {"$limit": limit},
+        {"$lookup": {
+            "from": "order_status",
+            "localField": "status_id",
+            "foreignField": "_id",
+            "pipeline": [{"$project": {"_id": 0, "status": 1}}],
+            "as": "s",
+        }},
+        {"$project": {
+            "_id": 0,
+            "order_id": {"$toString": "$_id"},
+            "user_id": _oid_str("user_id"),
+            "total": {"$toDouble": {"$ifNull": ["$total", 0]}},
+            "status": {"$first": "$s.status"},
+            "payment_method": 1,
+            "delivery_date": 1,
+            "created_at": "$createdAt",
+        }},
+    ]
+    orders, total_count = await asyncio.gather(
+        db["orders"].aggregate(pipeline).to_list(limit),
+        db["orders"].estimated_document_count(),
+    )
+    for o in orders:
+        o["delivery_date"] = o["delivery_date"].isoformat() if o.get("delivery_date") else None
 
     return {
         "orders": orders,
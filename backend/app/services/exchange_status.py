@@ -15,7 +15,9 @@ from app.schemas.exchange_status import (
     ExchangeStatusUpdate,
     ExchangeStatusOut,
 )
+from app.schemas._partial import has_updates
 from app.crud import exchange_status as crud
+from app.services import _status_cache
 
 
 def _raise_conflict_if_dup(err: Exception, field_hint: Optional[str] = None):
@@ -53,7 +55,9 @@ async def create_item_service(payload: ExchangeStatusCreate) -> ExchangeStatusOu
         HTTPException: 409 on duplicate, 500 otherwise
     """
     try:
-        return await crud.create(payload)
+        created = await crud.create(payload)
+        _status_cache.clear("exchange_status")
+        return created
     except HTTPException:
         raise
     except Exception as e:
@@ -134,12 +138,13 @@ async def update_item_service(item_id: PyObjectId, payload: ExchangeStatusUpdate
         409 duplicate
     """
     try:
-        if not any(v is not None for v in payload.model_dump().values()):
+        if not has_updates(payload):
             raise HTTPException(status_code=400, detail="No fields provided for update")
 
         updated = await crud.update_one(item_id, payload)
         if not updated:
             raise HTTPException(status_code=404, detail="Exchange status not found or not updated")
+        _status_cache.clear("exchange_status")
         return updated
     except HTTPException:
         raise
@@ -176,6 +181,7 @@ async def delete_item_service(item_id: PyObjectId):
             raise HTTPException(status_code=404, detail="Exchange status not found")
         if ok is False:
             raise HTTPException(status_code=400, detail="Exchange status is being used")
+        _status_cache.clear("exchange_status")
         return JSONResponse(status_code=200, content={"deleted": True})
     except HTTPException:
         raise
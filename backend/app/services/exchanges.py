@@ -5,7 +5,8 @@ Service layer for Exchanges.
 """
 
 from __future__ import annotations
-from typing import List, Optional, Dict, Any
+import asyncio
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone, timedelta, date
 
 from bson import ObjectId
@@ -17,6 +18,8 @@ from app.core.database import db
 from app.schemas.object_id import PyObjectId
 from app.schemas.exchanges import ExchangesCreate, ExchangesUpdate, ExchangesOut
 from app.crud import exchanges as crud
+from app.services._dashboard_cache import invalidate_dashboard_cache
+from app.services._status_cache import get_status_ids
 from app.utils.gridfs import upload_image, replace_image, delete_image, _extract_file_id_from_url
 
 
@@ -40,6 +43,11 @@ def _to_oid(v: Any, field: str) -> ObjectId:
         raise HTTPException(status_code=400, detail=f"Invalid {field}")
 
 
+# Only the fields the exchange flows read
+_ORDER_ITEM_FIELDS = {"order_id": 1, "product_id": 1, "size": 1, "quantity": 1}
+_ORDER_FIELDS = {"user_id": 1, "delivery_date": 1}
+
+
 async def _get_order_item(order_item_id: PyObjectId) -> dict:
     """
     Load the order_item document or raise 404.
@@ -53,19 +61,22 @@ async def _get_order_item(order_item_id: PyObjectId) -> dict:
     Raises:
         HTTPException 404 if not found.
     """
-    oi = await db["order_items"].find_one({"_id": _to_oid(order_item_id, "order_item_id")})
+    oi = await db["order_items"].find_one({"_id": _to_oid(order_item_id, "order_item_id")}, _ORDER_ITEM_FIELDS)
     if not oi:
         raise HTTPException(status_code=404, detail="Order item not found")
     return oi
 
 
-async def _assert_order_belongs_to_user(order_id: ObjectId, user_id: ObjectId) -> dict:
+async def _assert_order_belongs_to_user(
+    order_id: ObjectId, user_id: ObjectId, projection: Optional[Dict[str, int]] = None
+) -> dict:
     """
     Ensure the order belongs to the given user.
 
     Args:
         order_id: Order ObjectId.
         user_id: User ObjectId.
+        projection: Fields to load (defaults to the ones exchanges use).
 
     Returns:
         dict: order document.
@@ -73,29 +84,76 @@ async def _assert_order_belongs_to_user(order_id: ObjectId, user_id: ObjectId) -
     Raises:
         HTTPException 404 if not found for user.
     """
-    doc = await db["orders"].find_one({"_id": order_id, "user_id": user_id})
+    doc = await db["orders"].find_one({"_id": order_id, "user_id": user_id}, projection or _ORDER_FIELDS)
     if not doc:
         raise HTTPException(status_code=404, detail="Order not found for user")
     return doc
 
 
-async def _get_exchange_status_id_by_label(label: str) -> ObjectId:
+# exchange_status is a tiny, read-mostly lookup table
+_STATUS_TTL_SECONDS = 300.0
+
+
+async def _exchange_status_names() -> Dict[str, str]:
+    """{str(_id): label} for every exchange_status, from the in-process cache."""
+    _, names = await get_status_ids("exchange_status", ttl=_STATUS_TTL_SECONDS)
+    return names
+
+
+async def _get_exchange_status_id_by_label(label: str) -> Optional[ObjectId]:
     """
-    Resolve an exchange_status by its label (e.g., 'requested').
+    Resolve an exchange_status id by its label (e.g., 'approved') from the
+    in-process cache, falling back to one direct read on a miss (a status
+    added since the cache filled, possibly by another worker).
 
     Args:
         label: Status label.
 
     Returns:
-        ObjectId: The status id.
+        ObjectId or None if no such status is configured.
+    """
+    names = await _exchange_status_names()
+    sid = next((ObjectId(sid) for sid, name in names.items() if name == label), None)
+    if sid is None:
+        doc = await db["exchange_status"].find_one({"status": label}, {"_id": 1})
+        sid = doc["_id"] if doc else None
+    return sid
+
+
+async def _load_exchange_context(
+    order_item_id: PyObjectId, user_id: ObjectId
+) -> Tuple[dict, Optional[dict]]:
+    """
+    Load an order_item and its parent order (only if owned by `user_id`) in
+    one aggregation round trip.
+
+    Args:
+        order_item_id: Order item id.
+        user_id: Owner's ObjectId.
+
+    Returns:
+        (order_item, order or None)
 
     Raises:
-        HTTPException 500 if not configured/present.
+        HTTPException 404 if the order item does not exist.
     """
-    doc = await db["exchange_status"].find_one({"status": label})
-    if not doc:
-        raise HTTPException(status_code=500, detail=f"Exchange status '{label}' not found")
-    return doc["_id"]
+    rows = await db["order_items"].aggregate([
+        {"$match": {"_id": _to_oid(order_item_id, "order_item_id")}},
+        {"$limit": 1},
+        {"$project": _ORDER_ITEM_FIELDS},
+        {"$lookup": {
+            "from": "orders",
+            "localField": "order_id",
+            "foreignField": "_id",
+            "pipeline": [{"$match": {"user_id": user_id}}, {"$project": _ORDER_FIELDS}],
+            "as": "_order",
+        }},
+    ]).to_list(1)
+    if not rows:
+        raise HTTPException(status_code=404, detail="Order item not found")
+    oi = rows[0]
+    order_doc = oi.pop("_order")
+    return oi, order_doc[0] if order_doc else None
 
 
 def _ensure_within_7_days(delivery_date: date) -> None:
@@ -275,13 +333,18 @@ async def create_exchange_service(
     # Prepare user ObjectId
     user_oid = _to_oid(current_user["user_id"], "user_id")
 
-    # 1) Load order_item → derive order_id + product_id
-    oi = await _get_order_item(order_item_id)
+    # 1) Load order_item + its order (ownership-filtered) in one round trip,
+    #    alongside the cached "approved" status (default per business rule)
+    (oi, order_doc), requested_status_id = await asyncio.gather(
+        _load_exchange_context(order_item_id, user_oid),
+        _get_exchange_status_id_by_label("approved"),
+    )
     order_id = oi["order_id"]
     product_id = oi["product_id"]
 
     # 2) Ensure ownership
-    order_doc = await _assert_order_belongs_to_user(order_id, user_oid)
+    if not order_doc:
+        raise HTTPException(status_code=404, detail="Order not found for user")
 
     # ✅ 3) Read delivery_date from order document
     delivery_date = order_doc.get("delivery_date")
@@ -311,8 +374,9 @@ async def create_exchange_service(
     # ✅ 4) Enforce 7-day rule
     _ensure_within_7_days(delivery_date)
 
-    # 5) Resolve exchange_status = "approved" (default status per business rule)
-    requested_status_id = await _get_exchange_status_id_by_label("approved")
+    # 5) Exchange status must be configured
+    if requested_status_id is None:
+        raise HTTPException(status_code=500, detail="Exchange status 'approved' not found")
 
     # 6) Handle image
     final_url: Optional[str] = None
@@ -343,7 +407,9 @@ async def create_exchange_service(
             {"$set": {"item_status": "exchange_requested"}, "$currentDate": {"updatedAt": True}}
         )
         
-        return await crud.create(payload)
+        created = await crud.create(payload)
+        await invalidate_dashboard_cache()
+        return created
     except HTTPException:
         raise
     except Exception as e:
@@ -484,20 +550,23 @@ async def admin_update_exchange_status_service(item_id: PyObjectId, payload: Exc
         if not exchange_doc:
             raise HTTPException(status_code=404, detail="Exchange not found")
         
+        # Status labels come from the in-process exchange_status cache; ids it
+        # doesn't know yet (added since it filled) are read in one $in query
+        new_status_oid = _to_oid(payload.exchange_status_id, "exchange_status_id")
+        current_status_oid = exchange_doc.get("exchange_status_id")
+        status_names = dict(await _exchange_status_names())
+        missing = [i for i in (new_status_oid, current_status_oid) if i is not None and str(i) not in status_names]
+        if missing:
+            async for d in db["exchange_status"].find({"_id": {"$in": missing}}, {"status": 1}):
+                status_names[str(d["_id"])] = d.get("status")
+
         # Get the new status label
-        new_status_doc = await db["exchange_status"].find_one(
-            {"_id": _to_oid(payload.exchange_status_id, "exchange_status_id")}
-        )
-        if not new_status_doc:
+        if str(new_status_oid) not in status_names:
             raise HTTPException(status_code=400, detail="Invalid exchange_status_id")
-        
-        new_status_label = new_status_doc.get("status", "").lower()
+        new_status_label = (status_names[str(new_status_oid)] or "").lower()
         
         # Get current status label to prevent double processing
-        current_status_doc = await db["exchange_status"].find_one(
-            {"_id": exchange_doc.get("exchange_status_id")}
-        )
-        current_status_label = current_status_doc.get("status", "").lower() if current_status_doc else ""
+        current_status_label = (status_names.get(str(current_status_oid)) or "").lower()
         
         # When status changes to 'completed', update the order_item with new size/quantity
         if new_status_label == "completed" and current_status_label != "completed":
@@ -529,6 +598,7 @@ async def admin_update_exchange_status_service(item_id: PyObjectId, payload: Exc
         updated = await crud.update_one(item_id, payload)
         if not updated:
             raise HTTPException(status_code=404, detail="Exchange not found or not updated")
+        await invalidate_dashboard_cache()
         return updated
     except HTTPException:
         raise
@@ -558,6 +628,7 @@ async def admin_delete_exchange_service(item_id: PyObjectId):
         ok = await crud.delete_one(item_id)
         if not ok:
             raise HTTPException(status_code=404, detail="Exchange not found")
+        await invalidate_dashboard_cache()
         return JSONResponse(status_code=200, content={"deleted": True})
     except HTTPException:
         raise
@@ -5,6 +5,8 @@ from fastapi.responses import StreamingResponse
 from app.utils.gridfs import _bucket
 from app.schemas.object_id import PyObjectId
 
+_READ_BUFFER_BYTES = 1 << 20
+
 
 async def file_download_service(file_id: PyObjectId):
     """
@@ -37,11 +39,15 @@ async def file_download_service(file_id: PyObjectId):
     media_type = grid_out.metadata.get("contentType") if grid_out.metadata else "application/octet-stream"
 
     async def iterfile():
-        """Chunked file reader to avoid loading entire file in memory."""
+        """Read in fixed 1 MiB buffers (several GridFS chunks per await) to avoid loading the file in memory."""
         while True:
-            chunk = await grid_out.readchunk()
-            if not chunk:
+            buf = await grid_out.read(_READ_BUFFER_BYTES)
+            if not buf:
                 break
-            yield chunk
+            yield buf
 
-    return StreamingResponse(iterfile(), media_type=media_type)
\ No newline at end of file
+    return StreamingResponse(
+        iterfile(),
+        media_type=media_type,
+        headers={"Content-Length": str(grid_out.length)},
+    )
\ No newline at end of file
@@ -11,6 +11,7 @@ from fastapi.responses import JSONResponse
 
 from app.schemas.object_id import PyObjectId
 from app.schemas.how_it_works import HowItWorksCreate, HowItWorksUpdate, HowItWorksOut
+from app.schemas._partial import has_updates
 from app.crud import how_it_works as crud
 from app.utils.gridfs import upload_image, replace_image, delete_image, _extract_file_id_from_url
 
@@ -135,7 +136,7 @@ async def update_item_service(
         if title is not None:
             patch.title = title
 
-        if not any(v is not None for v in patch.model_dump().values()):
+        if not has_updates(patch):
             raise HTTPException(status_code=400, detail="No fields provided for update")
 
         updated = await crud.update_one(item_id, patch)
@@ -12,6 +12,7 @@ from fastapi.responses import JSONResponse
 
 from app.schemas.object_id import PyObjectId
 from app.schemas.occasions import OccasionsCreate, OccasionsUpdate, OccasionsOut
+from app.schemas._partial import has_updates
 from app.crud import occasions as crud
 from app.utils.gridfs import delete_image, _extract_file_id_from_url
 
@@ -129,7 +130,7 @@ async def update_item_service(item_id: PyObjectId, payload: OccasionsUpdate) ->
         409 on duplicate.
     """
     try:
-        if not any(v is not None for v in payload.model_dump().values()):
+        if not has_updates(payload):
             raise HTTPException(status_code=400, detail="No fields provided for update")
         updated = await crud.update_one(item_id, payload)
         if not updated:
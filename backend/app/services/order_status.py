@@ -11,7 +11,9 @@ from fastapi.responses import JSONResponse
 
 from app.schemas.object_id import PyObjectId
 from app.schemas.order_status import OrderStatusCreate, OrderStatusUpdate, OrderStatusOut
+from app.schemas._partial import has_updates
 from app.crud import order_status as crud
+from app.services import _status_cache
 
 
 async def create_item_service(payload: OrderStatusCreate) -> OrderStatusOut:
@@ -28,7 +30,9 @@ async def create_item_service(payload: OrderStatusCreate) -> OrderStatusOut:
         409 on duplicate (E11000).
     """
     try:
-        return await crud.create(payload)
+        created = await crud.create(payload)
+        _status_cache.clear("order_status")
+        return created
     except Exception as e:
         msg = str(e)
         if "E11000" in msg:
@@ -96,11 +100,12 @@ async def update_item_service(item_id: PyObjectId, payload: OrderStatusUpdate) -
         409 on duplicate (E11000).
     """
     try:
-        if not any(v is not None for v in payload.model_dump().values()):
+        if not has_updates(payload):
             raise HTTPException(status_code=400, detail="No fields provided for update")
         updated = await crud.update_one(item_id, payload)
         if not updated:
             raise HTTPException(status_code=404, detail="Order status not found or not updated")
+        _status_cache.clear("order_status")
         return updated
     except HTTPException:
         raise
@@ -138,6 +143,7 @@ async def delete_item_service(item_id: PyObjectId):
                 detail="Cannot delete this order status because one or more orders are using it.",
             )
 
+        _status_cache.clear("order_status")
         return JSONResponse(status_code=200, content={"deleted": True})
     except HTTPException:
         raise
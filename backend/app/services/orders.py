@@ -19,8 +19,9 @@ from fastapi.responses import JSONResponse
 from app.core.database import db
 from app.utils.mongo import stamp_create, stamp_update
 from app.schemas.object_id import PyObjectId
-from app.schemas.orders import OrdersCreate, OrdersUpdate, OrdersOut
+from app.schemas.orders import OrdersCreate, OrdersUpdate, OrdersOut, parse_many as parse_orders
 from app.crud import orders as orders_crud
+from app.services._dashboard_cache import invalidate_dashboard_cache
 from app.services.razorpay import create_razorpay_order, verify_razorpay_signature
 from app.services.order_emails import (
     send_order_confirmation_email,
@@ -349,6 +350,7 @@ async def confirm_order_service(
             # Log but don't fail the order
             print(f"Failed to send order confirmation email: {email_err}")
         
+        await invalidate_dashboard_cache()
         # Return saved order with status name
         return await _get_order_with_status(order_id)
     
@@ -492,6 +494,7 @@ async def place_order_cod_service(
         except Exception as email_err:
             print(f"Failed to send order confirmation email: {email_err}")
         
+        await invalidate_dashboard_cache()
         # Return saved order with status name
         return await _get_order_with_status(order_id)
     
@@ -596,6 +599,7 @@ async def update_my_order_status_service(
                 detail="Order cannot be cancelled at its current status",
             )
         
+        await invalidate_dashboard_cache()
         return await _get_order_with_status(updated_doc["_id"])
     
     except HTTPException:
@@ -693,12 +697,7 @@ async def admin_list_orders_service(
             {"$project": {"_status_doc": 0}}
         ]
         docs = await db["orders"].aggregate(pipeline).to_list(length=None)
-        
-        for d in docs:
-            if isinstance(d.get("delivery_date"), datetime):
-                d["delivery_date"] = d["delivery_date"].date()
-        
-        return [OrdersOut.model_validate(d) for d in docs]
+        return parse_orders(docs)
     
     except HTTPException:
         raise
@@ -796,6 +795,7 @@ async def admin_update_order_service(order_id: PyObjectId, payload: OrdersUpdate
         except Exception as email_err:
             print(f"Failed to send order update email: {email_err}")
         
+        await invalidate_dashboard_cache()
         return await _get_order_with_status(updated_doc["_id"])
     
     except HTTPException:
@@ -812,6 +812,7 @@ async def admin_delete_order_service(order_id: PyObjectId):
             raise HTTPException(status_code=404, detail="Order not found")
         if result.get("status") != "deleted":
             raise HTTPException(status_code=500, detail="Failed to delete order")
+        await invalidate_dashboard_cache()
         return JSONResponse(status_code=200, content=result)
     except HTTPException:
         raise
@@ -15,6 +15,7 @@ from app.schemas.product_images import (
     ProductImagesUpdate,
     ProductImagesOut,
 )
+from app.schemas._partial import has_updates
 from app.crud import product_images as crud
 from app.utils.gridfs import upload_image, replace_image, delete_image, _extract_file_id_from_url
 
@@ -127,7 +128,7 @@ async def update_item_service(
             patch.image_url = new_url  # type: ignore[attr-defined]
 
         # Ensure something to update
-        if not any(v is not None for v in patch.model_dump().values()):
+        if not has_updates(patch):
             raise HTTPException(status_code=400, detail="No fields provided for update")
 
         updated = await crud.update_one(item_id, patch)
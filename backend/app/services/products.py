@@ -19,6 +19,7 @@ from fastapi.responses import JSONResponse
 
 from app.schemas.object_id import PyObjectId
 from app.schemas.products import ProductsCreate, ProductsUpdate, ProductsOut, CtProductsOut
+from app.schemas._partial import has_updates
 from app.crud import products as crud
 from app.utils.gridfs import (
     upload_image, replace_image, delete_image, _extract_file_id_from_url
@@ -312,7 +313,7 @@ async def update_item_service(
             if out_of_stock and quantity is None:
                 patch.quantity = 0
 
-        if not any(v is not None for v in patch.model_dump().values()):
+        if not has_updates(patch):
             raise HTTPException(status_code=400, detail="No fields provided for update")
 
         updated = await crud.update_one(item_id, patch)
@@ -15,7 +15,9 @@ from app.schemas.return_status import (
     ReturnStatusUpdate,
     ReturnStatusOut,
 )
+from app.schemas._partial import has_updates
 from app.crud import return_status as crud
+from app.services import _status_cache
 
 
 def _raise_conflict_if_dup(err: Exception, field_hint: Optional[str] = None):
@@ -30,7 +32,9 @@ def _raise_conflict_if_dup(err: Exception, field_hint: Optional[str] = None):
 async def create_return_status(payload: ReturnStatusCreate) -> ReturnStatusOut:
     """Create a new return status."""
     try:
-        return await crud.create(payload)
+        created = await crud.create(payload)
+        _status_cache.clear("return_status")
+        return created
     except HTTPException:
         raise
     except Exception as e:
@@ -71,12 +75,13 @@ async def get_return_status(item_id: PyObjectId) -> ReturnStatusOut:
 async def update_return_status(item_id: PyObjectId, payload: ReturnStatusUpdate) -> ReturnStatusOut:
     """Update fields in a return status."""
     try:
-        if not any(v is not None for v in payload.model_dump().values()):
+        if not has_updates(payload):
             raise HTTPException(status_code=400, detail="No fields provided for update")
 
         updated = await crud.update_one(item_id, payload)
         if not updated:
             raise HTTPException(status_code=404, detail="Return status not found or not updated")
+        _status_cache.clear("return_status")
         return updated
     except HTTPException:
         raise
@@ -99,6 +104,7 @@ async def delete_return_status(item_id: PyObjectId) -> bool:
                 status_code=400,
                 detail="Cannot delete: return status is used by existing returns.",
             )
+        _status_cache.clear("return_status")
         return True
     except HTTPException:
         raise
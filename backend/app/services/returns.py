@@ -16,6 +16,7 @@ from app.core.database import db
 from app.schemas.object_id import PyObjectId
 from app.schemas.returns import ReturnsCreate, ReturnsUpdate, ReturnsOut
 from app.crud import returns as crud
+from app.services._dashboard_cache import invalidate_dashboard_cache
 from app.utils.gridfs import upload_image
 
 
@@ -400,6 +401,7 @@ async def create_return_service(
             {"$set": {"item_status": "return_requested"}, "$currentDate": {"updatedAt": True}}
         )
         
+        await invalidate_dashboard_cache()
         return result
     except HTTPException:
         raise
@@ -542,6 +544,7 @@ async def admin_update_return_status_service(return_id: PyObjectId, payload: Ret
         updated = await crud.update_one(return_id, payload)
         if not updated:
             raise HTTPException(status_code=404, detail="Return not found or not updated")
+        await invalidate_dashboard_cache()
         return updated
     except HTTPException:
         raise
@@ -560,6 +563,7 @@ async def admin_delete_return_service(return_id: PyObjectId):
         ok = await crud.delete_one(return_id)
         if not ok:
             raise HTTPException(status_code=404, detail="Return not found")
+        await invalidate_dashboard_cache()
         return JSONResponse(status_code=200, content={"deleted": True})
     except HTTPException:
         raise
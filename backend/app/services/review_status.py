@@ -14,6 +14,7 @@ from app.schemas.review_status import (
     ReviewStatusUpdate,
     ReviewStatusOut,
 )
+from app.schemas._partial import has_updates
 from app.crud import review_status as crud
 
 
@@ -80,7 +81,7 @@ async def update_review_status(item_id: PyObjectId, payload: ReviewStatusUpdate)
     Update fields in a review status. Requires at least one field in payload.
     """
     try:
-        if not any(v is not None for v in payload.model_dump().values()):
+        if not has_updates(payload):
             raise HTTPException(status_code=400, detail="No fields provided for update")
 
         updated = await crud.update_one(item_id, payload)
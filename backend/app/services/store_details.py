@@ -14,6 +14,7 @@ from typing import List, Optional, Dict, Any
 
 from app.schemas.object_id import PyObjectId
 from app.schemas.store_details import StoreDetailsCreate, StoreDetailsUpdate, StoreDetailsOut
+from app.schemas._partial import has_updates
 from app.crud import store_details as crud
 
 
@@ -63,7 +64,7 @@ async def get_store_details(item_id: PyObjectId) -> StoreDetailsOut:
 async def update_store_details(item_id: PyObjectId, payload: StoreDetailsUpdate) -> StoreDetailsOut:
     """Service: update store details."""
     try:
-        if not any(v is not None for v in payload.model_dump().values()):
+        if not has_updates(payload):
             raise HTTPException(status_code=400, detail="No fields provided for update")
 
         updated = await crud.update_one(item_id, payload)
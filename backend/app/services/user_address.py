@@ -6,6 +6,7 @@ from fastapi import HTTPException, status
 
 from app.schemas.object_id import PyObjectId
 from app.schemas.user_address import UserAddressEntry,UserAddressCreate, UserAddressUpdate, UserAddressOut
+from app.schemas._partial import has_updates
 from app.crud import user_address as crud
 
 
@@ -61,7 +62,7 @@ async def get_user_address(item_id: PyObjectId, current_user: Dict) -> UserAddre
 
 async def update_user_address(item_id: PyObjectId, payload: UserAddressUpdate, current_user: Dict) -> UserAddressOut:
     try:
-        if not any(v is not None for v in payload.model_dump().values()):
+        if not has_updates(payload):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields provided for update")
 
         item = await crud.get_one(item_id)
@@ -5,6 +5,7 @@ from fastapi import HTTPException, status
 
 from app.schemas.object_id import PyObjectId
 from app.schemas.user_ratings import UserRatingsCreate, UserRatingsUpdate, UserRatingsOut
+from app.schemas._partial import has_updates
 from app.crud import user_ratings as crud
 
 
@@ -72,7 +73,7 @@ async def get_my_rating_for_product_service(product_id: PyObjectId, current_user
 # Update + recalc
 async def update_user_rating(item_id: PyObjectId, payload: UserRatingsUpdate, current_user: Dict) -> UserRatingsOut:
     try:
-        if not any(v is not None for v in payload.model_dump().values()):
+        if not has_updates(payload):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields provided for update")
 
         existing = await crud.get_one(item_id)
@@ -5,6 +5,7 @@ from fastapi import HTTPException, UploadFile, status
 
 from app.schemas.object_id import PyObjectId
 from app.schemas.user_reviews import UserReviewsCreate, UserReviewsUpdate, UserReviewsOut
+from app.schemas._partial import has_updates
 from app.crud import user_reviews as crud
 from app.utils.gridfs import upload_image, replace_image, delete_image, _extract_file_id_from_url
 
@@ -121,7 +122,7 @@ async def update_user_review(
         if review is not None:
             patch.review = review
 
-        if not any(v is not None for v in patch.model_dump().values()):
+        if not has_updates(patch):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields provided for update")
 
         updated = await crud.update_one(item_id, patch)
@@ -5,6 +5,7 @@ from fastapi import HTTPException, status
 
 from app.schemas.object_id import PyObjectId
 from app.schemas.user_roles import UserRolesCreate, UserRolesUpdate, UserRolesOut
+from app.schemas._partial import has_updates
 from app.crud import user_roles as crud
 
 
@@ -53,7 +54,7 @@ async def get_user_role(item_id: PyObjectId) -> UserRolesOut:
 
 async def update_user_role(item_id: PyObjectId, payload: UserRolesUpdate) -> UserRolesOut:
     try:
-        if not any(v is not None for v in payload.model_dump().values()):
+        if not has_updates(payload):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields provided for update")
         updated = await crud.update_one(item_id, payload)
         if not updated:
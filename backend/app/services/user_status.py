@@ -5,6 +5,7 @@ from fastapi import HTTPException, status
 
 from app.schemas.object_id import PyObjectId
 from app.schemas.user_status import UserStatusCreate, UserStatusUpdate, UserStatusOut
+from app.schemas._partial import has_updates
 from app.crud import user_status as crud
 
 
@@ -56,7 +57,7 @@ async def get_user_status(item_id: PyObjectId) -> UserStatusOut:
 
 async def update_user_status(item_id: PyObjectId, payload: UserStatusUpdate) -> UserStatusOut:
     try:
-        if not any(v is not None for v in payload.model_dump().values()):
+        if not has_updates(payload):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields provided for update")
         updated = await crud.update_one(item_id, payload)
         if not updated:
@@ -7,6 +7,7 @@ from app.api.deps import get_current_user
 from app.schemas.object_id import PyObjectId
 from app.schemas.requests import RegisterIn
 from app.schemas.users import UserCreate, UserUpdate, UserOut
+from app.schemas._partial import has_updates
 from app.utils.gridfs import replace_image, delete_image, _extract_file_id_from_url
 from app.core.database import db
 from app.crud import users as crud
@@ -88,7 +89,7 @@ async def update_profile_service(
         if phone_no is not None:
             patch.phone_no = phone_no
 
-        if not any(v is not None for v in patch.model_dump().values()):
+        if not has_updates(patch):
             raise HTTPException(status_code=400, detail="No fields provided for update")
 
         updated = await crud.update_one(current_user["user_id"], patch)
@@ -11,6 +11,14 @@ from app.schemas.wishlist_items import WishlistItemsCreate, WishlistItemsOut
 from app.crud import wishlist_items as crud
 
 
+def _user_oid(current_user: Dict, key: str, detail: str) -> ObjectId:
+    # *_oid keys are parsed once by get_current_user; compare ObjectIds directly
+    oid = current_user.get(key)
+    if oid is None:
+        raise HTTPException(status_code=400, detail=detail)
+    return oid
+
+
 def _coerce_oid(v: Any, field: str) -> ObjectId:
     try:
         return ObjectId(str(v))
@@ -19,11 +27,7 @@ def _coerce_oid(v: Any, field: str) -> ObjectId:
 
 
 async def create_wishlist_item(product_id: PyObjectId, current_user: Dict) -> WishlistItemsOut:
-    wishlist_id = None
-    try:
-        wishlist_id = PyObjectId(current_user["wishlist_id"])
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid or missing wishlist_id for current user")
+    wishlist_id = _user_oid(current_user, "wishlist_oid", "Invalid or missing wishlist_id for current user")
 
     payload = WishlistItemsCreate(product_id=product_id, wishlist_id=wishlist_id)
     try:
@@ -42,10 +46,7 @@ async def list_wishlist_items(
     product_id: Optional[PyObjectId],
     current_user: Dict,
 ) -> List[WishlistItemsOut]:
-    try:
-        wishlist_id = PyObjectId(current_user["wishlist_id"])
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid or missing wishlist_id for current user")
+    wishlist_id = _user_oid(current_user, "wishlist_oid", "Invalid or missing wishlist_id for current user")
 
     q: Dict[str, Any] = {"wishlist_id": wishlist_id}
     if product_id is not None:
@@ -63,7 +64,7 @@ async def get_wishlist_item(item_id: PyObjectId, current_user: Dict) -> Wishlist
         if not item:
             raise HTTPException(status_code=404, detail="Wishlist item not found")
 
-        if str(item.wishlist_id) != str(current_user.get("wishlist_id")):
+        if item.wishlist_id != current_user.get("wishlist_oid"):
             raise HTTPException(status_code=403, detail="Forbidden")
 
         return item
@@ -83,17 +84,15 @@ async def move_wishlist_item_to_cart(
         raise HTTPException(status_code=400, detail="Size must be provided")
 
     # Validate/coerce ids from current user
-    try:
-        cart_id = PyObjectId(current_user["cart_id"])
-        wishlist_id = PyObjectId(current_user["wishlist_id"])
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid or missing cart_id/wishlist_id for current user")
+    detail = "Invalid or missing cart_id/wishlist_id for current user"
+    cart_id = _user_oid(current_user, "cart_oid", detail)
+    wishlist_id = _user_oid(current_user, "wishlist_oid", detail)
 
     # Snapshot for API return
     snapshot = await db["wishlist_items"].find_one({"_id": item_id})
     if not snapshot:
         raise HTTPException(status_code=404, detail="Wishlist item not found")
-    if str(snapshot.get("wishlist_id")) != str(wishlist_id):
+    if snapshot.get("wishlist_id") != wishlist_id:
         raise HTTPException(status_code=403, detail="Forbidden")
 
     product_id = _coerce_oid(snapshot["product_id"], "product_id")
@@ -141,7 +140,7 @@ async def delete_wishlist_item(item_id: PyObjectId, current_user: Dict) -> bool:
         if not item:
             raise HTTPException(status_code=404, detail="Wishlist item not found")
 
-        if str(item.wishlist_id) != str(current_user.get("wishlist_id")):
+        if item.wishlist_id != current_user.get("wishlist_oid"):
             raise HTTPException(status_code=403, detail="Forbidden")
 
         ok = await crud.delete_one(item_id)
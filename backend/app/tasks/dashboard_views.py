@@ -0,0 +1,25 @@
+import asyncio
+import logging
+
+from app.core.database import db
+from app.services.dashboard import materialized_views
+
+_LOG = logging.getLogger("app.tasks.dashboard_views")
+
+
+async def refresh_view(source: str, view: str, pipeline: list) -> None:
+    """Rebuild one dashboard view; $out swaps the new collection in atomically."""
+    await db[source].aggregate([*pipeline, {"$out": view}]).to_list(None)
+
+
+async def refresh_dashboard_views_job():
+    """APScheduler job: rebuild every materialized dashboard aggregate."""
+    views = materialized_views()
+    results = await asyncio.gather(
+        *(refresh_view(source, view, pipeline) for source, view, pipeline in views),
+        return_exceptions=True,
+    )
+    for (_, view, _), res in zip(views, results):
+        if isinstance(res, Exception):
+            _LOG.error("Failed to refresh dashboard view %s: %s", view, res)
+    _LOG.debug("Dashboard views refreshed")
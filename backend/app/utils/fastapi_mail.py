@@ -25,62 +25,63 @@ async def _send_mail(subject: str, recipients: list[str], body: str):
       traceback.print_exc()
       raise e
 
-def generate_otp_email_html(otp: int) -> str:
-    """Generate a styled HTML email for OTP."""
-    html = f"""
+
+# Rendered with %-formatting so the markup (and its CSS braces) is built once at import;
+# each send only splices in the code and the year.
+_OTP_EMAIL_HTML = """
     <!DOCTYPE html>
     <html>
       <head>
         <meta charset="UTF-8" />
         <title>Password Reset OTP</title>
         <style>
-          body {{
+          body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background-color: #f4f6f8;
             margin: 0;
             padding: 0;
-          }}
-          .container {{
+          }
+          .container {
             max-width: 480px;
             margin: 40px auto;
             background-color: #ffffff;
             border-radius: 12px;
             box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
             overflow: hidden;
-          }}
-          .header {{
+          }
+          .header {
             background-color: #007bff;
             color: white;
             text-align: center;
             padding: 16px;
             font-size: 20px;
             font-weight: bold;
-          }}
-          .content {{
+          }
+          .content {
             padding: 24px;
             color: #333333;
             line-height: 1.6;
-          }}
-          .otp {{
+          }
+          .otp {
             font-size: 28px;
             font-weight: bold;
             color: #007bff;
             text-align: center;
             margin: 24px 0;
             letter-spacing: 4px;
-          }}
-          .note {{
+          }
+          .note {
             font-size: 14px;
             color: #666666;
             text-align: center;
-          }}
-          .footer {{
+          }
+          .footer {
             background-color: #f0f2f5;
             text-align: center;
             padding: 12px;
             font-size: 12px;
             color: #888888;
-          }}
+          }
         </style>
       </head>
       <body>
@@ -94,7 +95,7 @@ def generate_otp_email_html(otp: int) -> str:
               We received a request to reset your password. Please use the following
               One-Time Password (OTP) to proceed:
             </p>
-            <div class="otp">{otp:06d}</div>
+            <div class="otp">%(otp)06d</div>
             <p class="note">
               ⚠️ This OTP is valid for <b>5 minutes</b>.<br />
               Do not share it with anyone for your account’s safety.
@@ -102,10 +103,14 @@ def generate_otp_email_html(otp: int) -> str:
             <p>If you didn’t request this, you can safely ignore this email.</p>
           </div>
           <div class="footer">
-            &copy; {datetime.now().year} True Style. All rights reserved.
+            &copy; %(year)d True Style. All rights reserved.
           </div>
         </div>
       </body>
     </html>
     """
-    return html
\ No newline at end of file
+
+
+def generate_otp_email_html(otp: int) -> str:
+    """Generate a styled HTML email for OTP."""
+    return _OTP_EMAIL_HTML % {"otp": otp, "year": datetime.now().year}
@@ -1,13 +1,32 @@
 from __future__ import annotations
-from typing import Tuple, Optional
+import asyncio
+import logging
+import re
+from functools import lru_cache
+from typing import Iterable, Set, Tuple, Optional
 from bson import ObjectId
-from fastapi import UploadFile, HTTPException
+from fastapi import BackgroundTasks, UploadFile, HTTPException
 from motor.motor_asyncio import AsyncIOMotorGridFSBucket
-from urllib.parse import urlparse
 
 from app.core.database import db
 from app.core.config import settings
 
+# New files are stored in 1 MiB chunks (GridIn inserts one document per chunk,
+# so bigger chunks mean fewer inserts per upload). Reads use the same size so each
+# one fills exactly one chunk and memory stays bounded at ~1 MiB per upload.
+# Files written earlier with the 255 KiB default stay readable: chunk size is per file.
+_UPLOAD_CHUNK = 1 << 20
+
+_bucket_instance: Optional[AsyncIOMotorGridFSBucket] = None
+
+_LOG = logging.getLogger("app.utils.gridfs")
+
+# First path segment after "/files/" (stops at a query string or fragment)
+_FILE_ID_RE = re.compile(r"/files/([^/?#;]+)")
+
+# Strong references to in-flight background deletes (the loop only keeps weak ones)
+_pending_deletes: Set[asyncio.Task] = set()
+
 
 def build_file_url(file_id: ObjectId | str) -> str:
     """Build a public, downloadable URL for a stored GridFS file."""
@@ -15,21 +34,23 @@ def build_file_url(file_id: ObjectId | str) -> str:
     return f"{settings.BACKEND_BASE_URL.rstrip('/')}{settings.API_V1_PREFIX}/files/{fid}"
 
 
-def _bucket():
-    """Create a GridFS bucket instance."""
-    return AsyncIOMotorGridFSBucket(db, bucket_name=settings.GRIDFS_BUCKET)
+def _bucket() -> AsyncIOMotorGridFSBucket:
+    """Return the shared GridFS bucket, creating it on first use."""
+    global _bucket_instance
+    if _bucket_instance is None:
+        _bucket_instance = AsyncIOMotorGridFSBucket(
+            db, bucket_name=settings.GRIDFS_BUCKET, chunk_size_bytes=_UPLOAD_CHUNK
+        )
+    return _bucket_instance
 
 
+@lru_cache(maxsize=4096)
 def _extract_file_id_from_url(url: Optional[str]) -> Optional[str]:
-    """Extract a GridFS file_id from a download URL."""
-    if not url:
-        return None
-    parsed = urlparse(url)
-    path = parsed.path or ""
-    parts = path.split("/files/", 1)
-    if len(parts) != 2 or not parts[1]:
-        return None
-    return parts[1].split("/")[0]
+    """Extract a GridFS file_id from a download URL (memoized; URLs repeat across cascades)."""
+    if not url or "/files/" not in url:
+        return None  # not one of our download URLs; skip the regex
+    m = _FILE_ID_RE.search(url)
+    return m.group(1) if m else None
 
 
 async def _validate_upload(file: UploadFile) -> None:
@@ -51,6 +72,10 @@ async def upload_image(file: UploadFile) -> Tuple[str, str]:
     max_bytes = settings.UPLOAD_MAX_BYTES
     written = 0
 
+    # Reject declared-oversize bodies before any chunk reaches Mongo
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(status_code=413, detail="Uploaded file too large")
+
     try:
         grid_in = bucket.open_upload_stream(
             filename=filename,
@@ -58,7 +83,7 @@ async def upload_image(file: UploadFile) -> Tuple[str, str]:
         )
         try:
             while True:
-                chunk = await file.read(1024 * 64)
+                chunk = await file.read(_UPLOAD_CHUNK)
                 if not chunk:
                     break
                 written += len(chunk)
@@ -92,6 +117,56 @@ async def delete_image(file_id: str) -> bool:
         return False
 
 
+async def bulk_delete_images(file_ids: Iterable[ObjectId | str]) -> int:
+    """
+    Delete many GridFS files with two concurrent commands (files and chunks)
+    instead of one bucket.delete() pair per file. Invalid ids are skipped.
+    Returns the number of file documents removed.
+    """
+    oids = []
+    for fid in file_ids:
+        try:
+            oids.append(ObjectId(fid))
+        except Exception:
+            continue
+    if not oids:
+        return 0
+
+    bucket = settings.GRIDFS_BUCKET
+    res, _ = await asyncio.gather(
+        db[f"{bucket}.files"].delete_many({"_id": {"$in": oids}}),
+        db[f"{bucket}.chunks"].delete_many({"files_id": {"$in": oids}}),
+    )
+    return res.deleted_count
+
+
+async def _delete_image_logged(file_id: str) -> None:
+    try:
+        ok = await delete_image(file_id)
+    except Exception:
+        _LOG.exception("Background GridFS delete failed; orphaned file_id=%s", file_id)
+        return
+    if not ok:
+        _LOG.warning("Background GridFS delete failed; orphaned file_id=%s", file_id)
+
+
+def delete_image_later(file_id: Optional[str], background: Optional[BackgroundTasks] = None) -> None:
+    """
+    Schedule a GridFS delete without waiting for it; failures are logged for reconciliation.
+
+    With `background`, the delete runs as a request background task, which a
+    graceful shutdown waits for; otherwise it is a bare asyncio task.
+    """
+    if not file_id:
+        return
+    if background is not None:
+        background.add_task(_delete_image_logged, file_id)
+        return
+    task = asyncio.create_task(_delete_image_logged(file_id))
+    _pending_deletes.add(task)
+    task.add_done_callback(_pending_deletes.discard)
+
+
 async def replace_image(old_file_id: Optional[str], new_file: UploadFile) -> Tuple[str, str]:
     """Replace an existing GridFS file with a new upload."""
     new_id, new_url = await upload_image(new_file)
@@ -1,4 +1,10 @@
 from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Sequence, Tuple, Type, TypeVar
+
+from bson import ObjectId
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
 
 def stamp_create(doc: dict) -> dict:
     now = datetime.now(timezone.utc)
@@ -9,4 +15,50 @@ def stamp_create(doc: dict) -> dict:
 def stamp_update(doc: dict) -> dict:
     now = datetime.now(timezone.utc)
     doc["updatedAt"] = now
-    return doc 
\ No newline at end of file
+    return doc
+
+def from_mongo(cls: Type[M], doc: dict) -> M:
+    """
+    Build an *Out model from a trusted MongoDB document without re-validating it.
+
+    model_construct bypasses validators; this is safe for reads because Mongo is the
+    source of truth and every document was validated on its way in. Client payloads
+    must still go through model_validate.
+    """
+    d = doc.copy()
+    if "_id" in d:
+        d["id"] = d.pop("_id")
+    return cls.model_construct(**d)
+
+
+class InvalidCursor(ValueError):
+    """Raised when a keyset-pagination cursor doesn't name an existing document."""
+
+
+async def after_filter(
+    coll, after: str, sort: Sequence[Tuple[str, int]], query: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Keyset-pagination filter matching documents strictly after the one whose
+    _id is `after`, in `sort` order. `sort` must end with an `_id` key so the
+    order is total. Costs one indexed point read for the anchor instead of
+    walking and discarding `skip` documents.
+
+    The anchor must also match the caller's base `query`, so an id outside
+    the caller's scope is rejected exactly like an unknown one.
+    """
+    try:
+        oid = ObjectId(after)
+    except Exception:
+        raise InvalidCursor("Invalid cursor")
+    anchor_q = {"$and": [query, {"_id": oid}]} if query else {"_id": oid}
+    anchor = await coll.find_one(anchor_q, {k: 1 for k, _ in sort})
+    if anchor is None:
+        raise InvalidCursor("Invalid cursor")
+
+    clauses = []
+    for i, (field, direction) in enumerate(sort):
+        clause = {f: anchor.get(f) for f, _ in sort[:i]}
+        clause[field] = {"$gt" if direction == 1 else "$lt": anchor.get(field)}
+        clauses.append(clause)
+    return {"$or": clauses}
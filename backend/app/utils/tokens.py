@@ -1,7 +1,14 @@
 import hashlib
+import hmac
 from app.core.config import settings
 
 def hash_refresh(raw_token: str) -> str:
     """Hash a refresh token using SHA-256 before storing it in the database."""
     data = (raw_token + settings.TOKEN_HASH_PEPPER).encode("utf-8")
-    return hashlib.sha256(data).hexdigest()
\ No newline at end of file
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_otp(email: str, otp: str) -> str:
+    """HMAC an OTP (bound to its email) so Redis never holds the plaintext code."""
+    msg = f"{email}:{otp}".encode("utf-8")
+    return hmac.new(settings.TOKEN_HASH_PEPPER.encode("utf-8"), msg, hashlib.sha256).hexdigest()
@@ -1,18 +1,21 @@
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from app.middleware.logging import RequestLoggingMiddleware
 from app.middleware.error_handler import ErrorHandlerMiddleware
 from app.core.config import settings
 from app.core.database import Base, engine, close_engine, close_mongo_connection
 from app.core.redis import clear_permissions_cache, close_redis
+from app.core.http import close_http_clients
 from app import main as api_main  
 from templates import swagger
 import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from app.tasks import cleanup
+from app.tasks import cleanup, dashboard_views
+from app.services.contact_us import contact_batcher
 from app.core.config import settings
 
 logger = logging.getLogger("app.validation")
@@ -33,7 +36,17 @@ async def lifespan(app: FastAPI):
         replace_existing=True,
         max_instances=1
     )
+    scheduler.add_job(
+        dashboard_views.refresh_dashboard_views_job,
+        'interval',
+        minutes=settings.DASHBOARD_REFRESH_MINUTES,
+        id='refresh_dashboard_views',
+        replace_existing=True,
+        max_instances=1,
+        next_run_time=datetime.now(timezone.utc),  # build the views at startup
+    )
     scheduler.start()
+    contact_batcher.start()
     logging.getLogger("app").info(
         "Started cleanup scheduler (interval=%s minutes)",
         settings.CLEANUP_INTERVAL_MINUTES
@@ -42,8 +55,10 @@ async def lifespan(app: FastAPI):
     yield
 
     scheduler.shutdown(wait=True)
+    await contact_batcher.stop()
     await close_mongo_connection()
     await close_redis()
+    await close_http_clients()
     await close_engine()
 
 
@@ -52,6 +67,8 @@ app = FastAPI(
     swagger_ui_oauth2_redirect_url="/docs/oauth2-redirect",
     docs_url=None,
     lifespan=lifespan,
+    # orjson (pinned in requirements.txt) encodes response bodies straight to bytes
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -71,7 +71,8 @@ USER_DELETE_COLLECTIONS = {
 UNIQUE_FIELDS: Dict[str, List[str]] = {
     "user_roles": ["role"],
     "permissions": ["resource_name"],
-    "sessions": ["refresh_hash"],
+    "sessions": ["refresh_hash", "jti"],
+    "token_revocations": ["jti"],
     "user_status": ["status"],
     "order_status": ["status"],
     "return_status": ["status"],
@@ -117,6 +118,7 @@ COMPOUND_UNIQUES = {
     "role_permissions": [("role_id", 1), ("permission_id", 1)],
     "wishlists": [("user_id", 1)],
     "carts": [("user_id", 1)],
+    "users": [("phone_no", 1), ("country_code", 1)],
     "hero_images": [("category", 1), ("idx", 1)],
     "hero_images_mobile": [("category", 1), ("idx", 1)],
     "wishlist_items": [("wishlist_id", 1), ("product_id", 1)],
@@ -129,6 +131,43 @@ COMPOUND_UNIQUES = {
     "upi_details": [("payment_id", 1)],
 }
 
+# Non-unique compound indexes backing the hot list filters + their sort
+COMPOUND_INDEXES: Dict[str, List[List[tuple]]] = {
+    "cart_items": [
+        [("cart_id", 1), ("createdAt", -1), ("_id", -1)],
+    ],
+    "backup_logs": [
+        [("createdAt", -1), ("_id", -1)],
+        [("status", 1), ("scope", 1), ("frequency", 1), ("createdAt", -1), ("_id", -1)],
+    ],
+    # dashboard: status $in counts run as COUNT_SCANs, pending lists sort on createdAt
+    "orders": [
+        [("status_id", 1), ("createdAt", -1)],
+        # covers the daily sales view rebuild
+        [("createdAt", 1), ("total", 1)],
+    ],
+    "returns": [
+        [("return_status_id", 1), ("createdAt", -1)],
+    ],
+    "exchanges": [
+        [("exchange_status_id", 1), ("createdAt", -1)],
+    ],
+    # dashboard user growth view rebuild scans createdAt only
+    "users": [
+        [("createdAt", 1)],
+    ],
+    # dashboard low_stock: range on quantity, sorted by quantity
+    "products": [
+        [("quantity", 1)],
+    ],
+}
+
+# Date field per collection; MongoDB's TTL monitor deletes docs once that time passes
+TTL_INDEXES: Dict[str, str] = {
+    "sessions": "exp",
+    "token_revocations": "expiresAt",
+}
+
 def perm_id_for(collection: str) -> str:
     return f"perm:{collection}"
 
@@ -155,6 +194,13 @@ async def ensure_indexes(db):
     for coll, spec in COMPOUND_UNIQUES.items():
         await safe_create_index(db[coll], spec, name="uniq_compound_" + "_".join([k for k, _ in spec]), unique=True)
 
+    for coll, specs in COMPOUND_INDEXES.items():
+        for spec in specs:
+            await safe_create_index(db[coll], spec, name="idx_compound_" + "_".join([k for k, _ in spec]))
+
+    for coll, field in TTL_INDEXES.items():
+        await safe_create_index(db[coll], [(field, 1)], name=f"ttl_{field}", expireAfterSeconds=0)
+
 async def upsert_role(db, role_name: str, *, session) -> ObjectId:
     existing = await db["user_roles"].find_one({"role": role_name}, session=session)
     if existing:
@@ -257,6 +303,39 @@ async def seed_lookup_collections(db, *, session):
                 session=session,
             )
 
+# Status collection -> (referencing collection, referencing field)
+STATUS_COLLECTIONS: Dict[str, tuple] = {
+    "order_status": ("orders", "status_id"),
+    "return_status": ("returns", "return_status_id"),
+    "exchange_status": ("exchanges", "exchange_status_id"),
+}
+
+async def normalize_status_names(db, *, session):
+    """
+    Lower-case status names so lookups can use an exact $in on the unique index.
+    Names that only differ by case are merged first (references repointed to
+    the kept status) so the rename cannot trip the unique index.
+    """
+    for coll, (ref_coll, ref_field) in STATUS_COLLECTIONS.items():
+        groups = await db[coll].aggregate([
+            {"$group": {"_id": {"$toLower": "$status"}, "docs": {"$push": {"_id": "$_id", "status": "$status"}}}},
+            {"$match": {"docs.1": {"$exists": True}}},
+        ], session=session).to_list(None)
+        for g in groups:
+            # Prefer the already lower-case row, else the first one
+            keep = next((d for d in g["docs"] if d["status"] == g["_id"]), g["docs"][0])
+            dupes = [d["_id"] for d in g["docs"] if d["_id"] != keep["_id"]]
+            await db[ref_coll].update_many(
+                {ref_field: {"$in": dupes}}, {"$set": {ref_field: keep["_id"]}}, session=session
+            )
+            await db[coll].delete_many({"_id": {"$in": dupes}}, session=session)
+
+        await db[coll].update_many(
+            {"status": {"$regex": "[A-Z]"}},
+            [{"$set": {"status": {"$toLower": "$status"}}}],
+            session=session,
+        )
+
 async def seed_initial_users(db, *, session):
     now = datetime.now(timezone.utc)
 
@@ -325,6 +404,7 @@ async def main():
                     read_preference=ReadPreference.PRIMARY,
                 ):
                     await seed_lookup_collections(db, session=session)
+                    await normalize_status_names(db, session=session)
                     await seed_rbac(db, session=session)
                     await seed_initial_users(db, session=session)
             except Exception as txn_err: